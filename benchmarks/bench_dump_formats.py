@@ -0,0 +1,76 @@
+"""
+Benchmark: dump.cs vs script.json parsing of the same (synthetic) build.
+
+    python -m benchmarks.bench_dump_formats --classes 20000
+
+Both files describe identical methods; the script reports entries, size,
+wall time and throughput for each backend of DumpParser.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from offset_updater.dump_parser import DumpParser
+
+
+def write_build(folder: str, classes: int, methods: int):
+    """Write dump.cs + script.json describing the same methods."""
+    cs_path = os.path.join(folder, "dump.cs")
+    json_path = os.path.join(folder, "script.json")
+
+    address = 0x100000
+    with open(cs_path, "w", encoding="utf-8") as cs, open(json_path, "w", encoding="utf-8") as js:
+        js.write('{\n"ScriptMethod": [\n')
+        first = True
+        for c in range(classes):
+            ns = f"Game.Mod{c % 50}"
+            cs.write(f"// Namespace: {ns}\n")
+            cs.write(f"public class Class{c} : MonoBehaviour // TypeDefIndex: {c}\n{{\n")
+            cs.write("\t// Fields\n\tpublic int hp; // 0x18\n\n\t// Methods\n\n")
+            for m in range(methods):
+                cs.write(f"\t// RVA: 0x{address:X} Offset: 0x{address:X} VA: 0x{address:X}\n")
+                cs.write(f"\tpublic int Method{m}(int a, float b) {{ }}\n\n")
+
+                item = {
+                    "Address": address,
+                    "Name": f"{ns}.Class{c}$$Method{m}",
+                    "Signature": f"int32_t Class{c}__Method{m} (Class{c}_o* __this, int32_t a, float b, const MethodInfo* method);",
+                    "TypeSignature": "iiif",
+                }
+                js.write(("" if first else ",\n") + json.dumps(item, indent=2))
+                first = False
+                address += 0x40
+            cs.write("}\n\n")
+        js.write('\n],\n"ScriptString": [],\n"Addresses": []\n}\n')
+
+    return cs_path, json_path
+
+
+def bench(path: str):
+    start = time.perf_counter()
+    result = DumpParser().parse(path)
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    return result.stats.format, len(result.entries), size_mb, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--classes", type=int, default=10000)
+    parser.add_argument("--methods", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        cs_path, json_path = write_build(folder, args.classes, args.methods)
+
+        print(f"{'file':<12} {'backend':<16} {'entries':>9} {'size MB':>9} {'seconds':>9} {'MB/s':>8}")
+        for label, path in (("dump.cs", cs_path), ("script.json", json_path)):
+            backend, entries, size_mb, elapsed = bench(path)
+            print(f"{label:<12} {backend:<16} {entries:>9} {size_mb:>9.1f} {elapsed:>9.2f} {size_mb / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: streaming the CLI's offset files for a very large analysis.
+
+    python -m benchmarks.bench_generators --entries 1000000
+
+Builds synthetic OffsetAnalyzer results with N outdated functions, then
+times CodeGenerator.write_cpp_definitions (offsets_updated.h) and
+write_json (offsets.json). A second, traced run reports the peak memory
+the writers allocate on top of the results (tracemalloc slows writing
+down several times, so it is not part of the timing).
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from offset_updater.generators import CodeGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--style", choices=("define", "constexpr"), default="define")
+    args = parser.parse_args()
+
+    analysis = {"outdated": [
+        {"func": f"Namespace::Class{i // 20}::Method{i}", "old_offset": f"{0x1000000 + i * 16:x}",
+         "new_offset": f"{0x2000000 + i * 16:x}"}
+        for i in range(args.entries)
+    ]}
+    generator = CodeGenerator()
+
+    writers = (
+        ("offsets_updated.h", lambda fp, changes: generator.write_cpp_definitions(fp, changes, args.style)),
+        ("offsets.json", generator.write_json),
+    )
+
+    with tempfile.TemporaryDirectory() as folder:
+        for name, write in writers:
+            path = os.path.join(folder, name)
+            start = time.perf_counter()
+            with open(path, "w", encoding="utf-8") as fp:
+                count = write(fp, generator.iter_changes(analysis))
+            seconds = time.perf_counter() - start
+
+            tracemalloc.start()
+            with open(path, "w", encoding="utf-8") as fp:
+                write(fp, generator.iter_changes(analysis))
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{name:<18}: {count} entries, {size_mb:.1f} MB in {seconds:.2f} s, "
+                  f"peak {peak_mb:.1f} MB allocated while writing")
+
+if __name__ == "__main__":
+    main()
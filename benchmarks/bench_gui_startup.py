@@ -0,0 +1,124 @@
+"""
+Benchmark: GUI cold start.
+
+    python -m benchmarks.bench_gui_startup --runs 5
+
+Two measurements, each in a fresh interpreter:
+  1. `python -X importtime -c "import gui.gui_main"` — total import time
+     and the slowest modules, to spot eager heavy imports (the AI
+     services, the analyzer engines) creeping back into the startup path.
+  2. Process launch → first paint of MainWindow (offscreen Qt platform),
+     compared against the TARGET_MS budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+TARGET_MS = 300
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Child process: build the real window and print the wall clock at its
+# first paint event.
+PAINT_PROBE = r"""
+import sys, time
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QApplication
+from gui.core.state import AppState
+from gui.core.controller import AppController
+from gui.windows.main_window import MainWindow
+
+app = QApplication(sys.argv)
+window = MainWindow(AppController(AppState()))
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            print(time.time(), flush=True)
+            app.quit()
+        return False
+
+probe = FirstPaint()
+window.installEventFilter(probe)
+window.show()
+app.exec()
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_times(module: str):
+    """[(cumulative_us, self_us, name)] from -X importtime, slowest first."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=child_env(),
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    return sorted(rows, reverse=True)
+
+
+def time_to_first_paint() -> float:
+    """Milliseconds from spawning the interpreter to MainWindow's first paint."""
+    start = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-c", PAINT_PROBE],
+        capture_output=True, text=True, cwd=REPO_ROOT, env=child_env(), timeout=60,
+    )
+    if proc.returncode != 0 or not proc.stdout.strip():
+        raise RuntimeError((proc.stderr.strip().splitlines() or ["no paint event"])[-1])
+    return (float(proc.stdout.split()[0]) - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    print("== import gui.gui_main (-X importtime) ==")
+    try:
+        rows = import_times("gui.gui_main")
+    except RuntimeError as e:
+        print(f"  import failed: {e}")
+        return 1
+    total_us = next(c for c, _, name in rows if name.strip() == "gui.gui_main")
+    print(f"  total: {total_us / 1000:.1f} ms")
+    print(f"  {'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative, self_us, name in rows[:args.top]:
+        print(f"  {cumulative / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+    print("\n== launch → first paint ==")
+    samples = []
+    for _ in range(args.runs):
+        try:
+            samples.append(time_to_first_paint())
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"  probe failed: {e}")
+            return 1
+    samples.sort()
+    best, median = samples[0], samples[len(samples) // 2]
+    verdict = "OK" if median <= TARGET_MS else "OVER BUDGET"
+    print(f"  best {best:.0f} ms, median {median:.0f} ms over {len(samples)} runs "
+          f"(target {TARGET_MS} ms: {verdict})")
+    return 0 if median <= TARGET_MS else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Benchmark: reopening a session from a snapshot vs re-parsing the dump.
+
+    python -m benchmarks.bench_snapshot --classes 20000
+
+Parses a synthetic dump.cs, writes a session snapshot of it, then reports
+parse time, snapshot size / save time and snapshot load time (fingerprint
+check + JSON decode + DumpIndex.from_data) for the same data. The parsed
+dump is released before reloading, as on a fresh start of the GUI.
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from offset_updater.dump_parser import DumpParser
+from offset_updater.snapshot import load_snapshot, save_snapshot
+from benchmarks.bench_dump_formats import write_build
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--classes", type=int, default=10000)
+    parser.add_argument("--methods", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        cs_path, _ = write_build(folder, args.classes, args.methods)
+        snap_path = os.path.join(folder, "session.snapshot")
+
+        start = time.perf_counter()
+        parsed = DumpParser().parse(cs_path)
+        parse_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        save_snapshot(snap_path, {"parsed_dump": parsed}, {"dump_path": cs_path})
+        save_s = time.perf_counter() - start
+
+        count = len(parsed.entries)
+        del parsed
+        gc.collect()
+
+        loaded = load_snapshot(snap_path)
+        assert len(loaded["sections"]["parsed_dump"].entries) == count
+
+        dump_mb = os.path.getsize(cs_path) / (1024 * 1024)
+        snap_mb = os.path.getsize(snap_path) / (1024 * 1024)
+        print(f"entries          : {count}")
+        print(f"dump.cs          : {dump_mb:.1f} MB, parse {parse_s:.2f} s")
+        print(f"snapshot         : {snap_mb:.1f} MB, save {save_s:.2f} s")
+        print(f"snapshot reload  : {loaded['load_seconds']:.2f} s "
+              f"({parse_s / loaded['load_seconds']:.1f}x faster than parsing)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: rendering HOOK/LOGD snippets from compiled templates.
+
+    python -m benchmarks.bench_templates --snippets 100000
+
+Renders N HOOK and N LOGD lines per preset with SnippetRenderer
+(templates compiled once) and streams them to a temp file, next to the
+same lines built with a per-call str.format_map of the raw template.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from offset_updater.templates import PRESETS, SnippetRenderer, normalize_offset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--snippets", type=int, default=100_000)
+    args = parser.parse_args()
+
+    entries = [{"func": f"Class{i // 20}::get_Value{i}", "offset": f"{0x2000000 + i * 16:x}",
+                "orig": f"orig_get_Value{i}" if i % 2 else ""}
+               for i in range(args.snippets)]
+
+    with tempfile.TemporaryDirectory() as folder:
+        for name, style in PRESETS.items():
+            start = time.perf_counter()
+            renderer = SnippetRenderer(name)
+            path = os.path.join(folder, f"{name}.txt")
+            with open(path, "w", encoding="utf-8") as fp:
+                count = renderer.write_hooks(fp, entries) + renderer.write_logd(fp, entries)
+            compiled = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(path, "w", encoding="utf-8") as fp:
+                for entry in entries:
+                    values = {"func": entry["func"], "orig": entry["orig"] or f"orig_{entry['func']}",
+                              "lib": style.lib, "hex": normalize_offset(entry["offset"]),
+                              "offset": normalize_offset(entry["offset"])}
+                    fp.write(style.hook.format_map(values) + "\n")
+                for entry in entries:
+                    fp.write(style.logd.format_map({"func": entry["func"],
+                                                    "hex": normalize_offset(entry["offset"])}) + "\n")
+            naive = time.perf_counter() - start
+
+            print(f"{name:<8}: {count} snippets in {compiled * 1000:.0f} ms "
+                  f"({count / compiled:,.0f}/s), format_map per line {naive * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,55 @@
 import argparse
-import json
 import os
+import sys
 from offset_updater.dump_parser import DumpParser
 from offset_updater.source_scanner import SourceScanner
 from offset_updater.offset_analyzer import OffsetAnalyzer
 from offset_updater.generators import CodeGenerator
 from offset_updater.reporter import Reporter
+from offset_updater.class_diff import ClassHasher
 
 
 def load_existing_offsets(source_files):
     """
     Extract existing offsets from source code.
 
-    This version assumes offsets appear in the format:
+    Reads offset tables in the formats handled by the "defines" dump backend:
         #define FunctionName 0x123456
+        constexpr uintptr_t FunctionName = 0x123456;
     """
     offsets = {}
+    dump_parser = DumpParser()
 
     for file in source_files:
         try:
-            with open(file, "r", errors="ignore") as f:
-                for line in f:
-                    line = line.strip()
-
-                    if line.startswith("#define"):
-                        parts = line.split()
-                        if len(parts) == 3:
-                            name = parts[1]
-                            value = parts[2]
-                            offsets[name] = value
-        except Exception:
-            pass
+            table = dump_parser.parse(file, format="defines")
+        except OSError:
+            continue
+        for name, entry in table.items():
+            offsets[name] = entry.offset
 
     return offsets
 
 
-def save_generated_files(generator, changes, output_dir):
-    """Save all generated outputs into target directory."""
+def print_progress(event):
+    """ProgressEvent callback: one self-overwriting status line on stderr."""
+    sys.stderr.write(f"\r   {event}\x1b[K")
+    sys.stderr.flush()
+
+
+def save_generated_files(generator, analysis, output_dir, style="define"):
+    """Stream all generated outputs into target directory; returns the entry count."""
     os.makedirs(output_dir, exist_ok=True)
 
     # write updated C++ defines
-    cpp_output = generator.generate_cpp_definitions(changes)
-    with open(os.path.join(output_dir, "offsets_updated.h"), "w") as fp:
-        fp.write(cpp_output)
+    with open(os.path.join(output_dir, "offsets_updated.h"), "w", encoding="utf-8") as fp:
+        count = generator.write_cpp_definitions(fp, generator.iter_changes(analysis), style)
 
     # write JSON file
-    json_output = generator.generate_json(changes)
-    with open(os.path.join(output_dir, "offsets.json"), "w") as fp:
-        json.dump(json_output, fp, indent=4)
+    with open(os.path.join(output_dir, "offsets.json"), "w", encoding="utf-8") as fp:
+        generator.write_json(fp, generator.iter_changes(analysis))
 
-    return True
+    return count
 
 
 def main():
@@ -65,32 +65,68 @@ def main():
 
     parser.add_argument(
         "--src",
-        required=True,
         help="Path to the project source folder that contains existing offsets."
     )
 
+    parser.add_argument(
+        "--changes-since",
+        metavar="OLD_DUMP",
+        help="Only list classes that changed between OLD_DUMP and --dump, then exit."
+    )
+
     parser.add_argument(
         "--out",
         default="output",
         help="Folder where updated offset files will be written."
     )
 
+    parser.add_argument(
+        "--style",
+        choices=("define", "constexpr"),
+        default="define",
+        help="offsets_updated.h layout: #define NAME 0x... or constexpr uintptr_t NAME = 0x...;"
+    )
+
     args = parser.parse_args()
 
+    if args.changes_since:
+        print("🧬 Hashing classes...")
+        class_changes = ClassHasher().diff_files(args.changes_since, args.dump)
+        print(Reporter().build_class_change_report(class_changes))
+        return
+
+    if not args.src:
+        parser.error("--src is required unless --changes-since is used")
+
     print("🔍 Parsing dump...")
-    dump_parser = DumpParser(args.dump)
-    parsed_dump = dump_parser.parse()
+    dump_parser = DumpParser()
+    # format sniffed by offset_updater.formats
+    parsed_dump = dump_parser.parse(args.dump, progress=print_progress if sys.stderr.isatty() else None)
+    if sys.stderr.isatty():
+        sys.stderr.write("\n")
+    print(f"   {parsed_dump.stats}")
 
     print("📡 Scanning source directory...")
     scanner = SourceScanner(args.src)
-    source_files = scanner.scan_files()
+    scanned = scanner.scan()
+    source_files = [raw["file"] for raw in scanned["RAW"]]
+    for err in scanned["ERRORS"]:
+        print(f"   ⚠️ skipped {err['file']}: {err['error']}")
 
     print("📄 Reading existing offsets...")
     existing_offsets = load_existing_offsets(source_files)
 
     print("🧠 Analyzing offset differences...")
-    analyzer = OffsetAnalyzer(parsed_dump)
-    changes = analyzer.analyze(existing_offsets)
+    # offset-table entries are checked against the dump like HOOK calls
+    source_data = dict(scanned)
+    source_data["HOOKS"] = scanned["HOOKS"] + [
+        {"func": name, "offset": offset} for name, offset in existing_offsets.items()
+    ]
+    analyzer = OffsetAnalyzer(parsed_dump, source_data)
+    analysis = analyzer.analyze()
+
+    generator = CodeGenerator()
+    changes = dict(generator.iter_changes(analysis))
 
     reporter = Reporter()
     summary_text = reporter.summary(changes)
@@ -104,8 +140,7 @@ def main():
         return
 
     print("⚙️ Generating updated output files...")
-    generator = CodeGenerator()
-    save_generated_files(generator, changes, args.out)
+    save_generated_files(generator, analysis, args.out, args.style)
 
     print(f"✅ Offset update complete! Files saved to: {args.out}")
 
@@ -17,5 +17,12 @@ The main entry point to launch the GUI is `gui_main.py`.
 __version__ = "1.0.0"
 __author__ = "Certified Somebody"
 
-# Optional: expose GUI launcher for easy imports
-from .gui_main import launch_gui
+__all__ = ["launch_gui"]
+
+
+def __getattr__(name):
+    # Expose the GUI launcher without importing PyQt6 on `import gui`
+    if name == "launch_gui":
+        from .gui_main import launch_gui
+        return launch_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
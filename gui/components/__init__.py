@@ -6,6 +6,8 @@ Includes:
 - file selectors
 - progress dialogs
 - results viewer with table
+- dump search (search-as-you-type)
+- chunked plain-text output viewer
 - themes and style helpers
 """
 
@@ -13,4 +15,6 @@ from .buttons import PrimaryButton, SecondaryButton
 from .file_selector import FileSelector
 from .progress_window import ProgressWindow
 from .results_viewer import ResultsViewer
+from .dump_search import DumpSearch
+from .output_viewer import OutputViewer
 from .theme import Theme
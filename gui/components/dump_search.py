@@ -0,0 +1,125 @@
+from PyQt6.QtCore import Qt, QObject, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTableView, QHeaderView
+
+from offset_updater.search_index import NameIndex, SearchWorker
+from .theme import Theme
+
+
+class _ResultBridge(QObject):
+    """Carries worker-thread results onto the GUI thread (queued signal)."""
+
+    results = pyqtSignal(int, object)
+
+
+class DumpSearchModel(QAbstractTableModel):
+    """Read-only view over search hits; Qt only asks for the visible rows."""
+
+    HEADERS = ["Method", "Offset", "Class"]
+
+    def __init__(self):
+        super().__init__()
+        self._dump = {}
+        self._index = NameIndex(())
+        self._rows = ()
+
+    def set_rows(self, dump, index, rows):
+        self.beginResetModel()
+        self._dump, self._index, self._rows = dump, index, rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        name = self._index.names[self._rows[index.row()]]
+        if index.column() == 0:
+            return name
+        entry = self._dump.get(name)
+        if index.column() == 1:
+            return getattr(entry, "offset", entry)
+        return getattr(entry, "owner", "")
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class DumpSearch(QWidget):
+    """
+    Search-as-you-type over the loaded dump.
+
+    Keystrokes only restart a debounce timer; the query (and the first
+    NameIndex build for a new dump) runs on a SearchWorker thread, and
+    superseded queries are cancelled before their results reach the table.
+    """
+
+    DEBOUNCE_MS = 150
+
+    def __init__(self):
+        super().__init__()
+
+        title = QLabel("Dump Search")
+        title.setFont(Theme.FONT_BOLD)
+
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Type part of a method name...")
+        self.count_label = QLabel("No dump loaded")
+
+        self.model = DumpSearchModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+
+        search_row = QHBoxLayout()
+        search_row.addWidget(self.search_box)
+        search_row.addWidget(self.count_label)
+
+        layout = QVBoxLayout()
+        layout.addWidget(title)
+        layout.addLayout(search_row)
+        layout.addWidget(self.table)
+        self.setLayout(layout)
+
+        self._dump = {}
+        self._index = None
+        self._index_for = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._submit)
+        self.search_box.textChanged.connect(lambda _: self._timer.start(self.DEBOUNCE_MS))
+
+        self._bridge = _ResultBridge()
+        self._bridge.results.connect(self._show_results)
+        self._worker = SearchWorker(self._bridge.results.emit)
+
+    # -------------------------------------------------------------
+    def set_dump(self, dump):
+        """Search a newly loaded dump ({name: DumpEntry})."""
+        self._dump = dump or {}
+        self.count_label.setText("Indexing...")
+        self._submit()
+
+    def _submit(self):
+        self._worker.submit(self._query, self._dump, self.search_box.text())
+
+    def _query(self, dump, term, cancelled=None):
+        # runs on the worker thread, so the index is built off the GUI thread
+        if self._index_for is not dump:
+            self._index = NameIndex(dump)
+            self._index_for = dump
+        return self._index, self._index.search(term, cancelled=cancelled)
+
+    def _show_results(self, generation, result):
+        if not self._worker.is_current(generation):
+            return
+        index, rows = result
+        self.model.set_rows(self._dump, index, rows)
+        self.count_label.setText(f"{len(rows)} of {len(index)} methods")
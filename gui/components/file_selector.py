@@ -36,3 +36,6 @@ class FileSelector(QWidget):
 
     def get_path(self):
         return self.path_box.text()
+
+    def set_path(self, path):
+        self.path_box.setText(path or "")
@@ -0,0 +1,149 @@
+import time
+from typing import Callable, Iterable, Iterator
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QFileDialog, QMessageBox
+from .buttons import SecondaryButton
+
+
+def lines_to_text(lines: Iterable[str]) -> Iterator[str]:
+    """Adapt a line generator to text pieces for OutputViewer."""
+    for line in lines:
+        yield line + "\n"
+
+
+def text_pieces(text: str, size: int = 256 * 1024) -> Iterator[str]:
+    """Slice an already-built string into pieces for OutputViewer."""
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+
+
+class OutputViewer(QWidget):
+    """
+    Read-only plain-text output for multi-MB patches, reports and main.cpp.
+
+    Text comes from a source: a callable returning a fresh iterator of text
+    pieces. Pieces are appended in small batches from a zero-delay timer so
+    each slice of UI-thread work stays short, and "Save..." re-runs the
+    source straight into the file instead of copying the text out of the
+    widget.
+    """
+
+    BATCH_CHARS = 64 * 1024     # insert at most this much per batch
+    SLICE_MS = 8                # keep each timer slice under this budget
+
+    def __init__(self, default_filename: str = "output.txt", file_filter: str = "Text Files (*.txt)"):
+        super().__init__()
+
+        self.default_filename = default_filename
+        self.file_filter = file_filter
+        self._source = None
+        self._pending = None
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setUndoRedoEnabled(False)
+        self.text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+
+        self.status = QLabel("")
+        self.save_btn = SecondaryButton("Save...")
+        self.save_btn.clicked.connect(self.save_dialog)
+        self.save_btn.setEnabled(False)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._pump)
+
+        bar = QHBoxLayout()
+        bar.addWidget(self.status)
+        bar.addStretch()
+        bar.addWidget(self.save_btn)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.text)
+        layout.addLayout(bar)
+        self.setLayout(layout)
+
+    # -------------------------------------------------------------
+    def show_source(self, source: Callable[[], Iterable[str]]) -> None:
+        """Replace the content with the pieces of source(), rendered in chunks."""
+        self._timer.stop()
+        self.text.clear()
+        self._source = source
+        self._pending = iter(source())
+        self._chars = 0
+        self.save_btn.setEnabled(True)
+        self.status.setText("Rendering...")
+        self._timer.start(0)
+
+    def show_text(self, text: str) -> None:
+        self.show_source(lambda: text_pieces(text))
+
+    def append_text(self, text: str) -> None:
+        """Append streamed text as it arrives (no source: Save is enabled by show_*())."""
+        if self._pending is not None:
+            return
+        cursor = QTextCursor(self.text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        self._chars = getattr(self, "_chars", 0) + len(text)
+        self.status.setText(f"Receiving... {self._chars:,} characters")
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self._source = self._pending = None
+        self._chars = 0
+        self.text.clear()
+        self.status.setText("")
+        self.save_btn.setEnabled(False)
+
+    # -------------------------------------------------------------
+    def _pump(self):
+        if self._pending is None:
+            return
+
+        deadline = time.perf_counter() + self.SLICE_MS / 1000
+        batch = []
+        size = 0
+        done = False
+        while size < self.BATCH_CHARS and time.perf_counter() < deadline:
+            try:
+                piece = next(self._pending)
+            except StopIteration:
+                done = True
+                break
+            batch.append(piece)
+            size += len(piece)
+
+        if batch:
+            cursor = QTextCursor(self.text.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.insertText("".join(batch))
+            self._chars += size
+
+        if done:
+            self._pending = None
+            self.status.setText(f"{self._chars:,} characters")
+        else:
+            self.status.setText(f"Rendering... {self._chars:,} characters")
+            self._timer.start(0)
+
+    # -------------------------------------------------------------
+    def save_to(self, path: str) -> None:
+        """Write the source to `path` piece by piece."""
+        with open(path, "w", encoding="utf-8") as f:
+            for piece in self._source():
+                f.write(piece)
+
+    def save_dialog(self) -> None:
+        if self._source is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Output", self.default_filename, self.file_filter)
+        if not path:
+            return
+        try:
+            self.save_to(path)
+            QMessageBox.information(self, "Saved", f"Saved to {path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save:\n{e}")
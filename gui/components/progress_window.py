@@ -1,14 +1,23 @@
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QProgressBar
+from .buttons import SecondaryButton
 from .theme import Theme
 
 
 class ProgressWindow(QDialog):
-    """Simple modal progress dialog."""
+    """
+    Modal progress dialog.
 
-    def __init__(self, title="Processing...", parent=None):
+    Starts indeterminate; the first set_progress() switches it to 0–100.
+    With cancellable=True a Cancel button emits `cancel_requested`.
+    """
+
+    cancel_requested = pyqtSignal()
+
+    def __init__(self, title="Processing...", parent=None, cancellable=False):
         super().__init__(parent)
         self.setWindowTitle(title)
-        self.setFixedSize(300, 120)
+        self.setFixedSize(300, 150 if cancellable else 120)
 
         self.label = QLabel("Please wait...")
         self.label.setFont(Theme.FONT_BOLD)
@@ -19,6 +28,37 @@ class ProgressWindow(QDialog):
         layout = QVBoxLayout()
         layout.addWidget(self.label)
         layout.addWidget(self.progress)
+
+        if cancellable:
+            self.cancel_button = SecondaryButton("Cancel")
+            self.cancel_button.clicked.connect(self._on_cancel)
+            layout.addWidget(self.cancel_button)
+
         self.setLayout(layout)
 
         self.setModal(True)
+
+    def set_progress(self, percent: int):
+        if self.progress.maximum() == 0:
+            self.progress.setRange(0, 100)
+        self.progress.setValue(percent)
+
+    def finish(self):
+        """Close once the task is over (close() would count as Cancel)."""
+        self.accept()
+
+    def set_status(self, text: str):
+        self.label.setText(text)
+
+    def _on_cancel(self):
+        self.label.setText("Cancelling...")
+        self.cancel_button.setEnabled(False)
+        self.cancel_requested.emit()
+
+    def reject(self):
+        # Esc / window close behave like Cancel while a task is running
+        if hasattr(self, "cancel_button"):
+            if self.cancel_button.isEnabled():
+                self._on_cancel()
+            return
+        super().reject()
@@ -1,9 +1,144 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox, QTableView, QHeaderView
+)
 from .theme import Theme
 
 
+def _offset_int(value):
+    """0x-string / int offset → int (None when absent or unparsable)."""
+    if isinstance(value, int):
+        return value
+    if not value:
+        return None
+    try:
+        return int(str(value), 16)
+    except ValueError:
+        return None
+
+
+def _offset_text(value):
+    if isinstance(value, int):
+        return hex(value)
+    if value is None:
+        return "[N/A]"
+    return str(value)
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Flat rows over the OffsetAnalyzer result arrays:
+        (method, old, new, match, status, old_int, new_int)
+    The view only asks for visible cells; SORT_ROLE gives numeric offsets.
+    """
+
+    HEADERS = ["Method", "Old Offset", "New Offset", "Match", "Status"]
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+
+    def __init__(self):
+        super().__init__()
+        self._rows = []
+
+    def set_results(self, results: dict):
+        rows = []
+        seen = set()
+
+        # Outdated entries (have old and new offsets)
+        for item in results.get("outdated", []):
+            match = item.get("match", "")
+            if match == "slot":
+                match = f"slot {item.get('slot')} ({item.get('matched_name')})"
+            rows.append(self._row(item["func"], item.get("old_offset"), item.get("new_offset"), match, "outdated"))
+            seen.add(item["func"])
+
+        # Updated entries (no old offset)
+        for item in results.get("updated", []):
+            if item["func"] in seen:
+                continue
+            seen.add(item["func"])
+            rows.append(self._row(item["func"], None, item.get("offset"), item.get("match", ""), "updated"))
+
+        # Missing in dump (old offset is from source); older results use "missing"
+        for key in ("missing_in_dump", "missing"):
+            for item in results.get(key, []):
+                old = item.get("source_offset", item.get("old_offset"))
+                rows.append(self._row(item["func"], old, None, "", "missing"))
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    @staticmethod
+    def _row(method, old, new, match, status):
+        return (method, _offset_text(old), _offset_text(new), match, status,
+                _offset_int(old), _offset_int(new))
+
+    def row(self, i: int) -> tuple:
+        return self._rows[i]
+
+    # -------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[col]
+        if role == self.SORT_ROLE:
+            if col in (1, 2):
+                value = row[col + 4]
+                return -1 if value is None else value
+            return row[col].lower()
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class ResultsFilterProxy(QSortFilterProxyModel):
+    """Filters rows by status, method substring and offset range (old or new)."""
+
+    def __init__(self):
+        super().__init__()
+        self.status = ""
+        self.name = ""
+        self.min_offset = None
+        self.max_offset = None
+        self.setSortRole(ResultsTableModel.SORT_ROLE)
+
+    def set_filters(self, status="", name="", min_offset=None, max_offset=None):
+        self.status = status
+        self.name = name.lower()
+        self.min_offset = min_offset
+        self.max_offset = max_offset
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        method, _, _, _, status, old, new = self.sourceModel().row(source_row)
+        if self.status and status != self.status:
+            return False
+        if self.name and self.name not in method.lower():
+            return False
+        if self.min_offset is not None or self.max_offset is not None:
+            lo = self.min_offset if self.min_offset is not None else 0
+            hi = self.max_offset if self.max_offset is not None else float("inf")
+            if not any(v is not None and lo <= v <= hi for v in (old, new)):
+                return False
+        return True
+
+
 class ResultsViewer(QWidget):
-    """Displays analysis results in a table format."""
+    """Displays analysis results in a sortable, filterable table."""
+
+    STATUSES = ["All", "outdated", "updated", "missing"]
 
     def __init__(self):
         super().__init__()
@@ -11,14 +146,42 @@ class ResultsViewer(QWidget):
         title = QLabel("Analysis Results")
         title.setFont(Theme.FONT_BOLD)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(
-            ["Method", "Old Offset", "New Offset"]
-        )
+        self.model = ResultsTableModel()
+        self.proxy = ResultsFilterProxy()
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setSortingEnabled(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+        # filter row
+        self.status_box = QComboBox()
+        self.status_box.addItems(self.STATUSES)
+        self.name_box = QLineEdit()
+        self.name_box.setPlaceholderText("Filter by method...")
+        self.min_box = QLineEdit()
+        self.min_box.setPlaceholderText("Min offset (0x...)")
+        self.max_box = QLineEdit()
+        self.max_box.setPlaceholderText("Max offset (0x...)")
+        self.count_label = QLabel("")
+
+        self.status_box.currentTextChanged.connect(self._apply_filters)
+        for box in (self.name_box, self.min_box, self.max_box):
+            box.textChanged.connect(self._apply_filters)
+
+        filters = QHBoxLayout()
+        filters.addWidget(self.status_box)
+        filters.addWidget(self.name_box)
+        filters.addWidget(self.min_box)
+        filters.addWidget(self.max_box)
+        filters.addWidget(self.count_label)
 
         layout = QVBoxLayout()
         layout.addWidget(title)
+        layout.addLayout(filters)
         layout.addWidget(self.table)
         self.setLayout(layout)
 
@@ -27,53 +190,18 @@ class ResultsViewer(QWidget):
         Load data into the table.
         Handles new OffsetAnalyzer structure.
         """
-        entries = []
-
-        # Outdated entries (have old and new offsets)
-        for item in results.get("outdated", []):
-            entries.append({
-                "method": item["func"],
-                "old": item.get("old_offset"),
-                "new": item.get("new_offset")
-            })
+        self.model.set_results(results)
+        self._update_count()
+
+    def _apply_filters(self, *_):
+        status = self.status_box.currentText()
+        self.proxy.set_filters(
+            status="" if status == "All" else status,
+            name=self.name_box.text().strip(),
+            min_offset=_offset_int(self.min_box.text().strip()),
+            max_offset=_offset_int(self.max_box.text().strip()),
+        )
+        self._update_count()
 
-        # Updated entries (no old offset)
-        for item in results.get("updated", []):
-            if any(e["method"] == item["func"] for e in entries):
-                continue
-            entries.append({
-                "method": item["func"],
-                "old": None,
-                "new": item.get("offset")
-            })
-
-        # Missing in dump (old offset is from source)
-        for item in results.get("missing_in_dump", []):
-            entries.append({
-                "method": item["func"],
-                "old": item.get("source_offset"),
-                "new": None
-            })
-
-        # Clear table and set row count
-        self.table.setRowCount(len(entries))
-
-        for row, entry in enumerate(entries):
-            self.table.setItem(row, 0, QTableWidgetItem(entry["method"]))
-
-            # Format offsets as hex if numeric, otherwise show N/A
-            old_val = entry["old"]
-            new_val = entry["new"]
-
-            if isinstance(old_val, int):
-                old_val = hex(old_val)
-            elif old_val is None:
-                old_val = "[N/A]"
-
-            if isinstance(new_val, int):
-                new_val = hex(new_val)
-            elif new_val is None:
-                new_val = "[N/A]"
-
-            self.table.setItem(row, 1, QTableWidgetItem(str(old_val)))
-            self.table.setItem(row, 2, QTableWidgetItem(str(new_val)))
+    def _update_count(self):
+        self.count_label.setText(f"{self.proxy.rowCount()} / {self.model.rowCount()} rows")
@@ -29,8 +29,25 @@ class Config:
     # Config file path
     CONFIG_FILE = BASE_DIR / "config.json"
 
-    # Internal storage for config data
+    # Last session (parsed dump/source + analysis), restored on startup
+    SESSION_FILE = BASE_DIR / "session.snapshot"
+    FILTER_SESSION = "Session Snapshots (*.snapshot)"
+
+    # On-disk cache of AI responses (keyed by model + prompt)
+    AI_CACHE_FILE = BASE_DIR / "ai_cache.sqlite"
+    AI_CACHE_MAX_MB = 64
+    AI_CACHE_MAX_AGE_DAYS = 30
+
+    # Gemini REST client (ai_client.get_client); the timeouts, in seconds,
+    # can be overridden with "ai_connect_timeout" / "ai_read_timeout" in config.json
+    AI_POOL_SIZE = 4
+    AI_CONNECT_TIMEOUT = 10.0
+    AI_READ_TIMEOUT = 120.0
+    AI_RETRIES = 2
+
+    # Internal storage for config data (read from disk on first access)
     _config_data = {}
+    _loaded = False
 
     # Class-level convenience attribute for API key
     GEMINI_API_KEY = ""
@@ -53,6 +70,12 @@ class Config:
 
         # Update convenience attribute
         cls.GEMINI_API_KEY = cls._config_data.get("gemini_api_key", "")
+        cls._loaded = True
+
+    @classmethod
+    def _ensure_loaded(cls):
+        if not cls._loaded:
+            cls.load_config()
 
     @classmethod
     def save_config(cls):
@@ -69,14 +92,27 @@ class Config:
 
     @classmethod
     def get_api_key(cls) -> str:
+        cls._ensure_loaded()
         return cls._config_data.get("gemini_api_key", "")
 
     @classmethod
     def set_api_key(cls, key: str):
+        cls._ensure_loaded()
         cls._config_data["gemini_api_key"] = key
         cls.GEMINI_API_KEY = key  # update convenience attribute
         cls.save_config()
 
+    # -------------------------
+    # Other options
+    # -------------------------
+
+    @classmethod
+    def get_option(cls, name: str, default=None):
+        cls._ensure_loaded()
+        return cls._config_data.get(name, default)
 
-# Load config automatically on import
-Config.load_config()
+    @classmethod
+    def set_option(cls, name: str, value):
+        cls._ensure_loaded()
+        cls._config_data[name] = value
+        cls.save_config()
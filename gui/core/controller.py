@@ -1,14 +1,6 @@
-import traceback
-from typing import Optional
-
-from offset_updater.dump_parser import DumpParser
-from offset_updater.source_scanner import SourceScanner
-from offset_updater.offset_analyzer import OffsetAnalyzer
-from offset_updater.generators import CodeGenerator
-from offset_updater.reporter import Reporter
-
-from ..services.ai_maincpp_updater import AIMainCppUpdater
-from .utils import show_error
+# The offset_updater engines and the AI updater are imported
+# inside the methods that use them, so opening the window does not pay for
+# them.
 
 
 class AppController:
@@ -16,138 +8,113 @@ class AppController:
 
     def __init__(self, state):
         self.state = state
-        self.ai_updater = AIMainCppUpdater()
-
-    # ------------------------------------------------------
-    # FILE LOADING
-    # ------------------------------------------------------
-    def load_dump_file(self, path: str) -> bool:
-        """Parse dump file and store results in state."""
-        try:
-            parser = DumpParser()
-            self.state.parsed_dump = parser.parse(path)
-            self.state.dump_path = path
-            return True
-
-        except Exception as e:
-            show_error("Dump Parse Error", str(e))
-            traceback.print_exc()
-            self.state.parsed_dump = None
-            self.state.dump_path = None
-            return False
-
-    def load_source_file(self, path: str) -> bool:
-        """Load and parse source file (main.cpp)."""
-        try:
-            scanner = SourceScanner(path)
-            self.state.parsed_source = scanner.scan()
-            self.state.source_path = path
-            return True
-
-        except Exception as e:
-            show_error("Source Scan Error", str(e))
-            traceback.print_exc()
-            self.state.parsed_source = None
-            self.state.source_path = None
-            return False
-
-    # ------------------------------------------------------
-    # ANALYSIS
-    # ------------------------------------------------------
-    def run_analysis(self) -> dict:
-        """Compare dump offsets with source offsets."""
-        if not self.state.parsed_dump or not self.state.parsed_source:
-            show_error("Analysis Error", "Dump or source files not loaded.")
-            return {}
-
-        try:
-            analyzer = OffsetAnalyzer(
-                dump_data=self.state.parsed_dump,
-                source_data=self.state.parsed_source
-            )
-
-            results = analyzer.analyze()
-            self.state.analysis_results = results
-            return results
-
-        except Exception as e:
-            show_error("Analysis Error", str(e))
-            traceback.print_exc()
-            self.state.analysis_results = {}
-            return {}
-
-    # ------------------------------------------------------
-    # AI UPDATE OF main.cpp
-    # ------------------------------------------------------
-    def run_ai_maincpp_update(self) -> Optional[str]:
-        """Send dump + main.cpp to AI and save updated output."""
-        if not self.state.source_path:
-            show_error("AI Error", "main.cpp file not loaded.")
-            return None
-
-        if not self.state.parsed_dump:
-            show_error("AI Error", "Dump file not loaded.")
-            return None
-
-        try:
-            # read real main.cpp text
-            with open(self.state.source_path, "r", encoding="utf-8") as f:
-                cpp_text = f.read()
-
-            dump_data = self.state.parsed_dump
-
-            updated_cpp = self.ai_updater.generate_updated_cpp(
-                dump_data=dump_data,
-                cpp_text=cpp_text
-            )
-
-            self.state.ai_generated_cpp = updated_cpp
-            return updated_cpp
-
-        except Exception as e:
-            show_error("AI Update Error", str(e))
-            traceback.print_exc()
-            self.state.ai_generated_cpp = None
-            return None
-
-    # ------------------------------------------------------
-    # CODE GENERATION
-    # ------------------------------------------------------
-    def generate_fix_code(self) -> str:
-        """Generate hook + LOGD patch code based on results."""
-        if not self.state.analysis_results:
-            show_error("Code Generation Error", "No analysis results available.")
-            return ""
-
-        try:
-            generator = CodeGenerator()
-            updated_entries = self.state.analysis_results.get("updated", [])
-
-            return (
-                generator.generate_hook_snippets(updated_entries)
-                + "\n\n"
-                + generator.generate_logd_snippets(updated_entries)
-            )
-
-        except Exception as e:
-            show_error("Code Generation Error", str(e))
-            traceback.print_exc()
-            return ""
+        self._ai_updater = None
+        self._ai_key = None
+
+    @property
+    def ai_updater(self):
+        """Created on first use and rebuilt only when the API key changes in Settings."""
+        from .config import Config
+        key = Config.get_api_key()
+        if self._ai_updater is None or key != self._ai_key:
+            from ..services.ai_maincpp_updater import AIMainCppUpdater
+            self._ai_updater = AIMainCppUpdater(key or None)
+            self._ai_key = key
+        return self._ai_updater
 
     # ------------------------------------------------------
-    # REPORTING
+    # WORKER STAGES
+    # Run on BackgroundTask threads: no dialogs and no state
+    # writes here; errors are raised and results returned so the
+    # window can apply them on the UI thread.
     # ------------------------------------------------------
-    def generate_report(self) -> str:
-        """Generate readable analysis report."""
-        if not self.state.analysis_results:
-            show_error("Report Error", "No analysis results available.")
-            return ""
-
-        try:
-            reporter = Reporter()
-            return reporter.build_text_report(self.state.analysis_results)
-
-        except Exception as e:
-            show_error("Report Error", str(e))
-            traceback.print_exc()
-            return ""
+    def parse_inputs(self, dump_path: str, source_path: str, progress=None, cancel=None) -> tuple:
+        """Parse the dump and scan main.cpp; progress reports the "parse" then the "scan" stage."""
+        from offset_updater.dump_parser import DumpParser
+        from offset_updater.source_scanner import SourceScanner
+
+        parsed_dump = DumpParser().parse(dump_path, progress=progress, cancel=cancel)
+        parsed_source = SourceScanner(source_path).scan(progress=progress, cancel=cancel)
+        return parsed_dump, parsed_source
+
+    def apply_inputs(self, dump_path: str, source_path: str, parsed: tuple) -> None:
+        self.state.parsed_dump, self.state.parsed_source = parsed
+        self.state.dump_path = dump_path
+        self.state.source_path = source_path
+
+    def save_session(self, path: str) -> None:
+        self.state.save_snapshot(path)
+
+    def read_session(self, path: str) -> dict:
+        """Validated snapshot contents; raises StaleSnapshot if an input changed."""
+        return self.state.read_snapshot(path)
+
+    def apply_session(self, snapshot: dict) -> None:
+        self.state.apply_snapshot(snapshot)
+
+    def analyze(self, parsed_dump, parsed_source, progress=None, cancel=None) -> dict:
+        from offset_updater.offset_analyzer import OffsetAnalyzer
+        analyzer = OffsetAnalyzer(dump_data=parsed_dump, source_data=parsed_source)
+        return analyzer.analyze(progress=progress, cancel=cancel)
+
+    def iter_outputs(self, results: dict):
+        """Patch snippets followed by the text report, line by line."""
+        from offset_updater.generators import CodeGenerator
+        from offset_updater.reporter import Reporter
+        from .config import Config
+
+        generator = CodeGenerator(Config.get_option("snippet_style"))
+        updated_entries = results.get("updated", [])
+
+        yield "=== PATCH SNIPPETS ==="
+        yield ""
+        if updated_entries:
+            yield from generator.iter_hook_snippets(updated_entries)
+            yield ""
+            yield from generator.iter_logd_snippets(updated_entries)
+        else:
+            yield "[No patch code generated]"
+        yield ""
+        yield ""
+        yield "=== REPORT ==="
+        yield ""
+        yield from Reporter().iter_text_report(results)
+
+    def plan_source_patch(self, parsed_source: dict, results: dict):
+        """BoundPatcher for the outdated hooks: each offset rewritten only at its own HOOK/LOGD call."""
+        from offset_updater.patcher import BoundPatcher
+        return BoundPatcher.from_analysis(parsed_source, results)
+
+    def apply_source_patch(self, patcher, progress=None, cancel=None) -> dict:
+        """Rewrite the source files in place (atomically); {path: edits}."""
+        return patcher.patch_files(progress=progress, cancel=cancel)
+
+    def build_fix_code(self, results: dict) -> str:
+        from offset_updater.generators import CodeGenerator
+        from .config import Config
+        generator = CodeGenerator(Config.get_option("snippet_style"))
+        updated_entries = results.get("updated", [])
+        return (
+            generator.generate_hook_snippets(updated_entries)
+            + "\n\n"
+            + generator.generate_logd_snippets(updated_entries)
+        )
+
+    def update_maincpp_text(self, dump_data, cpp_path: str, hybrid: bool = False, on_text=None, cancel=None) -> str:
+        """
+        Read main.cpp and have the AI updater patch its offsets.
+
+        Default: the whole file goes to the model (generate_updated_cpp); with
+        the "ai_stream_full_file" option the validated answer is streamed to
+        on_text. hybrid=True patches exact dump matches locally and sends
+        only the remaining hooks to the model (generate_updated_cpp_hybrid).
+        """
+        with open(cpp_path, "r", encoding="utf-8") as f:
+            cpp_text = f.read()
+        from .config import Config
+        updater = self.ai_updater
+        if hybrid:
+            return updater.generate_updated_cpp_hybrid(dump_data, cpp_text)
+        if Config.get_option("ai_stream_full_file", False):
+            return updater.generate_updated_cpp_streaming(dump_data, cpp_text, on_text, cancel)
+        return updater.generate_updated_cpp(dump_data, cpp_text)
@@ -4,6 +4,9 @@ class AppState:
     The GUI, controller, and AI updater all read/write this object.
     """
 
+    # Persisted by save_snapshot(); bound to dump_path / source_path
+    SNAPSHOT_FIELDS = ("parsed_dump", "parsed_source", "analysis_results")
+
     def __init__(self):
         # --------------------------------------------
         # User–selected input files
@@ -31,6 +34,34 @@ class AppState:
         # --------------------------------------------
         self.dark_theme_enabled: bool = True
 
+    # --------------------------------------------
+    # Session snapshots
+    # --------------------------------------------
+    def save_snapshot(self, path: str) -> None:
+        """Write the parsed/analysis data to a snapshot (plain data, no code) tied to the input files."""
+        from offset_updater.snapshot import save_snapshot
+        save_snapshot(
+            path,
+            {name: getattr(self, name) for name in self.SNAPSHOT_FIELDS},
+            {"dump_path": self.dump_path, "source_path": self.source_path},
+        )
+
+    @staticmethod
+    def read_snapshot(path: str) -> dict:
+        """
+        Load a snapshot without touching the state (safe on a worker thread).
+        Raises offset_updater.snapshot.StaleSnapshot if an input changed.
+        """
+        from offset_updater.snapshot import load_snapshot
+        return load_snapshot(path)
+
+    def apply_snapshot(self, snapshot: dict) -> None:
+        """Adopt the result of read_snapshot()."""
+        self.dump_path = snapshot["inputs"].get("dump_path")
+        self.source_path = snapshot["inputs"].get("source_path")
+        for name in self.SNAPSHOT_FIELDS:
+            setattr(self, name, snapshot["sections"].get(name) or {})
+
     # --------------------------------------------
     # Reset everything
     # --------------------------------------------
@@ -0,0 +1,155 @@
+# services/ai_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of AI responses (SQLite).
+
+    Key = sha256(model + NUL + prompt), so an identical request, whether a
+    whole main.cpp or one chunk/fragment batch, is answered from disk.
+
+    Eviction:
+      - entries older than `max_age` seconds are dropped (checked on read
+        and on every write)
+      - above `max_bytes` of stored responses, the least recently used go
+
+    hits/misses are counted for this instance and accumulated in the
+    database (stats()). Safe to share between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key      TEXT PRIMARY KEY,
+            model    TEXT NOT NULL,
+            response TEXT NOT NULL,
+            size     INTEGER NOT NULL,
+            created  REAL NOT NULL,
+            used     REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_used ON responses(used);
+        CREATE TABLE IF NOT EXISTS counters (
+            name  TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, max_age: float = 30 * 24 * 3600):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(self.SCHEMA)
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    # ---------------------------------------------------------
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        key = self.key(model, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT response, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.max_age:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                self._count("misses")
+                return None
+            self._db.execute("UPDATE responses SET used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            self._count("hits")
+            return row[0]
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(model, prompt), model, response, size, now, now),
+            )
+            self._evict(now)
+
+    def delete(self, model: str, prompt: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (self.key(model, prompt),))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.execute("DELETE FROM counters")
+            self._db.execute("VACUUM")
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Entries, stored bytes, and hits/misses (this session and all time)."""
+        with self._lock:
+            entries, total = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            counters = dict(self._db.execute("SELECT name, value FROM counters"))
+        return {
+            "entries": entries,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": counters.get("hits", 0),
+            "total_misses": counters.get("misses", 0),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ---------------------------------------------------------
+    def _count(self, name: str) -> None:
+        self._db.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.max_age,))
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        # drop least recently used until back under the limit
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY used").fetchall():
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+
+_shared: Dict[str, ResponseCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(path: str, **limits) -> ResponseCache:
+    """One ResponseCache per database file for the whole process."""
+    path = os.path.abspath(path)
+    with _shared_lock:
+        cache = _shared.get(path)
+        if cache is None:
+            cache = _shared[path] = ResponseCache(path, **limits)
+        return cache
@@ -0,0 +1,158 @@
+# services/ai_chunker.py
+import asyncio
+import random
+import re
+import time
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Protocol
+
+
+class TextGenerator(Protocol):
+    """What the chunker calls: GeminiAPI, or any fake with the same method."""
+
+    def generate(self, prompt: str, model: str = ...) -> str: ...
+
+
+# ---------------------------------------------------------
+# Splitting main.cpp
+# ---------------------------------------------------------
+_STRING_OR_COMMENT = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|//[^\n]*')
+_HOOK_LINE = re.compile(r'[ \t]*(?:HOOK|LOGD)\s*\(')
+
+
+def chunk_boundaries(text: str) -> List[int]:
+    """
+    Offsets where main.cpp may be cut without splitting a function or a
+    hook call: the start of every line at brace depth 0 (between top-level
+    definitions) and of every line opening a HOOK(...) / LOGD(...) call
+    (hook tables usually live inside one long init function).
+    """
+    bounds = []
+    depth = 0
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        if depth <= 0 or _HOOK_LINE.match(line):
+            bounds.append(pos)
+        code = _STRING_OR_COMMENT.sub("", line)
+        depth += code.count("{") - code.count("}")
+        pos += len(line)
+    return bounds
+
+
+def split_cpp(text: str, max_chars: int) -> List[str]:
+    """
+    Cut text into pieces of at most max_chars (when the boundaries allow)
+    at chunk_boundaries(); falls back to a line break, then to a hard cut.
+    "".join(split_cpp(text, n)) == text.
+    """
+    bounds = chunk_boundaries(text)
+    chunks = []
+    pos = 0
+    while len(text) - pos > max_chars:
+        limit = pos + max_chars
+        i = bisect_right(bounds, limit) - 1
+        cut = bounds[i] if i >= 0 and bounds[i] > pos else text.rfind("\n", pos, limit) + 1
+        if cut <= pos:
+            cut = limit
+        chunks.append(text[pos:cut])
+        pos = cut
+    if pos < len(text) or not chunks:
+        chunks.append(text[pos:])
+    return chunks
+
+
+# ---------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------
+class TokenBucket:
+    """
+    `rate` requests per second on average, bursts of up to `capacity`.
+    State uses the monotonic clock, so one bucket can pace several runs.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# ---------------------------------------------------------
+# Concurrent requests
+# ---------------------------------------------------------
+class AIChunker:
+    """
+    Sends many prompts to a TextGenerator concurrently and returns the
+    answers in prompt order.
+
+    - at most `concurrency` requests in flight (asyncio.Semaphore)
+    - `rate` requests/second with bursts of `burst` (TokenBucket)
+    - failed requests, or answers rejected by `accept`, are retried up
+      to `retries` times with exponential backoff and jitter (a rejected
+      answer is dropped from the API's cache via invalidate(), if it has one);
+      these are the only retries: an API with without_retries() is used
+      through it, so its transport does not retry each attempt again
+    - generate() is blocking, so each call runs via asyncio.to_thread
+
+    A prompt that still fails yields None; `stats` counts requests,
+    retries and failures of the last run.
+    """
+
+    def __init__(self, api: TextGenerator, model: str = "gemini-2.5-flash", concurrency: int = 4,
+                 rate: float = 2.0, burst: int = 4, retries: int = 3, backoff: float = 1.0):
+        without_retries = getattr(api, "without_retries", None)
+        self.api = without_retries() if without_retries is not None else api
+        self.model = model
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate, burst)
+        self.retries = retries
+        self.backoff = backoff
+        self.stats: Dict[str, int] = {}
+
+    def generate_all(self, prompts: List[str],
+                     accept: Optional[Callable[[int, str], bool]] = None) -> List[Optional[str]]:
+        """Blocking entry point (worker threads); not for use inside a running event loop."""
+        return asyncio.run(self.agenerate_all(prompts, accept))
+
+    async def agenerate_all(self, prompts: List[str],
+                            accept: Optional[Callable[[int, str], bool]] = None) -> List[Optional[str]]:
+        self.stats = {"requests": 0, "retries": 0, "failed": 0}
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results: List[Optional[str]] = [None] * len(prompts)
+
+        async def run(i: int, prompt: str):
+            async with semaphore:
+                results[i] = await self._generate(i, prompt, accept)
+
+        await asyncio.gather(*(run(i, p) for i, p in enumerate(prompts)))
+        return results
+
+    async def _generate(self, i: int, prompt: str, accept) -> Optional[str]:
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.stats["retries"] += 1
+                await asyncio.sleep(self.backoff * (2 ** (attempt - 1)) * (0.5 + random.random()))
+            await self.bucket.acquire()
+            self.stats["requests"] += 1
+            try:
+                answer = await asyncio.to_thread(self.api.generate, prompt, self.model)
+            except Exception:
+                continue
+            if accept is None or accept(i, answer):
+                return answer
+            # a cached answer would be rejected again on every retry
+            invalidate = getattr(self.api, "invalidate", None)
+            if invalidate is not None:
+                invalidate(prompt, self.model)
+        self.stats["failed"] += 1
+        return None
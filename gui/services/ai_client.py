@@ -0,0 +1,275 @@
+# services/ai_client.py
+import http.client
+import json
+import ssl
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class GeminiError(RuntimeError):
+    """Non-200 answer from the Gemini REST API."""
+
+    def __init__(self, status: int, message: str):
+        self.status = status
+        super().__init__(f"HTTP {status}: {message}")
+
+
+class ClientMetrics:
+    """Request counters of one GeminiClient (thread-safe)."""
+
+    FIELDS = ("requests", "failed", "cancelled", "retries", "connections", "reused",
+              "bytes_sent", "bytes_received", "latency_total", "latency_max")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, **amounts) -> None:
+        with self._lock:
+            for name, amount in amounts.items():
+                self._values[name] += amount
+
+    def request_done(self, latency: float, sent: int, received: int) -> None:
+        with self._lock:
+            v = self._values
+            v["requests"] += 1
+            v["bytes_sent"] += sent
+            v["bytes_received"] += received
+            v["latency_total"] += latency
+            v["latency_max"] = max(v["latency_max"], latency)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            out = dict(self._values)
+        out["latency_avg"] = out["latency_total"] / out["requests"] if out["requests"] else 0.0
+        return out
+
+
+class GeminiClient:
+    """
+    Gemini REST client (generateContent / streamGenerateContent) on
+    http.client, with a pool of keep-alive connections.
+
+    - at most `pool_size` requests in flight; idle connections are reused,
+      so the TCP/TLS handshake is paid once per connection, not per request
+    - connect_timeout bounds connecting, read_timeout every socket read
+    - connection errors, timeouts and 429/5xx answers are retried up to
+      `retries` times with exponential backoff (per call, `retries=0` for
+      callers that retry and pace requests themselves); a kept-alive
+      connection the server has dropped meanwhile is replaced without
+      counting a retry
+    - `metrics` counts requests, failures, retries, connections, bytes and
+      latency (request sent to answer read)
+
+    Use get_client() to share one client per key in the process.
+    """
+
+    BASE_URL = "https://generativelanguage.googleapis.com"
+    API_VERSION = "v1beta"
+    RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, api_key: str, base_url: str = BASE_URL, pool_size: int = 4,
+                 connect_timeout: float = 10.0, read_timeout: float = 120.0,
+                 retries: int = 2, backoff: float = 1.0):
+        url = urlsplit(base_url)
+        self.api_key = api_key
+        self.base_url = base_url
+        self.https = url.scheme == "https"
+        self.host = url.hostname
+        self.port = url.port
+        self.prefix = url.path.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.metrics = ClientMetrics()
+
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    # ---------------------------------------------------------
+    # API
+    # ---------------------------------------------------------
+    def generate(self, prompt: str, model: str, retries: Optional[int] = None) -> str:
+        body = self._body(prompt)
+        conn, response, start = self._open(f"models/{model}:generateContent", body, retries)
+        try:
+            payload = response.read()
+        except BaseException:
+            self._checkin(conn, reusable=False)
+            self.metrics.add(failed=1)
+            raise
+        self._checkin(conn, reusable=not response.will_close)
+        self.metrics.request_done(time.perf_counter() - start, len(body), len(payload))
+        return self._text(json.loads(payload))
+
+    def generate_stream(self, prompt: str, model: str, retries: Optional[int] = None) -> Iterator[str]:
+        """
+        Yields text pieces as the server sends them (server-sent events).
+        Closing the generator early drops the connection, which stops the
+        generation server-side, and counts as "cancelled" (not "failed");
+        a finished stream returns it to the pool.
+        """
+        body = self._body(prompt)
+        conn, response, start = self._open(f"models/{model}:streamGenerateContent?alt=sse", body, retries)
+        received = 0
+        outcome = "failed"
+        try:
+            for line in response:
+                received += len(line)
+                if line.startswith(b"data:"):
+                    text = self._text(json.loads(line[5:]))
+                    if text:
+                        yield text
+            outcome = "done"
+        except GeneratorExit:
+            # the caller stopped reading: closed, cancelled or answer rejected
+            outcome = "cancelled"
+            raise
+        finally:
+            self._checkin(conn, reusable=outcome == "done" and not response.will_close)
+            if outcome == "done":
+                self.metrics.request_done(time.perf_counter() - start, len(body), received)
+            else:
+                self.metrics.add(**{outcome: 1})
+
+    def close(self) -> None:
+        """Close the idle connections (requests in flight are unaffected)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    # ---------------------------------------------------------
+    # Requests
+    # ---------------------------------------------------------
+    @staticmethod
+    def _body(prompt: str) -> bytes:
+        return json.dumps({"contents": [{"role": "user", "parts": [{"text": prompt}]}]}).encode("utf-8")
+
+    @staticmethod
+    def _text(data: dict) -> str:
+        candidates = data.get("candidates") or [{}]
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
+
+    def _open(self, method: str, body: bytes,
+              retries: Optional[int] = None) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse, float]:
+        """Send the request; returns (connection, 200 response, start time) with a pool slot held."""
+        if retries is None:
+            retries = self.retries
+        path = f"{self.prefix}/{self.API_VERSION}/{method}"
+        headers = {
+            "Content-Type": "application/json",
+            "x-goog-api-key": self.api_key,
+            "Connection": "keep-alive",
+        }
+        attempt = 0
+        while True:
+            conn, reused = self._checkout()
+            start = time.perf_counter()
+            try:
+                conn.request("POST", path, body, headers)
+                conn.sock.settimeout(self.read_timeout)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                self._checkin(conn, reusable=False)
+                if reused and isinstance(e, (ConnectionResetError, BrokenPipeError)):
+                    continue        # the server closed the idle connection
+                error: Exception = e
+            else:
+                if response.status == 200:
+                    return conn, response, start
+                try:
+                    error = GeminiError(response.status, self._error_message(response.read()))
+                    self._checkin(conn, reusable=not response.will_close)
+                except (OSError, http.client.HTTPException) as e:
+                    self._checkin(conn, reusable=False)
+                    error = e
+                if isinstance(error, GeminiError) and error.status not in self.RETRY_STATUS:
+                    self.metrics.add(failed=1)
+                    raise error
+
+            if attempt >= retries:
+                self.metrics.add(failed=1)
+                raise error
+            attempt += 1
+            self.metrics.add(retries=1)
+            time.sleep(self.backoff * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _error_message(payload: bytes) -> str:
+        try:
+            return json.loads(payload)["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            return payload.decode("utf-8", "replace")[:200]
+
+    # ---------------------------------------------------------
+    # Connection pool
+    # ---------------------------------------------------------
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._idle:
+                    self.metrics.add(reused=1)
+                    return self._idle.pop(), True
+            if self.https:
+                if self._ssl is None:
+                    self._ssl = ssl.create_default_context()
+                conn = http.client.HTTPSConnection(self.host, self.port, timeout=self.connect_timeout,
+                                                   context=self._ssl)
+            else:
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.connect_timeout)
+        except BaseException:
+            self._slots.release()       # _checkin is never reached for this slot
+            raise
+        self.metrics.add(connections=1)
+        return conn, False
+
+    def _checkin(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+
+_clients: Dict[Tuple[str, str], GeminiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(api_key: str, base_url: str = GeminiClient.BASE_URL, **options) -> GeminiClient:
+    """
+    One GeminiClient per (key, server) for the whole process, created on
+    first use; `options` (pool size, timeouts, retries) apply at creation.
+    """
+    with _clients_lock:
+        client = _clients.get((api_key, base_url))
+        if client is None:
+            client = _clients[(api_key, base_url)] = GeminiClient(api_key, base_url, **options)
+        return client
+
+
+def client_metrics() -> Dict[str, float]:
+    """metrics.snapshot() summed over every client of the process."""
+    with _clients_lock:
+        clients = list(_clients.values())
+    total = dict.fromkeys(ClientMetrics.FIELDS, 0)
+    for client in clients:
+        for name, value in client.metrics.snapshot().items():
+            if name == "latency_max":
+                total[name] = max(total[name], value)
+            elif name in total:
+                total[name] += value
+    total["latency_avg"] = total["latency_total"] / total["requests"] if total["requests"] else 0.0
+    return total
@@ -1,6 +1,8 @@
 # services/ai_maincpp_updater.py
 import re
-from typing import Dict, Any, Optional
+import difflib
+from bisect import bisect_right
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from .api_service import GeminiAPI
 
@@ -38,10 +40,34 @@ class AIMainCppUpdater:
         r'(?:\/\/\s*)?([A-Za-z_][A-Za-z0-9_:<>]*)[^\n\r]{0,60}?(0x[0-9A-Fa-f]{4,})'
     )
 
+    # Any hex literal (chunks without one are not sent to the model)
+    HEX_LITERAL = re.compile(r'0x[0-9A-Fa-f]+')
+
+    # <<<FRAGMENT n>>> ... <<<END n>>> blocks of a hybrid-mode answer
+    FRAGMENT_BLOCK = re.compile(r'<<<FRAGMENT (\d+)>>>\n(.*?)\n?<<<END \1>>>', re.DOTALL)
+
+    NEWLINE = re.compile(r'\n')
+
+    # fragment text per hybrid-mode request (batches go out concurrently)
+    FRAGMENT_BATCH_CHARS = 30_000
+
+    # dump names offered to the model per unresolved function
+    CANDIDATES = 8
+
     def __init__(self, api_key: Optional[str] = None, model: str = "gemini-2.5-flash"):
         # allow overriding api key / model
         self.model = model
-        self.api = GeminiAPI(api_key) if api_key is not None else GeminiAPI()
+        self.api_key = api_key
+        self._api = None
+        # counts from the last generate_updated_cpp*() call
+        self.last_report: Dict[str, int] = {}
+
+    @property
+    def api(self) -> GeminiAPI:
+        """Created on first use, so fully local updates need no key or SDK."""
+        if self._api is None:
+            self._api = GeminiAPI(self.api_key) if self.api_key is not None else GeminiAPI()
+        return self._api
 
     # -----------------------
     # Helpers
@@ -112,30 +138,106 @@ class AIMainCppUpdater:
         Build a clear prompt for Gemini and request a full updated main.cpp back.
         - dump_data: mapping or DumpEntry objects
         - cpp_text: full source text
-        - max_prompt_chars: guard to avoid sending enormous prompts (truncates bottom of file if needed)
+        - max_prompt_chars: larger files are split on function/hook boundaries
+          and the chunks sent concurrently (see generate_updated_cpp_chunked)
+        """
+        if len(cpp_text) > max_prompt_chars:
+            # half the budget per chunk leaves room for its function table
+            return self.generate_updated_cpp_chunked(dump_data, cpp_text, max_prompt_chars // 2)
+
+        dump_map = self._normalize_dump(dump_data)
+        prompt = self._update_prompt(self._function_table(dump_map, cpp_text), cpp_text)
+
+        # Make the API call (model & api handled by GeminiAPI wrapper)
+        updated = self.api.generate(prompt, model=self.model)
+        if not updated:
+            raise RuntimeError("AI returned no valid C++ output. Response may be truncated or invalid.")
+
+        # only HOOK/LOGD offsets may change, and only to the dump's values
+        return self._verified(cpp_text, updated, dump_map, prompt)
+
+    def generate_updated_cpp_streaming(self, dump_data: Dict[str, Any], cpp_text: str,
+                                       on_text: Optional[Callable[[str], None]] = None,
+                                       cancel=None) -> str:
+        """
+        Full-file update with the answer streamed: each validated piece is
+        passed to on_text as it arrives, and the stream is cut off with
+        ai_validation.DriftError at the first token that differs from
+        main.cpp other than a hex literal (progress.Cancelled when `cancel`
+        is set). The returned text keeps the original's whitespace.
+        """
+        from .ai_validation import validate_stream
+
+        dump_map = self._normalize_dump(dump_data)
+        prompt = self._update_prompt(self._function_table(dump_map, cpp_text), cpp_text)
+
+        stream = self.api.generate_stream(prompt, model=self.model)
+        try:
+            validator = validate_stream(cpp_text, stream, on_text, cancel)
+        except Exception:
+            # don't leave a rejected answer in the cache
+            self.api.invalidate(prompt, self.model)
+            raise
+        # the stream only checked structure; now check the new offsets
+        return self._verified(cpp_text, validator.updated, dump_map, prompt)
+
+    def generate_updated_cpp_chunked(self, dump_data: Dict[str, Any], cpp_text: str,
+                                     max_chunk_chars: int = 60_000) -> str:
         """
+        Split main.cpp on function/hook boundaries (ai_chunker.split_cpp) and
+        update the chunks concurrently, each prompt carrying only the
+        functions found in its chunk. Answers are reassembled in order; a
+        chunk whose answer never passes verify_update stays as it was.
+        Counts land in self.last_report.
+        """
+        from .ai_chunker import AIChunker, split_cpp
+        from .ai_validation import verify_update
 
         dump_map = self._normalize_dump(dump_data)
-        src_map = self.extract_offsets(cpp_text)
+        chunks = split_cpp(cpp_text, max_chunk_chars)
+
+        # chunks without any offset are not worth a request
+        todo = [i for i, chunk in enumerate(chunks) if self.HEX_LITERAL.search(chunk)]
+        prompts = [self._update_prompt(self._function_table(dump_map, chunks[i]), chunks[i], fragment=True)
+                   for i in todo]
+
+        verified = {}
+
+        def accept(n, answer):
+            verified[n] = verify_update(chunks[todo[n]], answer, dump_map)
+            return verified[n].ok
+
+        chunker = AIChunker(self.api, self.model)
+        answers = chunker.generate_all(prompts, accept)
+        changes = 0
+        for n, (i, answer) in enumerate(zip(todo, answers)):
+            if answer is not None:
+                chunks[i] = verified[n].updated
+                changes += len(verified[n].allowed)
+
+        self.last_report = {"chunks": len(chunks), "ai_chunks": len(todo), **chunker.stats,
+                            "ai_changes": changes, "prompt_chars": sum(map(len, prompts))}
+        return "".join(chunks)
 
-        # Build compact table of functions that appear in source (and corresponding dump offsets if any)
+    def _function_table(self, dump_map: Dict[str, str], cpp_text: str) -> str:
+        """Compact table of functions that appear in the text, with their dump offsets if any."""
         func_rows = []
-        for func, old in sorted(src_map.items()):
+        for func, old in sorted(self.extract_offsets(cpp_text).items()):
             new = dump_map.get(func, "[NOT_IN_DUMP]")
             func_rows.append(f"{func} | source_old={old} | dump_new={new}")
+        return "\n".join(func_rows) if func_rows else "(no functions detected)"
 
-        func_summary = "\n".join(func_rows) if func_rows else "(no functions detected)"
-
-        # Trim the cpp_text if extremely long — prefer head (definitions) + foot (hooks) — but we keep simple truncation
-        cpp_for_prompt = cpp_text
-        if len(cpp_for_prompt) > max_prompt_chars:
-            # keep first N and last M to preserve hook table and declarations
-            head = cpp_for_prompt[: int(max_prompt_chars * 0.6)]
-            tail = cpp_for_prompt[-int(max_prompt_chars * 0.4):]
-            cpp_for_prompt = head + "\n\n/* === TRUNCATED MIDDLE === */\n\n" + tail
-
-        prompt = f"""
-You are an assistant that must update numeric offsets in a C++ source file (main.cpp) used for IL2CPP hooking.
+    @staticmethod
+    def _update_prompt(func_summary: str, cpp_part: str, fragment: bool = False) -> str:
+        what = "a contiguous FRAGMENT of a C++ source file (main.cpp)" if fragment else "a C++ source file (main.cpp)"
+        give_back = (
+            "Return the FULL updated fragment as plain text, exactly as long as the original: "
+            "do not complete, close or trim code that is cut off at either end"
+            if fragment else "Return the FULL updated main.cpp source file as plain text"
+        )
+        label = "main.cpp FRAGMENT" if fragment else "main.cpp"
+        return f"""
+You are an assistant that must update numeric offsets in {what} used for IL2CPP hooking.
 Do NOT change code structure, variable names, comments or formatting — only update numeric offsets (hex values like 0x216B910).
 Where the dump provides a newer offset for a function, replace the corresponding numeric value in main.cpp.
 
@@ -147,18 +249,212 @@ Where the dump provides a newer offset for a function, replace the corresponding
 2) Preserve OBFUSCATE(...) wrappers and str2Offset(...) calls exactly as-is, only change the inner hex digits.
 3) If dump has a newer offset for a function, substitute the dump value.
 4) For functions marked [NOT_IN_DUMP], do not invent new offsets — leave them unchanged.
-5) Return the FULL updated main.cpp source file as plain text. Do not add explanation, do not include JSON or metadata — the response must be exactly the updated file contents.
+5) {give_back}. Do not add explanation, do not include JSON or metadata — the response must be exactly the updated file contents.
 
--- ORIGINAL main.cpp (BEGIN) --
-{cpp_for_prompt}
--- ORIGINAL main.cpp (END) --
+-- ORIGINAL {label} (BEGIN) --
+{cpp_part}
+-- ORIGINAL {label} (END) --
 """
 
-        # Make the API call (model & api handled by GeminiAPI wrapper)
-        updated = self.api.generate(prompt, model=self.model)
+    def _verified(self, cpp_text: str, answer: str, dump_map: Dict[str, str], prompt: str) -> str:
+        """Run verify_update on a full-file answer; RuntimeError (and no cache entry) if it fails."""
+        from .ai_validation import verify_update
 
-        # Basic validation: ensure we got something with 'HOOK' or 'LOGD'
-        if not updated or ("HOOK(" not in updated and "LOGD(" not in updated):
-            raise RuntimeError("AI returned no valid C++ output. Response may be truncated or invalid.")
+        check = verify_update(cpp_text, answer, dump_map)
+        self.last_report = {"ai_changes": len(check.allowed), "rejected": len(check.disallowed),
+                            "prompt_chars": len(prompt)}
+        if not check.ok:
+            self.api.invalidate(prompt, self.model)
+            raise RuntimeError("AI output rejected, it changes more than the dump offsets:\n" + check.summary())
+        return check.updated
+
+    # -----------------------
+    # Hybrid (local-first) mode
+    # -----------------------
+    def generate_updated_cpp_hybrid(self, dump_data: Dict[str, Any], cpp_text: str, context_lines: int = 2) -> str:
+        """
+        Update main.cpp locally wherever the dump resolves a HOOK/LOGD
+        function exactly, and ask the model only about the rest.
+
+        1) Every HOOK and labelled LOGD offset literal is located by span
+           (SourceScanner, filtered by patcher.offset_sites as BoundPatcher
+           does); other log lines are left as they are.
+        2) Exact dump hits are patched in place, no model involved.
+        3) Unresolved sites that have dump candidates are cut into fragments
+           (the site's lines ± context_lines, overlapping windows merged)
+           and sent in one prompt with the candidate names/offsets.
+        4) Each answered fragment is spliced back over its span, provided
+           it passes verify_update: only HOOK/LOGD offsets changed, each to
+           its dump offset or one of the candidates offered for it.
+
+        The prompt grows with the number of unresolved hooks, not with the
+        file; when everything resolves locally no request is made at all.
+        Counts land in self.last_report.
+        """
+        from offset_updater.patcher import apply_edits, format_like, offset_sites
+        from offset_updater.source_scanner import SourceScanner
+
+        dump_map = self._normalize_dump(dump_data)
+        resolve = getattr(dump_data, "resolve", None)
+        scanned = SourceScanner("").scan_text(cpp_text)
+
+        local_at: Dict[int, Tuple[int, int, str]] = {}     # start → (start, end, new literal)
+        unresolved = []                                     # scanner entries
+        for site in offset_sites(scanned):
+            func = site["func"]
+            new = dump_map.get(func)
+            if new is None and resolve is not None and "::" in func:
+                entry = resolve(func)
+                if entry is not None:
+                    new = self._normalize_dump({func: entry}).get(func)
+            if new is None:
+                unresolved.append(site)
+                continue
+            start, end = site["span"]
+            literal = format_like(cpp_text[start:end], new)
+            if literal != cpp_text[start:end]:
+                local_at[start] = (start, end, literal)
+        local = sorted(local_at.values())
+
+        report = {"local": len(local), "unresolved": len(unresolved), "ai_fragments": 0,
+                  "ai_accepted": 0, "prompt_chars": 0}
+        self.last_report = report
+
+        candidates = self._candidates(dump_map, {site["func"] for site in unresolved})
+        asked = [site for site in unresolved if candidates.get(site["func"])]
+        windows = self._fragment_windows(cpp_text, [site["span"] for site in asked], context_lines)
+
+        # local edits inside a window travel with (and are replaced by) the fragment
+        edits = []
+        inner = [[] for _ in windows]
+        window_starts = [ws for ws, _ in windows]
+        for edit in local:
+            i = bisect_right(window_starts, edit[0]) - 1
+            if i >= 0 and edit[0] < windows[i][1]:
+                inner[i].append(edit)
+            else:
+                edits.append(edit)
+        fragments = [(ws, we, apply_edits(cpp_text[ws:we], [(s - ws, e - ws, new) for s, e, new in inner[i]]))
+                     for i, (ws, we) in enumerate(windows)]
+
+        if fragments:
+            from .ai_chunker import AIChunker
+            from .ai_validation import verify_update
+
+            # fragments go out in size-bounded batches, concurrently
+            batches = self._fragment_batches(fragments, asked)
+            prompts = [self._fragment_prompt([fragments[i] for i in ids], sites, candidates, cpp_text)
+                       for ids, sites in batches]
+            report["ai_fragments"] = len(fragments)
+            report["prompt_chars"] = sum(map(len, prompts))
+            chunker = AIChunker(self.api, self.model)
+            responses = chunker.generate_all(prompts)
+            report.update(chunker.stats)
+            offered = {func: [off for _, off in found] for func, found in candidates.items()}
+
+            for (ids, _), response in zip(batches, responses):
+                answers = self._parse_fragments(response)
+                for n, i in enumerate(ids):
+                    ws, we, sent = fragments[i]
+                    answer = answers.get(n)
+                    if answer is not None and answer != sent:
+                        check = verify_update(sent, answer, dump_map, offered)
+                        if check.ok:
+                            report["ai_accepted"] += 1
+                            sent = check.updated
+                    edits.append((ws, we, sent))
+
+        edits.sort()
+        return apply_edits(cpp_text, edits)
+
+    # -----------------------
+    # Hybrid helpers
+    # -----------------------
+    def _fragment_windows(self, text: str, spans: List[Tuple[int, int]], context_lines: int) -> List[Tuple[int, int]]:
+        """Whole-line windows around each span (± context_lines), merged when they touch."""
+        if not spans:
+            return []
+        line_starts = [0]
+        line_starts.extend(m.end() for m in self.NEWLINE.finditer(text))
+        last_line = len(line_starts) - 1
+
+        windows = []
+        for s, e in sorted(spans):
+            first = max(0, bisect_right(line_starts, s) - 1 - context_lines)
+            last = min(last_line, bisect_right(line_starts, e) - 1 + context_lines)
+            ws = line_starts[first]
+            we = line_starts[last + 1] - 1 if last < last_line else len(text)
+            if windows and ws <= windows[-1][1] + 1:
+                windows[-1] = (windows[-1][0], max(we, windows[-1][1]))
+            else:
+                windows.append((ws, we))
+        return windows
+
+    def _candidates(self, dump_map: Dict[str, str], funcs) -> Dict[str, List[Tuple[str, str]]]:
+        """Closest dump names for each unresolved function: {func: [(name, offset)]}."""
+        if not funcs:
+            return {}
+        from offset_updater.search_index import NameIndex
+
+        index = NameIndex(dump_map)
+        out = {}
+        for func in funcs:
+            tail = func.split("::")[-1].lower()
+            hits = index.complete(tail, limit=self.CANDIDATES * 4)
+            if not hits:
+                # renamed methods often keep a distinctive word: try the longest one
+                word = max(re.split(r'[_\W]+', tail), key=len)
+                if len(word) >= 3:
+                    hits = index.complete(word, limit=self.CANDIDATES * 4)
+            ranked = sorted(hits, key=lambda pos: difflib.SequenceMatcher(None, tail, index.lower[pos]).ratio(),
+                            reverse=True)[:self.CANDIDATES]
+            out[func] = [(index.names[pos], dump_map[index.names[pos]]) for pos in ranked]
+        return out
+
+    def _fragment_batches(self, fragments, sites) -> List[Tuple[List[int], list]]:
+        """Consecutive fragments grouped up to FRAGMENT_BATCH_CHARS, with the sites inside them."""
+        starts = [ws for ws, _, _ in fragments]
+        sites_in = [[] for _ in fragments]
+        for site in sites:
+            sites_in[bisect_right(starts, site["span"][0]) - 1].append(site)
+
+        batches = []
+        size = 0
+        for i, (_, _, text) in enumerate(fragments):
+            if not batches or size + len(text) > self.FRAGMENT_BATCH_CHARS:
+                batches.append(([], []))
+                size = 0
+            batches[-1][0].append(i)
+            batches[-1][1].extend(sites_in[i])
+            size += len(text)
+        return batches
+
+    def _fragment_prompt(self, fragments, sites, candidates, cpp_text: str) -> str:
+        rows = []
+        for site in sites:
+            start, end = site["span"]
+            options = ", ".join(f"{name}={off}" for name, off in candidates[site["func"]])
+            rows.append(f"{site['func']} | source_old={cpp_text[start:end]} | dump_candidates: {options}")
+
+        blocks = "\n".join(f"<<<FRAGMENT {n}>>>\n{text}\n<<<END {n}>>>" for n, (_, _, text) in enumerate(fragments))
+
+        return f"""
+You are an assistant that must update numeric offsets in fragments of a C++ source file (main.cpp) used for IL2CPP hooking.
+The functions below were not found in the new dump under their exact names; the closest dump entries are listed for each.
+
+-- UNRESOLVED FUNCTIONS --
+{chr(10).join(rows)}
+
+-- INSTRUCTIONS --
+1) ONLY change hex numbers (0x...) which represent offsets. Every other character must stay identical.
+2) If one candidate clearly is the same function (renamed or re-cased), use its offset.
+3) If no candidate clearly matches, leave the offset unchanged — do not invent offsets.
+4) Return every fragment, in order, wrapped in the same <<<FRAGMENT n>>> / <<<END n>>> lines, and nothing else.
+
+-- FRAGMENTS --
+{blocks}
+"""
+
+    def _parse_fragments(self, response: str) -> Dict[int, str]:
+        return {int(m.group(1)): m.group(2) for m in self.FRAGMENT_BLOCK.finditer(response or "")}
 
-        return updated
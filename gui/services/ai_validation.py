@@ -0,0 +1,232 @@
+# services/ai_validation.py
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from offset_updater.patcher import offset_sites
+from offset_updater.progress import Cancelled, CancelToken
+from offset_updater.source_scanner import SourceScanner
+
+# One token per match: hex literal, identifier/keyword, number, whitespace
+# run, or any single other character. Every character belongs to exactly
+# one token, so "".join(tokens) == text.
+TOKEN = re.compile(r'0x[0-9A-Fa-f]+|[A-Za-z_]\w*|\d+|\s+|.', re.DOTALL)
+HEX_TOKEN = re.compile(r'0x[0-9A-Fa-f]+\Z')
+
+FENCE_OPEN = re.compile(r'[ \t]*```[^\n]*\n')
+
+
+def iter_tokens(text: str, start: int = 0) -> Iterator[Tuple[int, str]]:
+    """(position, token) pairs over text, in one left-to-right pass."""
+    for m in TOKEN.finditer(text, start):
+        yield m.start(), m.group()
+
+
+def line_at(text: str, pos: int) -> int:
+    return text.count("\n", 0, pos) + 1
+
+
+class DriftError(ValueError):
+    """The AI output changed something other than a hex literal."""
+
+    def __init__(self, line: int, expected: str, got: str):
+        self.line = line
+        self.expected = expected
+        self.got = got
+        super().__init__(f"AI output drifted from main.cpp at line {line}: expected {expected!r}, got {got!r}")
+
+
+class StreamValidator:
+    """
+    Checks a streamed AI answer against the original text token by token.
+
+        validator = StreamValidator(cpp_text)
+        for piece in stream:
+            shown = validator.feed(piece)   # checked text; DriftError on the first bad token
+        updated = validator.finish()        # raises DriftError if the answer stops short
+
+    Only hex literals may differ (changes lists them as (pos, old, new)).
+    Whitespace is not compared (the original's is kept, so line endings and
+    indentation survive) and a ``` fence around the answer is dropped.
+    Trailing word characters are held back until the next piece, since
+    they may continue there ("0x1A" + "2B", "0" + "x1A"), as is trailing
+    whitespace and backticks (a closing fence). Work per piece is proportional
+    to the piece, so the whole stream is checked in linear time.
+    """
+
+    def __init__(self, original: str):
+        self.original = original
+        self._expected = iter_tokens(original)
+        self._buffer = ""
+        self._started = False
+        self._parts: List[str] = []
+        self.changes: List[Tuple[int, str, str]] = []
+        self.updated: Optional[str] = None
+
+    def feed(self, piece: str) -> str:
+        """Check the complete tokens received so far; returns the text they add to the result."""
+        self._buffer += piece
+        if not self._started:
+            stripped = self._buffer.lstrip()
+            if stripped.startswith("```"):
+                fence = FENCE_OPEN.match(stripped)
+                if fence is None:
+                    return ""   # wait for the end of the fence line
+                self._buffer = stripped[fence.end():]
+            elif len(stripped) < 3 and "```".startswith(stripped):
+                return ""       # could still become a fence
+            self._started = True
+
+        # whitespace and backticks may be a closing fence (dropped by finish())
+        cut = len(self._buffer.rstrip("` \t\r\n"))
+        while cut and (self._buffer[cut - 1].isalnum() or self._buffer[cut - 1] == "_"):
+            cut -= 1
+        if not cut:
+            return ""
+        tokens = TOKEN.findall(self._buffer, 0, cut)
+        self._buffer = self._buffer[cut:]
+        done = len(self._parts)
+        for token in tokens:
+            self._check(token)
+        return "".join(self._parts[done:])
+
+    def finish(self) -> str:
+        """Check what is left; returns the validated updated text."""
+        rest = self._buffer.rstrip()
+        if rest.endswith("```"):
+            rest = rest[:-3]
+        for token in TOKEN.findall(rest):
+            self._check(token)
+        self._buffer = ""
+
+        # the original may only have whitespace left
+        for pos, token in self._expected:
+            if not token.isspace():
+                raise DriftError(line_at(self.original, pos), token, "<end of output>")
+            self._parts.append(token)
+        return "".join(self._parts)
+
+    def _check(self, token: str) -> None:
+        if token.isspace():
+            return          # whitespace comes from the original
+        for pos, want in self._expected:
+            if not want.isspace():
+                break
+            self._parts.append(want)
+        else:
+            raise DriftError(line_at(self.original, len(self.original)), "<end of file>", token)
+        if token != want:
+            if not (HEX_TOKEN.match(token) and HEX_TOKEN.match(want)):
+                raise DriftError(line_at(self.original, pos), want, token)
+            self.changes.append((pos, want, token))
+        self._parts.append(token)
+
+
+def validate_stream(original: str, pieces: Iterable[str],
+                    on_text: Optional[Callable[[str], None]] = None,
+                    cancel: Optional[CancelToken] = None) -> StreamValidator:
+    """
+    Feed a stream of text pieces through a StreamValidator, passing the
+    checked text to on_text as it arrives. The stream is closed (which
+    stops the generation) as soon as the output drifts (DriftError) or
+    `cancel` is set (Cancelled). Returns the finished validator: its
+    text is validator.updated, its edits validator.changes.
+    """
+    validator = StreamValidator(original)
+    try:
+        for piece in pieces:
+            if cancel is not None and cancel.cancelled:
+                raise Cancelled("stream")
+            shown = validator.feed(piece)
+            if shown and on_text is not None:
+                on_text(shown)
+        validator.updated = validator.finish()
+    finally:
+        close = getattr(pieces, "close", None)
+        if close is not None:
+            close()
+    return validator
+
+
+# ---------------------------------------------------------
+# Checking a whole answer against the dump
+# ---------------------------------------------------------
+@dataclass(slots=True)
+class Edit:
+    """One token the answer changed; reason is empty for an allowed edit."""
+    line: int
+    old: str
+    new: str
+    func: Optional[str] = None
+    reason: str = ""
+
+    def __str__(self):
+        where = f" ({self.func})" if self.func else ""
+        why = f": {self.reason}" if self.reason else ""
+        return f"line {self.line}{where}: {self.old} -> {self.new}{why}"
+
+
+@dataclass
+class Verification:
+    updated: Optional[str]              # None when the answer is not main.cpp with other hex values
+    allowed: List[Edit] = field(default_factory=list)
+    disallowed: List[Edit] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.updated is not None and not self.disallowed
+
+    def summary(self, limit: int = 5) -> str:
+        lines = [str(e) for e in self.disallowed[:limit]]
+        if len(self.disallowed) > limit:
+            lines.append(f"... and {len(self.disallowed) - limit} more")
+        return "\n".join(lines)
+
+
+def verify_update(original: str, updated: str, dump_map: Dict[str, str],
+                  candidates: Optional[Dict[str, Iterable[str]]] = None) -> Verification:
+    """
+    Check an AI-updated text against the original and the dump.
+
+    Both texts are tokenized once and aligned (StreamValidator), so any
+    change other than a hex literal ends the check with one disallowed
+    edit and updated=None. Each changed literal is then allowed only if it
+    is the offset of a HOOK call or labelled LOGD line (SourceScanner span,
+    patcher.offset_sites) whose function maps to that offset: dump_map[func], or one of candidates[func] (the
+    dump offsets offered to the model for a function the dump lacks).
+    Linear in the size of both texts.
+    """
+    validator = StreamValidator(original)
+    try:
+        validator.feed(updated)
+        text = validator.finish()
+    except DriftError as e:
+        return Verification(None, disallowed=[Edit(e.line, e.expected, e.got, reason="not a hex literal")])
+
+    result = Verification(text)
+    if not validator.changes:
+        return result
+
+    scanned = SourceScanner("").scan_text(original)
+    func_at = {site["span"][0]: site["func"] for site in offset_sites(scanned)}
+    candidates = candidates or {}
+
+    line, counted = 1, 0
+    for pos, old, new in validator.changes:
+        line += original.count("\n", counted, pos)
+        counted = pos
+        edit = Edit(line, old, new, func_at.get(pos))
+
+        if pos not in func_at:
+            edit.reason = "not a HOOK/LOGD offset"
+        else:
+            offsets = list(candidates.get(edit.func, ()))
+            if edit.func in dump_map:
+                offsets.append(dump_map[edit.func])
+            if not offsets:
+                edit.reason = "function not in dump"
+            elif int(new, 16) not in {int(off, 16) for off in offsets}:
+                edit.reason = f"dump has {offsets[0]}" if len(offsets) == 1 else "not an offered dump offset"
+
+        (result.disallowed if edit.reason else result.allowed).append(edit)
+    return result
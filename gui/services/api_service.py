@@ -1,35 +1,105 @@
-from typing import Optional
-from google import genai
+import copy
+from typing import Iterator, Optional
 from ..core.config import Config
+from .ai_cache import ResponseCache, shared_cache
+from .ai_client import GeminiClient, get_client
 
 
 class GeminiAPI:
     """
-    Gemini API wrapper using the official google-genai SDK (2025).
+    Gemini API wrapper over the REST API (ai_client.GeminiClient).
+
+    Every GeminiAPI with the same key shares one pooled client, so
+    creating one per request is cheap and connections stay alive between
+    requests. Timeouts, pool size and retries come from Config.
+
+    Responses are cached on disk by (model, prompt) in Config.AI_CACHE_FILE;
+    pass another ResponseCache to use a different store, or use_cache=False
+    to generate() to always go to the network.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[ResponseCache] = None):
         self.api_key = api_key or Config.get_api_key()
         if not self.api_key:
             raise ValueError(
                 "Gemini API key is required. Set it using Config.set_api_key() or in config.json."
             )
+        self.cache = cache if cache is not None else self.default_cache()
+        # transport-level retries per request; None = the client's (Config.AI_RETRIES)
+        self.retries: Optional[int] = None
 
-        # Initialize Google Gemini client
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_client(
+            self.api_key,
+            Config.get_option("ai_base_url", GeminiClient.BASE_URL),
+            pool_size=Config.AI_POOL_SIZE,
+            connect_timeout=Config.get_option("ai_connect_timeout", Config.AI_CONNECT_TIMEOUT),
+            read_timeout=Config.get_option("ai_read_timeout", Config.AI_READ_TIMEOUT),
+            retries=Config.AI_RETRIES,
+        )
 
-    def generate(self, prompt: str, model: str = "gemini-2.5-flash") -> str:
+    @staticmethod
+    def default_cache() -> ResponseCache:
+        return shared_cache(
+            str(Config.AI_CACHE_FILE),
+            max_bytes=Config.AI_CACHE_MAX_MB * 1024 * 1024,
+            max_age=Config.AI_CACHE_MAX_AGE_DAYS * 24 * 3600,
+        )
+
+    def generate(self, prompt: str, model: str = "gemini-2.5-flash", use_cache: bool = True) -> str:
         """
-        Sends a text prompt to Gemini using the official Google SDK.
+        Sends a text prompt to Gemini (generateContent).
+        An identical (model, prompt) answered before comes from the cache.
         """
+        if use_cache:
+            cached = self.cache.get(model, prompt)
+            if cached is not None:
+                return cached
 
         try:
-            response = self.client.models.generate_content(
-                model=model,
-                contents=prompt
-            )
+            text = self.client.generate(prompt, model, self.retries)
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {e}")
+
+        if use_cache and text:
+            self.cache.put(model, prompt, text)
+        return text
 
-            return response.text or ""
+    def generate_stream(self, prompt: str, model: str = "gemini-2.5-flash", use_cache: bool = True) -> Iterator[str]:
+        """
+        Like generate(), but yields the answer piece by piece as Gemini
+        produces it (streamGenerateContent). Closing the generator early
+        stops the request; only complete answers are cached.
+        """
+        if use_cache:
+            cached = self.cache.get(model, prompt)
+            if cached is not None:
+                yield cached
+                return
 
+        parts = []
+        stream = self.client.generate_stream(prompt, model, self.retries)
+        try:
+            for text in stream:
+                parts.append(text)
+                yield text
         except Exception as e:
-            raise RuntimeError(f"Gemini SDK error: {e}")
+            raise RuntimeError(f"Gemini API error: {e}")
+        finally:
+            stream.close()
+
+        if use_cache and parts:
+            self.cache.put(model, prompt, "".join(parts))
+
+    def without_retries(self) -> "GeminiAPI":
+        """
+        The same key, client and cache, but a failed request is not retried
+        by the transport: for callers that retry and pace requests
+        themselves (AIChunker), so the two layers don't multiply.
+        """
+        api = copy.copy(self)
+        api.retries = 0
+        return api
+
+    def invalidate(self, prompt: str, model: str = "gemini-2.5-flash") -> None:
+        """Forget a cached answer the caller rejected, so a retry asks again."""
+        self.cache.delete(model, prompt)
@@ -1,25 +1,74 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from offset_updater.progress import Cancelled, CancelToken, ProgressEvent
+
 
 class BackgroundTask(QThread):
     """
     Generic threaded background task.
     Run heavy logic here to keep UI responsive.
+
+    With with_progress=True the function also receives progress=self.report
+    and cancel=self.cancel_token (the offset_updater progress protocol);
+    with_stream=True passes on_text=self.text.emit and cancel, for
+    functions that stream text as they produce it.
+    After cancel() the engine's next checkpoint raises Cancelled, unwinding
+    the worker; the result of a task cancelled too late to interrupt is
+    dropped and `cancelled` is emitted instead of `finished`.
     """
 
     progress = pyqtSignal(int)        # emit 0–100
+    status = pyqtSignal(str)          # stage, amounts and ETA
+    text = pyqtSignal(str)            # streamed output pieces
     finished = pyqtSignal(object)     # result object
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
 
-    def __init__(self, fn, *args, **kwargs):
+    def __init__(self, fn, *args, with_progress=False, with_stream=False, **kwargs):
         super().__init__()
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.cancel_token = CancelToken()
+        if with_progress:
+            self.kwargs["progress"] = self.report
+            self.kwargs["cancel"] = self.cancel_token
+        if with_stream:
+            self.kwargs["on_text"] = self.text.emit
+            self.kwargs["cancel"] = self.cancel_token
+        self._last_percent = -1
+        self._last_status = ""
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_token.cancelled
+
+    def report(self, event: ProgressEvent):
+        """Progress callback for the worker thread (signals emitted on change)."""
+        fraction = event.fraction
+        if fraction is not None:
+            percent = int(fraction * 100)
+            if percent != self._last_percent:
+                self._last_percent = percent
+                self.progress.emit(percent)
+        text = str(event)
+        if text != self._last_status:
+            self._last_status = text
+            self.status.emit(text)
 
     def run(self):
         try:
             result = self.fn(*self.args, **self.kwargs)
-            self.finished.emit(result)
+        except Cancelled:
+            self.cancelled.emit()
+            return
         except Exception as e:
             self.error.emit(str(e))
+            return
+
+        if self.is_cancelled():
+            self.cancelled.emit()
+        else:
+            self.finished.emit(result)
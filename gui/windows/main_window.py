@@ -1,19 +1,18 @@
 from PyQt6.QtWidgets import (
     QWidget, QMainWindow, QVBoxLayout, QHBoxLayout,
-    QLabel, QTextEdit, QMessageBox, QTabWidget, QFileDialog
+    QLabel, QMessageBox, QTabWidget, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 
 from ..components.file_selector import FileSelector
 from ..components.buttons import PrimaryButton, SecondaryButton
-from ..components.results_viewer import ResultsViewer
+from ..components.output_viewer import lines_to_text
 from ..components.progress_window import ProgressWindow
 from ..core.config import Config
 from .settings_window import SettingsWindow
 from .about_window import AboutWindow
 
-# AI updater
-from ..services.ai_maincpp_updater import AIMainCppUpdater
+from ..services.background_tasks import BackgroundTask
 
 
 class MainWindow(QMainWindow):
@@ -23,6 +22,8 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.controller = controller
+        self._task = None
+        self._session_dirty = False
         self.setWindowTitle(f"{Config.APP_NAME} - v{Config.VERSION}")
         self.setMinimumSize(Config.DEFAULT_WIDTH, Config.DEFAULT_HEIGHT)
 
@@ -58,28 +59,40 @@ class MainWindow(QMainWindow):
         generate_btn = SecondaryButton("Generate Code & Report")
         generate_btn.clicked.connect(self.generate_outputs)
 
+        patch_btn = SecondaryButton("Patch Sources...")
+        patch_btn.clicked.connect(self.patch_sources)
+
         ai_update_btn = PrimaryButton("AI Update main.cpp")
-        ai_update_btn.clicked.connect(self.ai_update_maincpp)
+        ai_update_btn.setToolTip("Send the whole main.cpp to the AI and review its updated copy.")
+        ai_update_btn.clicked.connect(lambda: self.ai_update_maincpp(hybrid=False))
+
+        ai_hybrid_btn = SecondaryButton("AI Update (Hybrid)")
+        ai_hybrid_btn.setToolTip(
+            "Patch offsets with an exact dump match locally; only the remaining hooks go to the AI."
+        )
+        ai_hybrid_btn.clicked.connect(lambda: self.ai_update_maincpp(hybrid=True))
 
         btn_row.addWidget(load_btn)
         btn_row.addWidget(analyze_btn)
         btn_row.addWidget(generate_btn)
+        btn_row.addWidget(patch_btn)
         btn_row.addWidget(ai_update_btn)
+        btn_row.addWidget(ai_hybrid_btn)
 
         root.addLayout(btn_row)
 
-        # Tabs: Results, Code/Report, AI-updated main.cpp
+        # Tabs: Results, Code/Report, AI-updated main.cpp, Dump Search.
+        # Each starts as an empty host; its widget is built the first time
+        # the tab is shown or used (after the window has painted).
         self.tabs = QTabWidget()
-        self.results_viewer = ResultsViewer()
-        self.tabs.addTab(self.results_viewer, "Results")
-
-        self.output_box = QTextEdit()
-        self.output_box.setReadOnly(True)
-        self.tabs.addTab(self.output_box, "Generated Code / Report")
-
-        self.ai_output = QTextEdit()
-        self.ai_output.setReadOnly(True)
-        self.tabs.addTab(self.ai_output, "AI Updated main.cpp")
+        self._tab_hosts = {}
+        self._tab_widgets = {}
+        self._add_lazy_tab("results", "Results", self._make_results_viewer)
+        self._add_lazy_tab("output", "Generated Code / Report", self._make_output_viewer)
+        self._add_lazy_tab("ai_output", "AI Updated main.cpp", self._make_ai_output_viewer)
+        self._add_lazy_tab("dump_search", "Dump Search", self._make_dump_search)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        QTimer.singleShot(0, lambda: self._on_tab_changed(self.tabs.currentIndex()))
 
         root.addWidget(self.tabs)
 
@@ -91,10 +104,119 @@ class MainWindow(QMainWindow):
         about_btn = SecondaryButton("About")
         about_btn.clicked.connect(self.open_about)
 
+        save_session_btn = SecondaryButton("Save Session...")
+        save_session_btn.clicked.connect(self.save_session)
+
+        open_session_btn = SecondaryButton("Open Session...")
+        open_session_btn.clicked.connect(self.open_session)
+
         bottom_row.addWidget(settings_btn)
         bottom_row.addWidget(about_btn)
+        bottom_row.addStretch()
+        bottom_row.addWidget(save_session_btn)
+        bottom_row.addWidget(open_session_btn)
         root.addLayout(bottom_row)
 
+        # Bring back the last session once the window is up
+        QTimer.singleShot(0, self._restore_last_session)
+
+    # ------------------------------
+    # LAZY TABS
+    # ------------------------------
+    def _add_lazy_tab(self, key, title, factory):
+        host = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        host.setLayout(layout)
+        self._tab_hosts[key] = (host, factory)
+        self.tabs.addTab(host, title)
+
+    def _tab(self, key):
+        """The tab's widget, built on first access."""
+        widget = self._tab_widgets.get(key)
+        if widget is None:
+            host, factory = self._tab_hosts[key]
+            widget = self._tab_widgets[key] = factory()
+            host.layout().addWidget(widget)
+        return widget
+
+    def _show_tab(self, key):
+        self._tab(key)
+        self.tabs.setCurrentWidget(self._tab_hosts[key][0])
+
+    def _on_tab_changed(self, index):
+        host = self.tabs.widget(index)
+        for key, (tab_host, _) in self._tab_hosts.items():
+            if tab_host is host:
+                self._tab(key)
+
+    def _make_results_viewer(self):
+        from ..components.results_viewer import ResultsViewer
+        return ResultsViewer()
+
+    def _make_output_viewer(self):
+        from ..components.output_viewer import OutputViewer
+        return OutputViewer("offset_report.txt")
+
+    def _make_ai_output_viewer(self):
+        from ..components.output_viewer import OutputViewer
+        return OutputViewer("updated_main.cpp", "C++ Files (*.cpp)")
+
+    def _make_dump_search(self):
+        # pulls in offset_updater, so only when the tab is opened
+        from ..components.dump_search import DumpSearch
+        search = DumpSearch()
+        if self.controller.state.parsed_dump:
+            search.set_dump(self.controller.state.parsed_dump)
+        return search
+
+    results_viewer = property(lambda self: self._tab("results"))
+    output_box = property(lambda self: self._tab("output"))
+    ai_output = property(lambda self: self._tab("ai_output"))
+    dump_search = property(lambda self: self._tab("dump_search"))
+
+    # ------------------------------
+    # BACKGROUND TASKS
+    # ------------------------------
+    def _start_task(self, title, fn, *args, on_done, with_progress=False, on_text=None, on_start=None):
+        """
+        Run fn(*args) on a BackgroundTask behind a cancellable progress
+        dialog; on_done(result) runs on the UI thread when it succeeds.
+        With on_text, fn streams text (on_text=, cancel=) and each piece
+        is passed to on_text on the UI thread. on_start() runs once the
+        task is accepted (not while another one is busy), before it starts.
+        """
+        if self._task is not None and self._task.isRunning():
+            QMessageBox.information(self, "Busy", "Please wait for the current task to finish.")
+            return
+
+        if on_start is not None:
+            on_start()
+
+        task = BackgroundTask(fn, *args, with_progress=with_progress, with_stream=on_text is not None)
+        progress = ProgressWindow(title, self, cancellable=True)
+
+        def on_finished(result):
+            progress.finish()
+            on_done(result)
+
+        def on_error(message):
+            progress.finish()
+            QMessageBox.critical(self, "Error", message)
+
+        task.progress.connect(progress.set_progress)
+        task.status.connect(progress.set_status)
+        if on_text is not None:
+            task.text.connect(on_text)
+        task.finished.connect(on_finished)
+        task.error.connect(on_error)
+        task.cancelled.connect(progress.finish)
+        progress.cancel_requested.connect(task.cancel)
+
+        self._task = task
+        progress.show()
+        task.start()
+
     # ------------------------------
     # FILE LOAD
     # ------------------------------
@@ -106,57 +228,103 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Missing Files", "Please select both a dump file and main.cpp.")
             return
 
-        progress = ProgressWindow("Loading Files...", self)
-        progress.show()
-
-        try:
-            loaded_dump = self.controller.load_dump_file(dump_path)
-            loaded_cpp = self.controller.load_source_file(cpp_path)
-        finally:
-            progress.close()
-
-        if loaded_dump and loaded_cpp:
-            QMessageBox.information(self, "Success", "Dump and main.cpp loaded successfully.")
-        else:
-            QMessageBox.warning(self, "Load Error", "Failed to load dump or main.cpp. Check logs for details.")
+        def done(parsed):
+            self.controller.apply_inputs(dump_path, cpp_path, parsed)
+            self._session_dirty = True
+            if "dump_search" in self._tab_widgets:
+                self.dump_search.set_dump(self.controller.state.parsed_dump)
+            errors = parsed[1]["ERRORS"]
+            if errors:
+                QMessageBox.warning(
+                    self, "Some Sources Skipped",
+                    "These files could not be scanned:\n" + "\n".join(f"{e['file']}: {e['error']}" for e in errors)
+                )
+            else:
+                QMessageBox.information(self, "Success", "Dump and main.cpp loaded successfully.")
+
+        self._start_task(
+            "Loading Files...", self.controller.parse_inputs, dump_path, cpp_path,
+            on_done=done, with_progress=True
+        )
 
     # ------------------------------
     # ANALYSIS
     # ------------------------------
     def run_analysis(self):
-        results = self.controller.run_analysis()
-
-        if not results:
+        state = self.controller.state
+        if not state.parsed_dump or not state.parsed_source:
             QMessageBox.warning(self, "No Results", "No analysis results found. Ensure files are loaded.")
             return
 
-        self.results_viewer.load_results(results)
-        QMessageBox.information(self, "Analysis Complete", "Offsets analyzed successfully.")
+        def done(results):
+            state.analysis_results = results
+            self._session_dirty = True
+            self.results_viewer.load_results(results)
+            QMessageBox.information(self, "Analysis Complete", "Offsets analyzed successfully.")
+
+        self._start_task(
+            "Analyzing Offsets...", self.controller.analyze, state.parsed_dump, state.parsed_source,
+            on_done=done, with_progress=True
+        )
 
     # ------------------------------
     # GENERATE SNIPPETS & REPORT
     # ------------------------------
     def generate_outputs(self):
-        code = self.controller.generate_fix_code()
-        report = self.controller.generate_report()
-
-        if not code and not report:
+        results = self.controller.state.analysis_results
+        if not results:
             QMessageBox.warning(self, "Nothing Generated", "No code or report could be generated.")
             return
 
-        self.output_box.clear()
-        self.output_box.append("=== PATCH SNIPPETS ===\n")
-        self.output_box.append(code or "[No patch code generated]")
-        self.output_box.append("\n\n=== REPORT ===\n")
-        self.output_box.append(report or "[No report generated]")
+        # Lines are generated lazily and rendered in chunks; no worker needed
+        self.output_box.show_source(lambda: lines_to_text(self.controller.iter_outputs(results)))
 
         # Switch to the Generated Code / Report tab so user sees output
-        self.tabs.setCurrentWidget(self.output_box)
+        self._show_tab("output")
+
+    # ------------------------------
+    # PATCH SOURCES IN PLACE
+    # ------------------------------
+    def patch_sources(self):
+        state = self.controller.state
+        results = state.analysis_results
+        if not results or not state.parsed_source:
+            QMessageBox.warning(self, "No Results", "Run the analysis before patching the sources.")
+            return
+
+        patcher = self.controller.plan_source_patch(state.parsed_source, results)
+        if not patcher.edit_count:
+            QMessageBox.information(self, "Nothing to Patch", "No outdated offsets were found in the sources.")
+            return
+
+        # the diff is shown for review before anything is written
+        self.output_box.show_source(patcher.iter_diff)
+        self._show_tab("output")
+        answer = QMessageBox.question(
+            self, "Patch Sources",
+            f"Rewrite {patcher.edit_count} offsets in {len(patcher.plan)} file(s)?\n"
+            "The changes are shown as a diff in the Generated Code / Report tab."
+        )
+        if answer != QMessageBox.StandardButton.Yes:
+            return
+
+        def done(changed):
+            message = f"Patched {sum(changed.values())} offsets in {len(changed)} file(s)."
+            if patcher.stale:
+                message += ("\n\nSkipped (changed since they were loaded):\n"
+                            + "\n".join(patcher.stale))
+            QMessageBox.information(self, "Sources Patched", message + "\n\nReload the files to re-analyze.")
+
+        self._start_task(
+            "Patching Sources...", self.controller.apply_source_patch, patcher,
+            on_done=done, with_progress=True
+        )
 
     # ------------------------------
     # AI: UPDATE main.cpp
     # ------------------------------
-    def ai_update_maincpp(self):
+    def ai_update_maincpp(self, hybrid: bool = False):
+        """Full-file AI update of main.cpp; hybrid=True resolves exact dump matches locally first."""
         cpp_path = self.cpp_selector.get_path()
         dump_data = self.controller.state.parsed_dump
 
@@ -168,23 +336,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Missing Dump", "Load a dump file before using the AI updater.")
             return
 
-        try:
-            with open(cpp_path, "r", encoding="utf-8") as f:
-                cpp_text = f.read()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to read main.cpp:\n{e}")
-            return
-
-        progress = ProgressWindow("AI Updating main.cpp...", self)
-        progress.show()
-
-        try:
-            ai_updater = AIMainCppUpdater()
-            updated_cpp = ai_updater.generate_updated_cpp(dump_data, cpp_text)
-
-            self.ai_output.clear()
-            self.ai_output.setPlainText(updated_cpp or "[AI returned empty response]")
-            self.tabs.setCurrentWidget(self.ai_output)
+        def done(updated_cpp):
+            self.controller.state.ai_generated_cpp = updated_cpp
+            self.ai_output.show_text(updated_cpp or "[AI returned empty response]")
+            self._show_tab("ai_output")
 
             save_path, _ = QFileDialog.getSaveFileName(
                 self,
@@ -194,14 +349,82 @@ class MainWindow(QMainWindow):
             )
 
             if save_path:
-                with open(save_path, "w", encoding="utf-8") as f:
-                    f.write(updated_cpp)
-                QMessageBox.information(self, "Saved", "Updated main.cpp saved successfully.")
-
-        except Exception as e:
-            QMessageBox.critical(self, "AI Error", str(e))
-        finally:
-            progress.close()
+                try:
+                    self.ai_output.save_to(save_path)
+                    QMessageBox.information(self, "Saved", "Updated main.cpp saved successfully.")
+                except Exception as e:
+                    QMessageBox.critical(self, "Error", f"Failed to save main.cpp:\n{e}")
+
+        def start():
+            # streamed answers (Settings > full-file mode) show up as they are checked
+            self.ai_output.clear()
+            self._show_tab("ai_output")
+
+        self._start_task(
+            "AI Updating main.cpp (hybrid)..." if hybrid else "AI Updating main.cpp...",
+            self.controller.update_maincpp_text, dump_data, cpp_path, hybrid,
+            on_done=done, on_text=self.ai_output.append_text, on_start=start
+        )
+
+    # ------------------------------
+    # SESSION SNAPSHOTS
+    # ------------------------------
+    def _restore_last_session(self):
+        """Reopen the autosaved session if its dump and main.cpp are unchanged."""
+        path = str(Config.SESSION_FILE)
+        if not Config.SESSION_FILE.exists():
+            return
+        from offset_updater.snapshot import read_header, stale_inputs
+        try:
+            if stale_inputs(read_header(path)):
+                return
+        except (OSError, ValueError):
+            return
+        self._open_session_file(path)
+
+    def open_session(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Session", str(Config.BASE_DIR), Config.FILTER_SESSION)
+        if path:
+            self._open_session_file(path)
+
+    def _open_session_file(self, path):
+        def done(snapshot):
+            state = self.controller.state
+            self.controller.apply_session(snapshot)
+            self._session_dirty = False
+            self.dump_selector.set_path(state.dump_path)
+            self.cpp_selector.set_path(state.source_path)
+            if state.analysis_results:
+                self.results_viewer.load_results(state.analysis_results)
+            if "dump_search" in self._tab_widgets:
+                self.dump_search.set_dump(state.parsed_dump)
+            self.statusBar().showMessage(
+                f"Session restored from {path} in {snapshot['load_seconds']:.2f} s", 10000
+            )
+
+        self._start_task("Restoring Session...", self.controller.read_session, path, on_done=done)
+
+    def save_session(self):
+        if not self.controller.state.parsed_dump:
+            QMessageBox.warning(self, "Nothing to Save", "Load a dump and main.cpp first.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Save Session", "session.snapshot", Config.FILTER_SESSION)
+        if not path:
+            return
+
+        def done(_):
+            self.statusBar().showMessage(f"Session saved to {path}", 10000)
+
+        self._start_task("Saving Session...", self.controller.save_session, path, on_done=done)
+
+    def closeEvent(self, event):
+        # autosave what was loaded or analyzed since the last restore
+        if self._session_dirty and self.controller.state.parsed_dump:
+            try:
+                self.controller.save_session(str(Config.SESSION_FILE))
+            except Exception as e:
+                print(f"Error saving session: {e}")
+        super().closeEvent(event)
 
     # ------------------------------
     # SETTINGS / ABOUT
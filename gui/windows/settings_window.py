@@ -13,7 +13,7 @@ class SettingsWindow(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
-        self.setFixedSize(400, 300)
+        self.setFixedSize(400, 400)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -37,6 +37,17 @@ class SettingsWindow(QDialog):
         test_btn = QPushButton("Test API Key")
         test_btn.clicked.connect(self.test_api_key)
 
+        # AI update mode
+        self.stream_toggle = QCheckBox("AI update: send the whole main.cpp and stream the answer")
+        self.stream_toggle.setChecked(bool(Config.get_option("ai_stream_full_file", False)))
+
+        # AI response cache
+        self.cache_label = QLabel("")
+        clear_cache_btn = QPushButton("Clear AI Cache")
+        clear_cache_btn.clicked.connect(self.clear_ai_cache)
+        self.requests_label = QLabel("")
+        self._update_cache_label()
+
         save_btn = QPushButton("Save Settings")
         save_btn.clicked.connect(self.save_settings)
 
@@ -46,6 +57,10 @@ class SettingsWindow(QDialog):
         layout.addWidget(api_label)
         layout.addWidget(self.api_input)
         layout.addWidget(test_btn)
+        layout.addWidget(self.stream_toggle)
+        layout.addWidget(self.cache_label)
+        layout.addWidget(self.requests_label)
+        layout.addWidget(clear_cache_btn)
         layout.addStretch()
         layout.addWidget(save_btn)
 
@@ -59,7 +74,7 @@ class SettingsWindow(QDialog):
         try:
             gemini = GeminiAPI(api_key)
             test_prompt = "Say hello."
-            response = gemini.generate(test_prompt)
+            response = gemini.generate(test_prompt, use_cache=False)
             if response:
                 QMessageBox.information(self, "Test Successful", "API key is valid!")
             else:
@@ -67,12 +82,37 @@ class SettingsWindow(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Test Failed", f"API key test failed:\n{e}")
 
+    def _update_cache_label(self):
+        try:
+            stats = GeminiAPI.default_cache().stats()
+        except Exception as e:
+            self.cache_label.setText(f"AI cache unavailable: {e}")
+            return
+        self.cache_label.setText(
+            f"AI cache: {stats['entries']} responses, {stats['bytes'] / (1024 * 1024):.1f} MB — "
+            f"{stats['total_hits']} hits / {stats['total_misses']} misses"
+        )
+        from ..services.ai_client import client_metrics
+        m = client_metrics()
+        self.requests_label.setText(
+            f"AI requests this session: {m['requests']} ({m['failed']} failed, {m['cancelled']} cancelled, {m['retries']} retries), "
+            f"avg {m['latency_avg']:.1f} s, {(m['bytes_sent'] + m['bytes_received']) / 1024:.0f} KB"
+        )
+
+    def clear_ai_cache(self):
+        try:
+            GeminiAPI.default_cache().clear()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to clear the AI cache:\n{e}")
+        self._update_cache_label()
+
     def save_settings(self):
         """Save settings to config.json and update in-memory Config."""
         api_key = self.api_input.text().strip()
 
         # Save API key via Config setter
         Config.set_api_key(api_key)
+        Config.set_option("ai_stream_full_file", self.stream_toggle.isChecked())
 
         QMessageBox.information(self, "Settings Saved", "API key and settings saved successfully.")
         self.close()
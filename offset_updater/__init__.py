@@ -8,10 +8,16 @@ update reports or patch snippets.
 
 Modules:
     - dump_parser: Extracts offsets from dump.cs
+    - formats: Dump-format registry (sniffing + per-format scanners)
     - source_scanner: Maps HOOK/LOGD calls from source files
     - offset_analyzer: Detects mismatches between dump + source
     - generators: Builds updated hook/logd code strings
+    - templates: Compiled HOOK/LOGD snippet templates and style presets
+    - patcher: Applies an old → new offset map to source files in place
     - reporter: Outputs text/JSON reports
+    - class_diff: Per-class hashes to spot what changed between dumps
+    - search_index: Sorted, lowercase-cached name search for the GUIs
+    - progress: Progress events and cancel tokens for long-running calls
 """
 
 __version__ = "1.0.0"
@@ -23,4 +29,9 @@ from .dump_parser import DumpParser
 from .source_scanner import SourceScanner
 from .offset_analyzer import OffsetAnalyzer
 from .generators import CodeGenerator
+from .templates import SnippetRenderer, SnippetStyle
+from .patcher import SourcePatcher
 from .reporter import Reporter
+from .class_diff import ClassHasher
+from .search_index import NameIndex
+from .progress import Cancelled, CancelToken, ProgressEvent
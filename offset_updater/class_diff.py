@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List
+
+from .dump_parser import DumpParser
+
+
+class ClassHasher:
+    """
+    Streaming per-class structural hashes of a dump.cs.
+
+    Every class body is hashed line by line with the volatile numbers
+    removed, so two builds only differ for classes whose declaration,
+    fields, field offsets, method signatures or vtable slots changed:
+
+        // RVA: 0x216EA3C Offset: 0x216EA3C VA: 0x216EA3C Slot: 42
+                → "// Slot: 42"
+        public class Player // TypeDefIndex: 1234
+                → "public class Player"
+
+    Hashes are cached in a small sidecar next to the dump
+    (dump.cs.classhash.json) keyed by the dump's size + mtime.
+    """
+
+    SIDECAR_SUFFIX = ".classhash.json"
+    SIDECAR_VERSION = 1
+
+    RE_ADDRESS = re.compile(rb"(?:RVA|Offset|VA):\s*0x[0-9A-Fa-f]+\s*")
+    RE_TYPEDEF = re.compile(rb"\s*//\s*TypeDefIndex:\s*\d+")
+    RE_CLASS = re.compile(DumpParser.RE_CLASS.pattern.encode())
+
+    NAMESPACE_PREFIX = DumpParser.NAMESPACE_PREFIX.encode()
+
+    # -------------------------------------------------------------
+    def hash_file(self, path: str) -> Dict[str, str]:
+        """Return {"Namespace.Class": hexdigest} for every class in the dump."""
+        hashes = {}
+        namespace = b""
+        current = None
+
+        with open(path, "rb") as f:
+            for line in f:
+                stripped = line.strip()
+
+                if current is None:
+                    if stripped.startswith(self.NAMESPACE_PREFIX):
+                        namespace = stripped[len(self.NAMESPACE_PREFIX):].strip()
+                        continue
+                    decl = self.RE_CLASS.match(stripped)
+                    if not decl:
+                        continue
+                    name = decl.group(1)
+                    key = (namespace + b"." + name if namespace else name).decode("utf-8", "ignore")
+                    current = hashes.get(key)
+                    if current is None:
+                        current = hashes[key] = hashlib.blake2b(digest_size=8)
+                    current.update(self.RE_TYPEDEF.sub(b"", stripped) + b"\n")
+                    continue
+
+                if line.startswith(b"}"):
+                    current = None
+                    continue
+
+                if b"RVA:" in stripped:
+                    stripped = self.RE_ADDRESS.sub(b"", stripped)
+                current.update(stripped + b"\n")
+
+        return {k: h.hexdigest() for k, h in hashes.items()}
+
+    # -------------------------------------------------------------
+    def sidecar_path(self, path: str) -> str:
+        return path + self.SIDECAR_SUFFIX
+
+    def load_or_build(self, path: str) -> Dict[str, str]:
+        """Reuse the sidecar when it matches the dump, otherwise rebuild and save it."""
+        st = os.stat(path)
+        sidecar = self.sidecar_path(path)
+
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if (cached.get("version") == self.SIDECAR_VERSION
+                    and cached.get("size") == st.st_size
+                    and cached.get("mtime_ns") == st.st_mtime_ns):
+                return cached["classes"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        classes = self.hash_file(path)
+        try:
+            with open(sidecar, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": self.SIDECAR_VERSION,
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "classes": classes,
+                }, f, separators=(",", ":"))
+        except OSError:
+            pass  # read-only location: hashes are still returned
+
+        return classes
+
+    # -------------------------------------------------------------
+    @staticmethod
+    def diff(old: Dict[str, str], new: Dict[str, str]) -> Dict[str, List[str]]:
+        """
+        Compare two hash tables:
+            {"added": [...], "removed": [...], "changed": [...], "unchanged": [...]}
+        """
+        added = sorted(k for k in new if k not in old)
+        removed = sorted(k for k in old if k not in new)
+        changed = []
+        unchanged = []
+        for k, h in new.items():
+            if k in old:
+                (unchanged if old[k] == h else changed).append(k)
+
+        return {
+            "added": added,
+            "removed": removed,
+            "changed": sorted(changed),
+            "unchanged": sorted(unchanged),
+        }
+
+    def diff_files(self, old_path: str, new_path: str) -> Dict[str, List[str]]:
+        """What changed between two dump.cs builds (sidecars are reused)."""
+        return self.diff(self.load_or_build(old_path), self.load_or_build(new_path))
@@ -1,8 +1,13 @@
 import re
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, fields as dataclass_fields
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .progress import CancelToken, ProgressCallback, ProgressTracker
 
-@dataclass
+
+@dataclass(slots=True)
 class DumpEntry:
     name: str
     offset: str
@@ -11,6 +16,324 @@ class DumpEntry:
     slot: str
     line_no: int
     raw: str
+    namespace: str = ""
+    klass: str = ""
+    signature: str = ""
+
+    @property
+    def owner(self) -> str:
+        """'Namespace.Class', bare 'Class', or '' outside any class."""
+        if self.klass and self.namespace:
+            return f"{self.namespace}.{self.klass}"
+        return self.klass
+
+    @property
+    def qualified_name(self) -> str:
+        """'Namespace.Class::Method(param,types)' (parts omitted when unknown)."""
+        owner = self.owner
+        prefix = f"{owner}::" if owner else ""
+        return f"{prefix}{self.name}({self.signature})"
+
+
+ENTRY_FIELDS = tuple(f.name for f in dataclass_fields(DumpEntry))
+
+_RE_SIGNATURE_SPACE = re.compile(r"\s*([,<>\[\]()])\s*")
+
+
+def signature_key(text: str) -> str:
+    """
+    Canonical spacing for parameter types and qualified names, used for both
+    the DumpIndex.qualified keys and lookups: "Foo(ref  int, out T)" →
+    "Foo(ref int,out T)". Spaces inside a type ("ref int") are kept as one.
+    """
+    return _RE_SIGNATURE_SPACE.sub(r"\1", " ".join(text.split()))
+
+
+def _encode_column(values: Iterable[Any]) -> Any:
+    """A DumpEntry column as a plain list, or {"values", "index"} when values repeat a lot."""
+    values = list(values)
+    table: Dict[Any, int] = {}
+    index = [table.setdefault(v, len(table)) for v in values]
+    if len(table) * 2 < len(values):
+        return {"values": list(table), "index": index}
+    return values
+
+
+def _decode_column(column: Any) -> List[Any]:
+    if isinstance(column, dict):
+        values = column["values"]
+        return [values[i] for i in column["index"]]
+    return column
+
+
+def _split_aliases(tables: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """({key: table} for each table's first key, {alias key: first key}) for tables shared by identity."""
+    first: Dict[int, str] = {}
+    own, aliases = {}, {}
+    for key, table in tables.items():
+        owner = first.setdefault(id(table), key)
+        if owner == key:
+            own[key] = table
+        else:
+            aliases[key] = owner
+    return own, aliases
+
+
+def _join_aliases(tables: Dict[str, Any], aliases: Dict[str, str]) -> Dict[str, Any]:
+    """Inverse of _split_aliases: alias keys point at their owner's table again."""
+    joined = dict(tables)
+    for alias, owner in aliases.items():
+        joined[alias] = tables[owner]
+    return joined
+
+
+class DumpIndex(dict):
+    """
+    Method index produced by DumpParser.parse().
+
+    Behaves like the historical {method_name: DumpEntry} mapping (the last
+    overload wins) so existing callers keep working, but also keeps EVERY
+    overload in a compact multi-map of integer entry ids:
+
+        entries        → [DumpEntry, ...] in dump order
+        qualified      → {"Game.Player::TakeDamage(int,bool)": id}
+        by_member      → {"Game.Player::TakeDamage": [ids]}
+        by_name        → {"TakeDamage": [ids]}
+        by_class       → {"Game.Player": [ids]}
+        class_aliases  → {"Player": ["Game.Player"]}  (bare class → owners)
+
+    Field offsets from the same pass are kept as plain ints:
+
+        fields        → {"Game.Player": {"hp": 0x18}}  (also reachable as "Player")
+        field_owners  → {"hp": ["Game.Player"]}
+
+    Virtual methods get a per-class vtable table, one int array per class
+    where position = Slot and value = entry id (-1 for unused slots):
+
+        slots         → {"Game.Player": array('i', [-1, -1, 7])}  (also "Player")
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.entries: List[DumpEntry] = []
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_class: Dict[str, List[int]] = {}
+        self.class_aliases: Dict[str, List[str]] = {}
+        self.fields: Dict[str, Dict[str, int]] = {}
+        self.field_owners: Dict[str, List[str]] = {}
+        self.slots: Dict[str, array] = {}
+        # None until first use after from_data(); see _build_member_indexes
+        self._qualified: Optional[Dict[str, int]] = {}
+        self._by_member: Optional[Dict[str, List[int]]] = {}
+        self._by_offset: Optional[Dict[int, int]] = None
+
+    @property
+    def qualified(self) -> Dict[str, int]:
+        if self._qualified is None:
+            self._build_member_indexes()
+        return self._qualified
+
+    @property
+    def by_member(self) -> Dict[str, List[int]]:
+        if self._by_member is None:
+            self._build_member_indexes()
+        return self._by_member
+
+    def _build_member_indexes(self) -> None:
+        """qualified / by_member from the entries (they are the largest indexes, so snapshots omit them)."""
+        qualified: Dict[str, int] = {}
+        by_member: Dict[str, List[int]] = {}
+        for idx, entry in enumerate(self.entries):
+            owner = entry.owner
+            if not owner:
+                qualified[f"{entry.name}({entry.signature})"] = idx
+                continue
+            member = f"{owner}::{entry.name}"
+            qualified[f"{member}({entry.signature})"] = idx
+            ids = by_member.get(member)
+            if ids is None:
+                by_member[member] = [idx]
+            else:
+                ids.append(idx)
+        self._qualified, self._by_member = qualified, by_member
+
+    # ---------------------------------------------------------
+    # Plain-data form (session snapshots)
+    # ---------------------------------------------------------
+    def to_data(self) -> Dict[str, Any]:
+        """
+        JSON-ready contents: the entries as one column per DumpEntry field
+        (low-cardinality columns as a value table plus indexes), by_name,
+        by_class, fields and slots. Tables shared between a class and its
+        bare-name alias are stored once; qualified, by_member and the offset
+        lookup are rebuilt on first use instead of stored.
+        """
+        columns = [_encode_column(col) for col in zip(*map(attrgetter(*ENTRY_FIELDS), self.entries))]
+        fields, field_aliases = _split_aliases(self.fields)
+        slots, slot_aliases = _split_aliases(self.slots)
+        return {
+            "entry_fields": list(ENTRY_FIELDS),
+            "entries": columns or [[] for _ in ENTRY_FIELDS],
+            "by_name": self.by_name,
+            "by_class": self.by_class,
+            "class_aliases": self.class_aliases,
+            "fields": fields,
+            "field_aliases": field_aliases,
+            "field_owners": self.field_owners,
+            "slots": {owner: table.tolist() for owner, table in slots.items()},
+            "slot_aliases": slot_aliases,
+        }
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "DumpIndex":
+        """Inverse of to_data(); ValueError if `data` does not have its layout."""
+        if data.get("entry_fields") != list(ENTRY_FIELDS):
+            raise ValueError("dump index data has a different DumpEntry layout")
+        columns = [_decode_column(col) for col in data["entries"]]
+        if len({len(col) for col in columns}) > 1:
+            raise ValueError("dump index columns differ in length")
+
+        index = cls()
+        index.entries = entries = list(map(DumpEntry, *columns))
+        index.update(zip(columns[0], entries))      # last overload wins, as in add()
+        index.by_name = data["by_name"]
+        index.by_class = data["by_class"]
+        index.class_aliases = data["class_aliases"]
+        index.fields = _join_aliases(data["fields"], data["field_aliases"])
+        index.field_owners = data["field_owners"]
+        index.slots = _join_aliases({owner: array("i", table) for owner, table in data["slots"].items()},
+                                    data["slot_aliases"])
+        index._qualified = index._by_member = None
+        return index
+
+    # ---------------------------------------------------------
+    def add(self, entry: DumpEntry) -> int:
+        """Register an entry in every index and return its id."""
+        idx = len(self.entries)
+        self.entries.append(entry)
+        name = entry.name
+        self[name] = entry
+
+        ids = self.by_name.get(name)
+        if ids is None:
+            self.by_name[name] = [idx]
+        else:
+            ids.append(idx)
+
+        # left alone while not built: _build_member_indexes covers this entry
+        qualified = self._qualified
+        owner = entry.owner
+        if not owner:
+            if qualified is not None:
+                qualified[f"{name}({entry.signature})"] = idx
+        else:
+            ids = self.by_class.get(owner)
+            if ids is None:
+                self.by_class[owner] = [idx]
+                if owner != entry.klass:
+                    self.class_aliases.setdefault(entry.klass, []).append(owner)
+            else:
+                ids.append(idx)
+
+            if qualified is not None:
+                member = f"{owner}::{name}"
+                qualified[f"{member}({entry.signature})"] = idx
+                ids = self._by_member.get(member)
+                if ids is None:
+                    self._by_member[member] = [idx]
+                else:
+                    ids.append(idx)
+
+            if entry.slot:
+                self._add_slot(owner, entry.klass, int(entry.slot), idx)
+
+        self._by_offset = None
+        return idx
+
+    def owners_of(self, klass: str) -> List[str]:
+        """Qualified owners for "Player" / "Game.Player" (several if namespaces collide)."""
+        owners = [klass] if klass in self.by_class else []
+        return owners + self.class_aliases.get(klass, [])
+
+    def _add_slot(self, owner: str, klass: str, slot: int, idx: int) -> None:
+        table = self.slots.get(owner)
+        if table is None:
+            table = self.slots[owner] = array("i")
+            self.slots.setdefault(klass, table)
+        if slot >= len(table):
+            table.extend([-1] * (slot + 1 - len(table)))
+        table[slot] = idx
+
+    def add_field(self, namespace: str, klass: str, name: str, offset: int) -> None:
+        """Record `klass.name` at `offset` (bare class name aliases the first owner)."""
+        owner = f"{namespace}.{klass}" if namespace else klass
+        table = self.fields.get(owner)
+        if table is None:
+            table = self.fields[owner] = {}
+            self.fields.setdefault(klass, table)
+        table[name] = offset
+        self.field_owners.setdefault(name, []).append(owner)
+
+    # ---------------------------------------------------------
+    def lookup(self, name: str) -> List[DumpEntry]:
+        """
+        Return every entry matching `name`, which may be:
+            "TakeDamage"
+            "Player::TakeDamage" / "Game.Player::TakeDamage"
+            "Game.Player::TakeDamage(int,bool)"
+        """
+        if not name:
+            return []
+
+        if "(" in name:
+            idx = self.qualified.get(signature_key(name))
+            return [] if idx is None else [self.entries[idx]]
+
+        if "::" in name:
+            klass, _, method = name.rpartition("::")
+            ids = []
+            for owner in self.owners_of(klass):
+                ids.extend(self.by_member.get(f"{owner}::{method}", ()))
+        else:
+            ids = self.by_name.get(name, ())
+        return [self.entries[i] for i in ids]
+
+    def resolve(self, name: str, offset: Optional[str] = None) -> Optional[DumpEntry]:
+        """
+        Single best entry for `name`: the last declared overload, like the
+        mapping. With `offset`, an overload at that offset is preferred, and
+        None is returned when `name` has several and none is there.
+        """
+        found = self.lookup(name)
+        if len(found) > 1 and offset:
+            want = int(str(offset), 16)
+            found = [e for e in found if int(e.offset, 16) == want]
+        return found[-1] if found else None
+
+    def methods_of(self, klass: str) -> List[DumpEntry]:
+        """All methods declared by `klass` ("Player" or "Game.Player")."""
+        return [self.entries[i] for owner in self.owners_of(klass) for i in self.by_class[owner]]
+
+    def field_offset(self, klass: str, name: str) -> Optional[int]:
+        """Offset of field `name` in `klass` ("Player" or "Game.Player"), or None."""
+        return self.fields.get(klass, {}).get(name)
+
+    def by_slot(self, klass: str, slot: int) -> Optional[DumpEntry]:
+        """Method occupying vtable `slot` of `klass`, or None."""
+        table = self.slots.get(klass)
+        if table is None or not 0 <= slot < len(table) or table[slot] < 0:
+            return None
+        return self.entries[table[slot]]
+
+    def find_offset(self, offset: str) -> Optional[DumpEntry]:
+        """Entry whose Offset equals `offset` ("0x1A2B" or "1a2b"); index built on first use."""
+        if self._by_offset is None:
+            self._by_offset = {int(e.offset, 16): i for i, e in enumerate(self.entries)}
+        try:
+            idx = self._by_offset.get(int(str(offset), 16))
+        except ValueError:
+            return None
+        return None if idx is None else self.entries[idx]
 
 
 class DumpParser:
@@ -28,6 +351,9 @@ class DumpParser:
        - Metadata & function not adjacent
        - Missing slot
        - Fallback signatures (int get_attack())
+
+    Tracks the surrounding `// Namespace:` and `class X` context so every
+    overload is indexed under its qualified name (see DumpIndex).
     """
 
     # --- Metadata regex ---
@@ -41,42 +367,136 @@ class DumpParser:
     # --- Full signature extraction ---
     RE_FUNCTION_NAME = re.compile(
         r"(?:public|private|protected|internal|static|\s)+\s*"
-        r"(?:[\w<>\[\], ]+)\s+([A-Za-z0-9_]+)\s*\(",
+        r"(?:[\w<>\[\], ]+)\s+(\.?[A-Za-z0-9_]+)\s*\(",
         re.IGNORECASE
     )
 
     # --- Fallback signature ---
     RE_FUNCTION_FALLBACK = re.compile(
-        r"\b([A-Za-z0-9_]+)\s*\("
+        r"(\.?\b[A-Za-z0-9_]+)\s*\("
     )
 
-    def parse(self, path: str) -> dict:
+    # --- Type declaration: public sealed class Player : MonoBehaviour // TypeDefIndex: 12 ---
+    # The name may hold <...> anywhere: generics (Dictionary<TKey, TValue>) and
+    # compiler-generated classes (<>c, <Start>d__5, Player.<>c__DisplayClass3_0).
+    # Shared by formats.RE_CS_RECORD and class_diff.ClassHasher.
+    CLASS_DECL = (
+        r"(?:(?:public|private|protected|internal|static|sealed|abstract|"
+        r"readonly|unsafe|partial|ref)\s+)*"
+        r"(?:class|struct|interface|enum)\s+"
+        r"(?P<cls>(?:[\w.`]|<[^>\r\n]*>)+)"
+    )
+    RE_CLASS = re.compile(CLASS_DECL)
+
+    # --- Parameter name (+ default value) following its type ---
+    RE_PARAM_NAME = re.compile(r"\s+@?[A-Za-z_]\w*(?:\s*=[^,]*)?(?=,|$)")
+
+    NAMESPACE_PREFIX = "// Namespace:"
+
+    # Field lines end with their offset: "public int hp; // 0x18"
+    FIELD_MARKER = "; // 0x"
 
-        dump_map = {}
+    # parse_cs reports progress / checks cancellation every PROGRESS_LINES + 1 lines
+    PROGRESS_LINES = 0xFFFF
+
+    # ---------------------------------------------------------
+    @classmethod
+    def _param_types(cls, params: str) -> str:
+        """
+        Reduce a parameter list to its types, spaced by signature_key:
+            "int amount, Dictionary<int, string> map = null" → "int,Dictionary<int,string>"
+            "ref int hp, params object[] args" → "ref int,params object[]"
+        """
+        if not params or params.isspace():
+            return ""
+        return signature_key(cls.RE_PARAM_NAME.sub("", params))
+
+    # ---------------------------------------------------------
+    def parse(self, path: str, format: Optional[str] = None,
+              progress: Optional[ProgressCallback] = None,
+              cancel: Optional[CancelToken] = None) -> DumpIndex:
+        """
+        Parse any supported dump. The format (dump.cs, script.json, #define
+        tables, ...) is sniffed from the first bytes unless `format` names a
+        registered backend; see offset_updater.formats. The returned index
+        carries `.stats` (format, bytes, seconds, MB/s).
+
+        `progress` receives ProgressEvents (stage "parse": bytes read,
+        entries so far) while the file is read; setting `cancel` makes the
+        parse raise progress.Cancelled at the next checkpoint.
+        """
+        from .formats import parse_dump
+        return parse_dump(path, format=format, progress=progress, cancel=cancel)
+
+    # ---------------------------------------------------------
+    def parse_cs(self, path: str, tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+        """Line-by-line dump.cs engine (tolerates irregular layouts)."""
+
+        dump_map = DumpIndex()
         pending_meta = None     # store metadata until function appears
         line_no = 0
+        namespace = ""
+        klass = ""
 
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
             for line in f:
                 line_no += 1
+                if tracker is not None and not line_no & self.PROGRESS_LINES:
+                    tracker.update(f.buffer.tell(), len(dump_map.entries))
                 stripped = line.strip()
 
+                # --------------------------
+                # 0. Namespace / class context
+                # --------------------------
+                if stripped.startswith(self.NAMESPACE_PREFIX):
+                    namespace = stripped[len(self.NAMESPACE_PREFIX):].strip()
+                    continue
+
+                if line.startswith("}"):
+                    klass = ""
+                    continue
+
+                if pending_meta is None:
+                    decl = self.RE_CLASS.match(stripped)
+                    if decl:
+                        klass = decl.group(1)
+                        continue
+
+                # --------------------------
+                # 0b. Field offsets (class → field → int)
+                # --------------------------
+                if klass and self.FIELD_MARKER in stripped:
+                    decl, _, tail = stripped.partition(self.FIELD_MARKER)
+                    try:
+                        offset = int(tail.split(None, 1)[0], 16)
+                    except (IndexError, ValueError):
+                        continue
+                    decl = decl.split("=", 1)[0].rstrip()
+                    dump_map.add_field(namespace, klass, decl.rsplit(None, 1)[-1], offset)
+                    continue
+
                 # --------------------------
                 # 1. Detect metadata FIRST
                 # --------------------------
-                meta = self.RE_META.search(stripped)
-                if meta:
-                    pending_meta = {
-                        "rva": meta.group(1),
-                        "offset": meta.group(2),
-                        "va": meta.group(3),
-                        "slot": meta.group(4) or "",
-                        "raw": stripped,
-                        "line": line_no
-                    }
-                    # Do NOT continue — metadata may be on same line as function
-                    # Continue scanning for function name
-                
+                if "RVA:" in stripped:
+                    meta = self.RE_META.search(stripped)
+                    if meta:
+                        pending_meta = {
+                            "rva": meta.group(1),
+                            "offset": meta.group(2),
+                            "va": meta.group(3),
+                            "slot": meta.group(4) or "",
+                            "raw": stripped,
+                            "line": line_no
+                        }
+                        # Metadata may share a line with the function; a pure
+                        # comment line cannot, so skip the costly name regex
+                        if stripped.startswith("//"):
+                            continue
+
+                # No metadata found earlier → cannot be a usable function entry
+                if not pending_meta:
+                    continue
 
                 # --------------------------
                 # 2. Detect function name
@@ -87,21 +507,22 @@ class DumpParser:
 
                 if m:
                     func_name = m.group(1)
-
-                    # No metadata found earlier → invalid function entry
-                    if not pending_meta:
-                        continue
+                    close = stripped.rfind(")")
+                    signature = self._param_types(stripped[m.end():close]) if close >= m.end() else ""
 
                     # Store final mapping
-                    dump_map[func_name] = DumpEntry(
+                    dump_map.add(DumpEntry(
                         name=func_name,
                         offset=pending_meta["offset"],
                         rva=pending_meta["rva"],
                         va=pending_meta["va"],
                         slot=pending_meta["slot"],
                         line_no=pending_meta["line"],
-                        raw=pending_meta["raw"]
-                    )
+                        raw=pending_meta["raw"],
+                        namespace=namespace,
+                        klass=klass,
+                        signature=signature
+                    ))
 
                     # Reset metadata after use
                     pending_meta = None
@@ -0,0 +1,388 @@
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+from .dump_parser import DumpEntry, DumpIndex, DumpParser
+from .progress import CancelToken, ProgressCallback, ProgressTracker
+
+
+# -------------------------------------------------------------
+# 📊 Parse statistics
+# -------------------------------------------------------------
+
+@dataclass
+class ParseStats:
+    format: str
+    bytes: int
+    seconds: float
+    entries: int
+
+    @property
+    def mb_per_sec(self) -> float:
+        return (self.bytes / (1024 * 1024)) / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.format}: {self.entries} entries, "
+                f"{self.bytes / (1024 * 1024):.1f} MB in {self.seconds:.2f}s "
+                f"({self.mb_per_sec:.1f} MB/s)")
+
+
+# -------------------------------------------------------------
+# 🗂️ Registry
+# -------------------------------------------------------------
+
+@dataclass
+class DumpFormat:
+    """
+    A dump backend:
+        sniff(head) → confidence 0..100 from the first SNIFF_SIZE chars
+        parse(path, tracker=None) → DumpIndex
+
+    `tracker` (a ProgressTracker, may be None) should be updated every few
+    MB with the byte position; its update() raises Cancelled on request.
+    """
+    name: str
+    description: str
+    sniff: Callable[[str], int]
+    parse: Callable[..., DumpIndex]
+
+
+SNIFF_SIZE = 16 * 1024
+BLOCK_SIZE = 4 * 1024 * 1024
+
+_FORMATS: Dict[str, DumpFormat] = {}
+
+
+def register_format(fmt: DumpFormat) -> DumpFormat:
+    """Add (or replace) a backend; later sniff ties go to earlier registrations."""
+    _FORMATS[fmt.name] = fmt
+    return fmt
+
+
+def available_formats() -> List[str]:
+    return list(_FORMATS)
+
+
+def get_format(name: str) -> DumpFormat:
+    try:
+        return _FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown dump format '{name}'. Known: {', '.join(_FORMATS)}")
+
+
+def read_head(path: str, size: int = SNIFF_SIZE) -> str:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read(size).lstrip("\ufeff")
+
+
+def detect_format(path: str) -> DumpFormat:
+    """Pick the backend whose sniffer is most confident; dump.cs when nobody is."""
+    head = read_head(path)
+    best, best_score = _FORMATS["dump-cs"], 0
+    for fmt in _FORMATS.values():
+        score = fmt.sniff(head)
+        if score > best_score:
+            best, best_score = fmt, score
+    return best
+
+
+def parse_dump(path: str, format: Optional[str] = None,
+               progress: Optional[ProgressCallback] = None,
+               cancel: Optional[CancelToken] = None) -> DumpIndex:
+    """Parse `path` with the named or sniffed backend and attach `.stats`."""
+    fmt = get_format(format) if format else detect_format(path)
+
+    tracker = None
+    if progress is not None or cancel is not None:
+        tracker = ProgressTracker("parse", progress, cancel, bytes_total=os.path.getsize(path))
+
+    start = time.perf_counter()
+    index = fmt.parse(path, tracker)
+    if tracker is not None:
+        tracker.count(index.entries).finish()
+    index.stats = ParseStats(
+        format=fmt.name,
+        bytes=os.path.getsize(path),
+        seconds=time.perf_counter() - start,
+        entries=len(index.entries),
+    )
+    return index
+
+
+# -------------------------------------------------------------
+# 🧱 Shared helpers
+# -------------------------------------------------------------
+
+def _read_blocks(path: str, continues: Optional[Callable[[str], bool]] = None,
+                 tracker: Optional[ProgressTracker] = None) -> Iterator[str]:
+    """
+    Yield ~BLOCK_SIZE text blocks ending on line boundaries. `continues(last_line)`
+    keeps reading while a multi-line record would otherwise be split.
+    `tracker` hears the byte position once each block has been consumed.
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        while True:
+            lines = f.readlines(BLOCK_SIZE)
+            if not lines:
+                return
+            if continues is not None:
+                while continues(lines[-1]):
+                    nxt = f.readline()
+                    if not nxt:
+                        break
+                    lines.append(nxt)
+            yield "".join(lines)
+            if tracker is not None:
+                tracker.update(f.buffer.tell())
+
+
+def _split_owner(name: str):
+    """'Game.Player::TakeDamage' → ('Game', 'Player', 'TakeDamage')."""
+    owner, sep, method = name.rpartition("::")
+    if not sep:
+        return "", "", name
+    namespace, _, klass = owner.rpartition(".")
+    return namespace, klass, method
+
+
+def _scan_pairs(path: str, pattern: "re.Pattern", name_group: str, offset_group: str,
+                tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+    """One compiled finditer per block for simple 'name ↔ 0xHEX' formats."""
+    index = DumpIndex()
+    if tracker is not None:
+        tracker.count(index.entries)
+    line_no = 1
+    for block in _read_blocks(path, tracker=tracker):
+        last = 0
+        for m in pattern.finditer(block):
+            line_no += block.count("\n", last, m.start())
+            last = m.start()
+            offset = m.group(offset_group).upper().replace("0X", "0x")
+            namespace, klass, method = _split_owner(m.group(name_group))
+            index.add(DumpEntry(
+                name=method, offset=offset, rva="", va="", slot="",
+                line_no=line_no, raw=m.group(0).strip(),
+                namespace=namespace, klass=klass,
+            ))
+        line_no += block.count("\n", last)
+    return index
+
+
+def _count_ratio(pattern: "re.Pattern", head: str, weight: int = 10) -> int:
+    """Confidence from how many lines in the head match `pattern`."""
+    hits = len(pattern.findall(head))
+    return min(90, hits * weight)
+
+
+# -------------------------------------------------------------
+# 🎯 Il2CppDumper dump.cs — compiled single-pass scanner
+# -------------------------------------------------------------
+
+RE_CS_RECORD = re.compile(
+    r"^// Namespace: ?(?P<ns>[^\r\n]*)"
+    r"|^[ \t]*" + DumpParser.CLASS_DECL +
+    r"|^(?P<end>\})"
+    r"|^[ \t]*(?P<field>[^\r\n;(/]+?); // 0x(?P<foff>[0-9A-Fa-f]+)"
+    r"|^[ \t]*// (?P<meta>RVA: (?P<rva>0x[0-9A-Fa-f]+) Offset: (?P<off>0x[0-9A-Fa-f]+) "
+    r"VA: (?P<va>0x[0-9A-Fa-f]+)(?: Slot: (?P<slot>\d+))?)[^\r\n]*\r?\n"
+    r"(?:[ \t]*\[[^\r\n]*\r?\n)*"
+    r"[ \t]*(?P<sig>[^\r\n]*)",
+    re.MULTILINE
+)
+
+RE_CS_SNIFF = re.compile(r"^[ \t]*// RVA: 0x[0-9A-Fa-f]+ Offset: 0x[0-9A-Fa-f]+ VA: 0x", re.MULTILINE)
+
+
+def _cs_continues(line: str) -> bool:
+    stripped = line.lstrip()
+    return stripped.startswith("// RVA:") or stripped.startswith("[")
+
+
+def parse_il2cppdumper_cs(path: str, tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+    """
+    Standard Il2CppDumper layout: every method is preceded by its own
+    '// RVA: .. Offset: .. VA: ..' comment line (attributes may sit in
+    between). One alternation regex walks each block in C, so lines that
+    are neither context, field nor metadata are never looked at in Python.
+    """
+    index = DumpIndex()
+    name_re = DumpParser.RE_FUNCTION_NAME
+    fallback_re = DumpParser.RE_FUNCTION_FALLBACK
+    param_types = DumpParser._param_types
+    signatures: Dict[str, str] = {}    # raw parameter text → types (lists repeat a lot)
+
+    namespace = ""
+    klass = ""
+    line_no = 1
+
+    if tracker is not None:
+        tracker.count(index.entries)
+
+    for block in _read_blocks(path, _cs_continues, tracker):
+        last = 0
+        for m in RE_CS_RECORD.finditer(block):
+            kind = m.lastgroup
+            if m.group("meta") is not None:
+                line_no += block.count("\n", last, m.start())
+                last = m.start()
+
+                # "public virtual int get_attack(int a) { }" → name before the first "("
+                sig = m.group("sig")
+                open_at = sig.find("(")
+                name = sig[sig.rfind(" ", 0, open_at) + 1:open_at] if open_at > 0 else ""
+                if name.isidentifier() or (name[:1] == "." and name[1:].isidentifier()):
+                    start = open_at + 1
+                else:
+                    fn = name_re.search(sig) or fallback_re.search(sig)
+                    if not fn:
+                        continue
+                    name, start = fn.group(1), fn.end()
+
+                close = sig.rfind(")")
+                params = sig[start:close] if close >= start else ""
+                signature = signatures.get(params)
+                if signature is None:
+                    signature = signatures[params] = param_types(params)
+
+                index.add(DumpEntry(
+                    name=name,
+                    offset=m.group("off"),
+                    rva=m.group("rva"),
+                    va=m.group("va"),
+                    slot=m.group("slot") or "",
+                    line_no=line_no,
+                    raw="// " + m.group("meta"),
+                    namespace=namespace,
+                    klass=klass,
+                    signature=signature,
+                ))
+            elif kind == "ns":
+                namespace = m.group("ns").strip()
+            elif kind == "cls":
+                klass = m.group("cls")
+            elif kind == "end":
+                klass = ""
+            elif kind == "foff" and klass:
+                decl = m.group("field").split("=", 1)[0].rstrip()
+                index.add_field(namespace, klass, decl.rsplit(None, 1)[-1], int(m.group("foff"), 16))
+        line_no += block.count("\n", last)
+
+    return index
+
+
+register_format(DumpFormat(
+    name="il2cppdumper-cs",
+    description="Il2CppDumper dump.cs (one '// RVA:' line per method)",
+    sniff=lambda head: 95 if RE_CS_SNIFF.search(head) else 0,
+    parse=parse_il2cppdumper_cs,
+))
+
+register_format(DumpFormat(
+    name="dump-cs",
+    description="dump.cs with irregular layout (line-by-line engine)",
+    sniff=lambda head: 50 if "RVA:" in head else 0,
+    parse=lambda path, tracker=None: DumpParser().parse_cs(path, tracker),
+))
+
+
+# -------------------------------------------------------------
+# 🎯 Il2CppDumper script.json — streaming JSON
+# -------------------------------------------------------------
+
+def _sniff_script_json(head: str) -> int:
+    head = head.lstrip()
+    if head.startswith("{") and '"ScriptMethod"' in head:
+        return 100
+    if head.startswith("{") and '"Script' in head:
+        return 80
+    return 0
+
+
+def _parse_script_json(path: str, tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+    from .script_json import ScriptJsonParser
+    return ScriptJsonParser().parse(path, tracker)
+
+
+register_format(DumpFormat(
+    name="script-json",
+    description="Il2CppDumper script.json (ScriptMethod array)",
+    sniff=_sniff_script_json,
+    parse=_parse_script_json,
+))
+
+
+# -------------------------------------------------------------
+# 🎯 #define / constexpr offset tables (offsets.h)
+# -------------------------------------------------------------
+
+RE_DEFINE = re.compile(
+    r"^[ \t]*(?:#define[ \t]+(?P<dname>[A-Za-z_][\w]*)[ \t]+\(?(?P<doff>0x[0-9A-Fa-f]+)"
+    r"|(?:static[ \t]+)?(?:inline[ \t]+)?constexpr[ \t]+[\w:]+[ \t]+(?P<cname>[A-Za-z_][\w]*)"
+    r"[ \t]*=[ \t]*(?P<coff>0x[0-9A-Fa-f]+))",
+    re.MULTILINE
+)
+
+
+def parse_defines(path: str, tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+    index = DumpIndex()
+    if tracker is not None:
+        tracker.count(index.entries)
+    line_no = 1
+    for block in _read_blocks(path, tracker=tracker):
+        last = 0
+        for m in RE_DEFINE.finditer(block):
+            line_no += block.count("\n", last, m.start())
+            last = m.start()
+            name = m.group("dname") or m.group("cname")
+            offset = m.group("doff") or m.group("coff")
+            index.add(DumpEntry(
+                name=name, offset=offset, rva="", va="", slot="",
+                line_no=line_no, raw=m.group(0).strip(),
+            ))
+        line_no += block.count("\n", last)
+    return index
+
+
+register_format(DumpFormat(
+    name="defines",
+    description="#define NAME 0xHEX / constexpr uintptr_t NAME = 0xHEX tables",
+    sniff=lambda head: _count_ratio(RE_DEFINE, head, weight=20),
+    parse=parse_defines,
+))
+
+
+# -------------------------------------------------------------
+# 🎯 Inline "name(...) ... 0xHEX" exports
+# -------------------------------------------------------------
+
+RE_INLINE = re.compile(
+    r"^[ \t]*(?:[\w<>\[\],*& ]+[ \t]+)?(?P<name>[A-Za-z_][\w:<>.]*)[ \t]*\([^)\r\n]*\)[^\r\n]*?(?P<addr>0x[0-9A-Fa-f]+)",
+    re.MULTILINE
+)
+
+register_format(DumpFormat(
+    name="inline",
+    description="one method per line: 'Name(args) ... 0xHEX'",
+    sniff=lambda head: _count_ratio(RE_INLINE, head),
+    parse=lambda path, tracker=None: _scan_pairs(path, RE_INLINE, "name", "addr", tracker),
+))
+
+
+# -------------------------------------------------------------
+# 🎯 "0xHEX : Name" symbol maps
+# -------------------------------------------------------------
+
+RE_HEXMAP = re.compile(
+    r"^[ \t]*(?P<addr>0x[0-9A-Fa-f]+)[ \t]*[:\-][ \t]*(?P<name>[A-Za-z_][\w:<>.]*)",
+    re.MULTILINE
+)
+
+register_format(DumpFormat(
+    name="hexmap",
+    description="symbol maps: '0xHEX : Name' / '0xHEX - Name'",
+    sniff=lambda head: _count_ratio(RE_HEXMAP, head),
+    parse=lambda path, tracker=None: _scan_pairs(path, RE_HEXMAP, "name", "addr", tracker),
+))
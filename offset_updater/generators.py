@@ -1,4 +1,14 @@
-from typing import Dict, List
+import json
+import re
+from typing import IO, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from .templates import SnippetRenderer, StyleSpec, normalize_offset, write_lines
+
+# {name: (old offset or None, new offset)}, or the same as (name, (old, new)) pairs
+Changes = Union[Mapping[str, Tuple[Optional[str], str]], Iterable[Tuple[str, Tuple[Optional[str], str]]]]
+
+# lines per write() of the streaming writers
+WRITE_BATCH = 4096
 
 
 class CodeGenerator:
@@ -6,15 +16,24 @@ class CodeGenerator:
     Produces:
         - Updated HOOK(...) lines
         - Updated LOGD(...) lines
+        - Offset tables (#define / constexpr) and JSON maps, streamed to files
         - Mapping for auto-patching source files
         - GUI/CLI-friendly report payloads
+
+    HOOK / LOGD lines follow `snippet_style`: a templates.PRESETS name,
+    a SnippetStyle or a config dict (see offset_updater.templates).
     """
 
+    # qualified names (Class::Method) are not C identifiers
+    NON_IDENTIFIER = re.compile(r'\W')
+
+    def __init__(self, snippet_style: StyleSpec = None):
+        self.snippets = SnippetRenderer(snippet_style)
+
     # ------------------------------------------------------------------
     def _normalize_offset(self, hex_str: str) -> str:
         """Ensure always '0xDEADBEEF' format."""
-        hex_str = hex_str.strip().lower().replace("0x", "")
-        return f"0x{hex_str.upper()}"
+        return normalize_offset(hex_str)
 
     # ------------------------------------------------------------------
     def generate_hook_snippets(self, updates: List[Dict]) -> str:
@@ -28,20 +47,11 @@ class CodeGenerator:
             HOOK("libil2cpp.so", 0x31557C0, Subtract, orig_Subtract);
         """
 
-        lines = []
-        for entry in updates:
-            func = entry["func"]
-            orig = entry.get("orig", "") or ""
-            offset = self._normalize_offset(entry["offset"])
-
-            if orig:
-                line = f'HOOK("libil2cpp.so", {offset}, {func}, {orig});'
-            else:
-                line = f'HOOK("libil2cpp.so", {offset}, {func});'
-
-            lines.append(line)
+        return "\n".join(self.iter_hook_snippets(updates))
 
-        return "\n".join(lines)
+    def iter_hook_snippets(self, updates: Iterable[Dict]) -> Iterator[str]:
+        """generate_hook_snippets, one line at a time."""
+        return self.snippets.iter_hooks(updates)
 
     # ------------------------------------------------------------------
     def generate_logd_snippets(self, updates: List[Dict]) -> str:
@@ -55,17 +65,108 @@ class CodeGenerator:
             LOGD(OBFUSCATE("Updated Offset | Subtract : 0x31557C0"));
         """
 
-        lines = []
-        for entry in updates:
-            func = entry["func"]
-            offset = self._normalize_offset(entry["offset"])
+        return "\n".join(self.iter_logd_snippets(updates))
+
+    def iter_logd_snippets(self, updates: Iterable[Dict]) -> Iterator[str]:
+        """generate_logd_snippets, one line at a time."""
+        return self.snippets.iter_logd(updates)
+
+    # ------------------------------------------------------------------
+    def iter_changes(self, analysis: Dict) -> Iterator[Tuple[str, Tuple[Optional[str], str]]]:
+        """
+        (name, (old, new)) for every outdated function of
+        OffsetAnalyzer.analyze() results, offsets as '0xDEADBEEF'.
+        """
+        for row in analysis.get("outdated", []):
+            old = row.get("old_offset")
+            yield row["func"], (self._normalize_offset(old) if old else None,
+                                self._normalize_offset(row["new_offset"]))
+
+    @staticmethod
+    def _change_items(changes: Changes) -> Iterable[Tuple[str, Tuple[Optional[str], str]]]:
+        return changes.items() if isinstance(changes, Mapping) else changes
+
+    # ------------------------------------------------------------------
+    def generate_cpp_definitions(self, changes: Changes, style: str = "define") -> str:
+        """
+        Offset table lines for the new offsets.
+
+        Input:
+            {"get_PlayerHealth": ("0x11111", "0x22222")}
+
+        Output:
+            #define get_PlayerHealth 0x22222
+            (style="constexpr": constexpr uintptr_t get_PlayerHealth = 0x22222;)
+        """
+
+        return "\n".join(self.iter_cpp_definitions(changes, style))
+
+    def iter_cpp_definitions(self, changes: Changes, style: str = "define") -> Iterator[str]:
+        """generate_cpp_definitions, one line at a time."""
+        if style == "define":
+            line = "#define {} {}"
+        elif style == "constexpr":
+            line = "constexpr uintptr_t {} = {};"
+        else:
+            raise ValueError(f"unknown offset table style: {style!r} (use 'define' or 'constexpr')")
 
-            line = (
-                f'LOGD(OBFUSCATE("Updated Offset | {func} : {offset}"));'
-            )
-            lines.append(line)
+        sub = self.NON_IDENTIFIER.sub
+        for name, (_, new) in self._change_items(changes):
+            yield line.format(sub("_", name), self._normalize_offset(new))
 
-        return "\n".join(lines)
+    def write_cpp_definitions(self, fp: IO[str], changes: Changes, style: str = "define") -> int:
+        """
+        Stream an offsets header (offsets_updated.h) to fp: a short preamble,
+        then iter_cpp_definitions written in batches, so the table is never
+        held in memory as one string. Returns the number of entries.
+        """
+        fp.write("// Generated by Offset Updater\n#pragma once\n")
+        if style == "constexpr":
+            fp.write("#include <cstdint>\n")
+        fp.write("\n")
+        return self._write_lines(fp, self.iter_cpp_definitions(changes, style))
+
+    # ------------------------------------------------------------------
+    def generate_json(self, changes: Changes) -> Dict[str, str]:
+        """
+        Name → new offset map.
+
+        Input:
+            {"FuncA": ("0x100", "0x200")}
+
+        Output:
+            {"FuncA": "0x200"}
+        """
+
+        return {name: new for name, (_, new) in self._change_items(changes)}
+
+    def write_json(self, fp: IO[str], changes: Changes) -> int:
+        """
+        Stream generate_json(changes) to fp as an indented JSON object, one
+        entry at a time (same layout as json.dump(..., indent=4)).
+        Returns the number of entries.
+        """
+        dumps = json.dumps
+        entries = (f"    {dumps(name)}: {dumps(new)}" for name, (_, new) in self._change_items(changes))
+
+        fp.write("{")
+        count = 0
+        batch = []
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) == WRITE_BATCH:
+                fp.write(("," if count else "") + "\n" + ",\n".join(batch))
+                count += len(batch)
+                batch = []
+        if batch:
+            fp.write(("," if count else "") + "\n" + ",\n".join(batch))
+            count += len(batch)
+        fp.write("\n}\n" if count else "}\n")
+        return count
+
+    @staticmethod
+    def _write_lines(fp: IO[str], lines: Iterable[str]) -> int:
+        return write_lines(fp, lines, WRITE_BATCH)
 
     # ------------------------------------------------------------------
     def generate_replacement_map(self, outdated_list: List[Dict]) -> Dict[str, str]:
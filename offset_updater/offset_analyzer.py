@@ -1,4 +1,10 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from .dump_parser import DumpIndex
+from .progress import CancelToken, ProgressCallback, ProgressTracker
+
+# hooks resolved between progress/cancel checkpoints
+PROGRESS_ITEMS = 1024
 
 
 class OffsetAnalyzer:
@@ -6,16 +12,33 @@ class OffsetAnalyzer:
     Takes:
         dump_data  → parsed from dump.cs
         source_data → parsed from main.cpp (HOOKS, LOGD, ORIGINALS)
+        previous_dump → optional DumpIndex of the build the source was written
+                        against; enables vtable-slot matching of renamed methods
+        class_changes → optional ClassHasher.diff(previous, current); for
+                        classes listed as unchanged the field pass is skipped
+                        (their field layout is the same) and hooks are only
+                        looked up exactly (their methods kept their names;
+                        only offsets move), never by slot or fuzzy match
 
     Produces:
         updated_offsets
         missing offsets
         outdated offsets
+        ambiguous hooks (overloaded name, no overload at the hook's offset;
+                         never patched)
         unused dump entries
     """
 
-    def __init__(self, dump_data: Dict[str, Any], source_data: Dict):
+    def __init__(self, dump_data: Dict[str, Any], source_data: Dict,
+                 previous_dump: Optional[DumpIndex] = None,
+                 class_changes: Optional[Dict[str, List[str]]] = None):
         self.dump_raw = dump_data or {}
+        self.previous = previous_dump
+        self.class_changes = class_changes
+        self.unchanged_classes = set((class_changes or {}).get("unchanged", ()))
+
+        # Qualified multi-map (Class::Method, overloads) when parsed by DumpParser
+        self.index = dump_data if isinstance(dump_data, DumpIndex) else None
 
         # Normalize: method → "hex"
         self.dump = {}
@@ -26,25 +49,70 @@ class OffsetAnalyzer:
         self.src = source_data or {}
 
     # ===================================================================
-    def analyze(self) -> Dict[str, Any]:
+    def analyze(self, progress: Optional[ProgressCallback] = None,
+                cancel: Optional[CancelToken] = None) -> Dict[str, Any]:
+        """
+        `progress` gets an "analyze" ProgressEvent every PROGRESS_ITEMS hooks
+        (items = hooks resolved); `cancel` aborts there with Cancelled.
+        """
         hook_map = self._extract_hook_map()      # func → old_offset
         log_map = self._extract_log_map()        # func → log_offset
 
         updated = []
         outdated = []
         missing = []
+        ambiguous = []
+
+        tracker = None
+        if progress is not None or cancel is not None:
+            tracker = ProgressTracker("analyze", progress, cancel, items_total=len(hook_map))
+
+        for done, (func, old_offset) in enumerate(hook_map.items()):
+            if tracker is not None and done % PROGRESS_ITEMS == 0:
+                tracker.update(items=done)
 
-        for func, old_offset in hook_map.items():
             old_norm = self._normalize(old_offset)
 
-            # 1) exact lookup
-            new_off = self.dump.get(func)
+            # 0) overloaded name: the hook keeps the overload it points at;
+            #    when none is there, which one it meant is unknown
+            overloads = self._overload_offsets(func)
+            if len(overloads) > 1:
+                if old_norm not in overloads:
+                    ambiguous.append({
+                        "func": func,
+                        "old_offset": old_norm,
+                        "candidates": overloads,
+                        "log_offset": log_map.get(func)
+                    })
+                continue
+
+            # 1) exact lookup (qualified names hit the DumpIndex multi-map)
+            new_off = self._exact_lookup(func)
+            match = "exact"
+            slot_info = None
 
-            # 2) fuzzy match if not found
+            # unchanged class: same method names, so a miss is not a rename
+            if not new_off and self.unchanged_classes and self._in_unchanged_class(func):
+                missing.append({
+                    "func": func,
+                    "old_offset": old_norm,
+                    "log_offset": log_map.get(func)
+                })
+                continue
+
+            # 2) renamed virtual method: same class + vtable slot as before
+            if not new_off:
+                slot_info = self._slot_lookup(func, old_norm)
+                if slot_info:
+                    new_off = self._normalize(slot_info["entry"].offset)
+                    match = "slot"
+
+            # 3) fuzzy match if not found
             if not new_off:
                 new_off = self._fuzzy_lookup(func)
+                match = "fuzzy"
 
-            # 3) nothing found anywhere
+            # 4) nothing found anywhere
             if not new_off:
                 missing.append({
                     "func": func,
@@ -53,31 +121,134 @@ class OffsetAnalyzer:
                 })
                 continue
 
-            # 4) compare old vs new
+            # 5) compare old vs new
             if old_norm != new_off:
-                outdated.append({
+                row = {
                     "func": func,
                     "old_offset": old_norm,
                     "new_offset": new_off,
-                    "log_offset": log_map.get(func)
-                })
+                    "log_offset": log_map.get(func),
+                    "match": match
+                }
+                if slot_info:
+                    row["slot"] = slot_info["slot"]
+                    row["matched_name"] = slot_info["entry"].name
+                outdated.append(row)
 
                 updated.append({
                     "func": func,
-                    "offset": new_off
+                    "offset": new_off,
+                    "match": match
                 })
 
         # dump methods never used in hooks
         unused_dump = [k for k in self.dump.keys() if k not in hook_map]
 
+        outdated_fields, missing_fields = self._analyze_fields()
+        if tracker is not None:
+            tracker.finish()
+
+        summary = self._create_summary(updated, outdated, missing, unused_dump)
+        summary["outdated_field_count"] = len(outdated_fields)
+        summary["missing_field_count"] = len(missing_fields)
+        summary["ambiguous_count"] = len(ambiguous)
+        if self.class_changes is not None:
+            summary["changed_class_count"] = len(self.class_changes.get("changed", []))
+
         return {
             "updated": updated,
             "outdated": outdated,
             "missing": missing,
+            "ambiguous": ambiguous,
             "unused_dump": unused_dump,
-            "summary": self._create_summary(updated, outdated, missing, unused_dump)
+            "outdated_fields": outdated_fields,
+            "missing_fields": missing_fields,
+            "class_changes": self.class_changes,
+            "summary": summary
         }
 
+    # ===================================================================
+    def _analyze_fields(self):
+        """
+        Compare *(T*)((uintptr_t)obj + 0xOFF) accesses against the dump's
+        field index.
+
+        Named accesses ("// Player::hp", or "// hp" when the dump has a field
+        hp) are checked by name; any other comment ("// god mode on") counts
+        as unnamed. Unnamed ones are checked only when `obj` names a class
+        (player → Player), and are reported missing when no field of that
+        class sits at the offset.
+        """
+        outdated, missing = [], []
+        if self.index is None or not self.index.fields:
+            return outdated, missing
+
+        classes_lc = {k.lower(): k for k in self.index.fields}
+
+        for item in self.src.get("FIELDS", []):
+            if not isinstance(item, dict):
+                continue
+            old_norm = self._normalize(item.get("offset"))
+            try:
+                old_val = int(old_norm, 16)
+            except ValueError:
+                continue
+
+            owner, name = self._resolve_field_owner(item, classes_lc)
+            if owner and self._is_unchanged_class(owner):
+                continue
+
+            if name is None:
+                table = self.index.fields.get(owner) if owner else None
+                if table is not None and old_val not in table.values():
+                    missing.append({**item, "class": owner, "name": None, "old_offset": old_norm})
+                continue
+
+            # "field" keeps the source label ("Player::hp"); "name" is the bare field
+            new_val = self.index.field_offset(owner, name) if owner else None
+            if new_val is None:
+                missing.append({**item, "class": owner, "name": name, "old_offset": old_norm})
+            elif new_val != old_val:
+                outdated.append({
+                    **item,
+                    "class": owner,
+                    "name": name,
+                    "old_offset": old_norm,
+                    "new_offset": self._normalize(hex(new_val)),
+                })
+
+        return outdated, missing
+
+    def _resolve_field_owner(self, item: Dict, classes_lc: Dict[str, str]):
+        """Return (class, field_name) for a source field access; either may be None."""
+        label = item.get("field") or ""
+        var = (item.get("var") or "").split("->")[-1].split(".")[-1].lower()
+
+        # class guessed from the variable name: player / _player / m_Player → Player
+        var_owner = None
+        for candidate in (var, var.lstrip("_"), var[2:] if var.startswith("m_") else var):
+            var_owner = classes_lc.get(candidate)
+            if var_owner:
+                break
+
+        if not label:
+            return var_owner, None
+
+        for sep in ("::", "."):
+            if sep in label:
+                klass, name = label.rsplit(sep, 1)
+                return klass, name
+
+        owners = self.index.field_owners.get(label)
+        if not owners:
+            # free-text comment ("// god mode on"), not a field name
+            return var_owner, None
+        if len(owners) == 1:
+            return owners[0], label
+        if var_owner and self.index.field_offset(var_owner, label) is not None:
+            return var_owner, label
+        return owners[0], label
+
     # ===================================================================
     def _extract_hook_map(self) -> Dict[str, str]:
         """
@@ -142,13 +313,87 @@ class OffsetAnalyzer:
                 off = "0" + off
         return off
 
+    # ===================================================================
+    def _exact_lookup(self, func_name: str) -> str:
+        """
+        O(1) lookup:
+            "TakeDamage"                       → bare-name mapping
+            "Player::TakeDamage"               → DumpIndex.by_member
+            "Game.Player::TakeDamage(int)"     → DumpIndex.qualified
+        """
+        if self.index is not None and ("::" in func_name or "(" in func_name):
+            entry = self.index.resolve(func_name)
+            if entry is not None:
+                return self._normalize(entry.offset)
+        return self.dump.get(func_name, "")
+
+    # ===================================================================
+    def _overload_offsets(self, func_name: str) -> List[str]:
+        """Distinct offsets of every DumpIndex entry named func_name (more than one: overloaded)."""
+        if self.index is None:
+            return []
+        return list(dict.fromkeys(self._normalize(e.offset) for e in self.index.lookup(func_name)))
+
+    # ===================================================================
+    def _slot_lookup(self, func_name: str, old_offset: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the hook in the previous dump (by name, else by its old offset),
+        then take whatever now occupies the same class + vtable slot. O(1).
+        """
+        if self.index is None or self.previous is None or not self.index.slots:
+            return None
+
+        old_entry = self.previous.resolve(func_name, old_offset) or self.previous.find_offset(old_offset)
+        if old_entry is None or not old_entry.slot or not old_entry.klass:
+            return None
+
+        owner = old_entry.klass
+        if old_entry.namespace:
+            owner = f"{old_entry.namespace}.{owner}"
+
+        # identical class body → no method was renamed, nothing to find by slot
+        if owner in self.unchanged_classes:
+            return None
+
+        new_entry = self.index.by_slot(owner, int(old_entry.slot))
+        if new_entry is None:
+            return None
+        return {"entry": new_entry, "slot": f"{owner}#{old_entry.slot}"}
+
+    # ===================================================================
+    def _is_unchanged_class(self, klass: str) -> bool:
+        """klass ("Game.Player", or bare "Player" when all its owners are) is listed as unchanged."""
+        if klass in self.unchanged_classes:
+            return True
+        if self.index is None:
+            return False
+        owners = self.index.owners_of(klass)
+        if not owners:
+            # field-only class: the bare name shares its owner's field table
+            table = self.index.fields.get(klass)
+            owners = [c for c in self.unchanged_classes if table is not None and self.index.fields.get(c) is table]
+        return bool(owners) and all(o in self.unchanged_classes for o in owners)
+
+    def _in_unchanged_class(self, func_name: str) -> bool:
+        """The hooked method's class (from the previous dump, else its "Class::" prefix) is unchanged."""
+        if self.previous is not None:
+            entry = self.previous.resolve(func_name)
+            if entry is not None:
+                return entry.owner in self.unchanged_classes
+        klass, sep, _ = func_name.partition("(")[0].rpartition("::")
+        return bool(sep) and self._is_unchanged_class(klass)
+
     # ===================================================================
     def _fuzzy_lookup(self, func_name: str) -> str:
         """
         Match by last segment:
         e.g., "Player::TakeDamage" matches dump entry "TakeDamage"
         """
-        key = func_name.split("::")[-1].lower()
+        tail = func_name.split("::")[-1]
+        if self.dump.get(tail):
+            return self.dump[tail]
+
+        key = tail.lower()
         for dump_key, val in self.dump.items():
             if dump_key.lower().endswith(key) and val:
                 return val
@@ -163,4 +408,5 @@ class OffsetAnalyzer:
             "outdated_count": len(outdated),
             "missing_count": len(missing),
             "unused_dump_count": len(unused),
+            "slot_match_count": sum(1 for o in outdated if o.get("match") == "slot"),
         }
@@ -0,0 +1,334 @@
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .progress import CancelToken, ProgressCallback, ProgressTracker
+
+# (start, end, replacement) inside one file's text
+Edit = Tuple[int, int, str]
+
+# files patched between progress/cancel checkpoints
+PROGRESS_ITEMS = 64
+
+
+def read_source(path: str) -> str:
+    """File text exactly as on disk: line endings kept, undecodable bytes round-trip."""
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        return f.read()
+
+
+def write_atomic(path: str, data: Union[str, Iterable[bytes]]) -> None:
+    """
+    Replace `path` with `data`: text (written the way read_source reads it)
+    or an iterable of byte chunks. The data goes to a temporary file of its
+    own in the same directory, which is then moved over `path`, so a crash
+    never leaves a half-written file behind and concurrent writers never
+    share a temporary file; it is removed if anything fails. An existing
+    file's permissions are kept.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(path) or None)
+    try:
+        if isinstance(data, str):
+            with open(fd, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+                f.write(data)
+        else:
+            with open(fd, "wb") as f:
+                for chunk in data:
+                    f.write(chunk)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+        tmp = None
+    finally:
+        if tmp is not None:
+            os.unlink(tmp)
+
+
+def offset_sites(scan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    The scan entries whose offset literal belongs to their "func": every
+    HOOK call and the labelled LOGD lines ("Method: get_ATK, Offset: 0x...").
+    Other LOGD matches only guess the name from the log text's first word,
+    so they are never bound to a dump method.
+    """
+    return scan.get("HOOKS", []) + [site for site in scan.get("LOGD", []) if site.get("pattern") == "labelled"]
+
+
+def apply_edits(text: str, edits: List[Edit]) -> str:
+    """Splice sorted, non-overlapping edits (start, end, new, ...) into text in one pass."""
+    parts = []
+    pos = 0
+    for start, end, new, *_ in edits:
+        parts.append(text[pos:start])
+        parts.append(new)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def format_like(old_literal: str, new_offset: str) -> str:
+    """new_offset ("0x31557C0", "031557c0", ...) written the way old_literal is: same 0x/0X prefix and letter case."""
+    digits = f"{int(new_offset, 16):X}"
+    old_digits = old_literal[2:]
+    if any(c.isalpha() for c in old_digits) and old_digits.islower():
+        digits = digits.lower()
+    return old_literal[:2] + digits
+
+
+def diff_edits(path: str, text: str, edits: List[Edit], context: int = 3) -> Iterator[str]:
+    """
+    Unified diff lines of apply_edits(text, edits) against text, built from
+    the edits alone: only the edited lines and their context are looked at,
+    never the whole file. Edits must not span lines (offset literals don't).
+    """
+    # edited lines: [line number, line start, line end, edits on it]
+    changed = []
+    line_no, counted = 1, 0
+    for edit in edits:
+        start = edit[0]
+        line_no += text.count("\n", counted, start)
+        counted = start
+        if changed and changed[-1][0] == line_no:
+            changed[-1][3].append(edit)
+            continue
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", start)
+        line_end = len(text) if line_end < 0 else line_end + 1
+        changed.append([line_no, line_start, line_end, [edit]])
+    if not changed:
+        return
+
+    def lines_before(pos: int) -> List[str]:
+        out = []
+        while pos > 0 and len(out) < context:
+            prev = text.rfind("\n", 0, pos - 1) + 1
+            out.append(text[prev:pos])
+            pos = prev
+        return out[::-1]
+
+    def lines_after(pos: int, limit: int) -> List[str]:
+        out = []
+        while pos < len(text) and len(out) < limit:
+            nxt = text.find("\n", pos)
+            nxt = len(text) if nxt < 0 else nxt + 1
+            out.append(text[pos:nxt])
+            pos = nxt
+        return out
+
+    def line(prefix: str, body: str) -> str:
+        return prefix + (body if body.endswith("\n") else body + "\n\\ No newline at end of file\n")
+
+    yield f"--- a/{path}\n"
+    yield f"+++ b/{path}\n"
+
+    # edited lines at most 2 * context unchanged lines apart share a hunk
+    hunks = [[changed[0]]]
+    for entry in changed[1:]:
+        if entry[0] - hunks[-1][-1][0] - 1 <= 2 * context:
+            hunks[-1].append(entry)
+        else:
+            hunks.append([entry])
+
+    for hunk in hunks:
+        before = lines_before(hunk[0][1])
+        after = lines_after(hunk[-1][2], context)
+        first = hunk[0][0] - len(before)
+        count = len(before) + hunk[-1][0] - hunk[0][0] + 1 + len(after)
+        lines = f"{first},{count}" if count > 1 else f"{first}"
+        yield f"@@ -{lines} +{lines} @@\n"
+        for body in before:
+            yield line(" ", body)
+        run = []        # adjacent edited lines: all "-" lines, then all "+" lines
+        for i, entry in enumerate(hunk):
+            run.append(entry)
+            if i + 1 < len(hunk) and hunk[i + 1][0] == entry[0] + 1:
+                continue
+            olds = [text[line_start:line_end] for _, line_start, line_end, _ in run]
+            for old in olds:
+                yield line("-", old)
+            for old, (_, line_start, _, on_line) in zip(olds, run):
+                shifted = [(s - line_start, e - line_start, new) for s, e, new, *_ in on_line]
+                yield line("+", apply_edits(old, shifted))
+            run = []
+            if i + 1 < len(hunk):
+                for body in lines_after(entry[2], hunk[i + 1][0] - entry[0] - 1):
+                    yield line(" ", body)
+        for body in after:
+            yield line(" ", body)
+
+
+def _patch_parallel(patch_file: Callable[[str], int], files: List[str], workers: int,
+                    progress: Optional[ProgressCallback], cancel: Optional[CancelToken]) -> Dict[str, int]:
+    """Run patch_file over files on a thread pool; {path: edits} for the files it changed."""
+    tracker = None
+    if progress is not None or cancel is not None:
+        tracker = ProgressTracker("patch", progress, cancel, items_total=len(files))
+
+    changed: Dict[str, int] = {}
+    pool = ThreadPoolExecutor(workers)
+    try:
+        futures = [pool.submit(patch_file, path) for path in files]
+        for done, (path, future) in enumerate(zip(files, futures)):
+            if tracker is not None and done % PROGRESS_ITEMS == 0:
+                tracker.update(items=done)
+            count = future.result()
+            if count:
+                changed[path] = count
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    if tracker is not None:
+        tracker.finish()
+    return changed
+
+
+class SourcePatcher:
+    """
+    Applies an old → new offset map (CodeGenerator.generate_replacement_map)
+    to source files.
+
+    Each file is read once and matched once: one pattern finds every hex
+    literal — plain 0x216B910, str2Offset("0x216B910") and
+    str2Offset(OBFUSCATE("0x216B910")) all contain one — and a dict lookup
+    decides whether it is an old offset, so the cost does not grow with the
+    size of the map. Offsets compare by value ("0x0216b910" == "0x216B910");
+    a replacement keeps the case of the literal it replaces.
+
+    Files are processed on a thread pool and each one is rewritten
+    atomically (write_atomic).
+    """
+
+    HEX_LITERAL = re.compile(r'(?<!\w)0[xX]([0-9A-Fa-f]+)\b')
+
+    def __init__(self, replace_map: Dict[str, str], workers: Optional[int] = None):
+        self.replace_map = {int(old, 16): new for old, new in replace_map.items()}
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+    # -------------------------------------------------------------
+    def find_edits(self, text: str) -> List[Edit]:
+        """Every old offset literal in text, with its replacement."""
+        edits = []
+        lookup = self.replace_map.get
+        for m in self.HEX_LITERAL.finditer(text):
+            new = lookup(int(m.group(1), 16))
+            if new is not None:
+                literal = m.group()
+                edits.append((m.start(), m.end(), format_like(literal, new)))
+        return edits
+
+    def patch_text(self, text: str) -> Tuple[str, int]:
+        """(patched text, number of literals replaced)."""
+        edits = self.find_edits(text)
+        return (apply_edits(text, edits) if edits else text), len(edits)
+
+    def patch_file(self, path: str, dry_run: bool = False) -> int:
+        """Patch one file in place; returns the number of literals replaced."""
+        text = read_source(path)
+        patched, count = self.patch_text(text)
+        if count and not dry_run:
+            write_atomic(path, patched)
+        return count
+
+    # -------------------------------------------------------------
+    def patch_files(self, files: Iterable[str], dry_run: bool = False,
+                    progress: Optional[ProgressCallback] = None,
+                    cancel: Optional[CancelToken] = None) -> Dict[str, int]:
+        """
+        Patch every file (e.g. [raw["file"] for raw in scan["RAW"]]) on the
+        thread pool; returns {path: literals replaced} for the files that
+        changed (or would change, with dry_run).
+
+        `progress` gets a "patch" ProgressEvent every PROGRESS_ITEMS files;
+        `cancel` stops there with Cancelled — files already rewritten stay
+        rewritten, the rest are left untouched.
+        """
+        return _patch_parallel(lambda path: self.patch_file(path, dry_run), list(files),
+                               self.workers, progress, cancel)
+
+
+class BoundPatcher:
+    """
+    Context-aware patching: an offset is rewritten only at a HOOK call or
+    labelled LOGD line (offset_sites) that SourceScanner attributed to the
+    function being updated — never
+    wherever the same hex happens to appear. Two functions that shared an
+    old offset each get their own new one, and a matching value in
+    unrelated code is left alone.
+
+    The edits come straight from the scan's spans (no rescanning), so
+    planning, diffing and applying cost O(number of edits). Before a file
+    is rewritten its literals are checked against the scan; a file edited
+    since then is skipped and listed in `stale`.
+
+        patcher = BoundPatcher.from_analysis(scan, analysis)
+        print(patcher.diff())               # review
+        patcher.patch_files()               # apply
+    """
+
+    def __init__(self, scan: Dict[str, Any], updates: Dict[str, str], workers: Optional[int] = None):
+        """scan: SourceScanner.scan() result; updates: {func: new offset}."""
+        contents = {raw["file"]: raw["content"] for raw in scan.get("RAW", [])}
+        self.contents = contents
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.stale: List[str] = []
+
+        # file → [(start, end, new literal, old literal)], sorted
+        self.plan: Dict[str, List[Tuple[int, int, str, str]]] = {}
+        for site in offset_sites(scan):
+            new = updates.get(site.get("func"))
+            text = contents.get(site["file"])
+            if new is None or text is None:
+                continue
+            start, end = site["span"]
+            old = text[start:end]
+            literal = format_like(old, new)
+            if literal != old:
+                self.plan.setdefault(site["file"], []).append((start, end, literal, old))
+        for edits in self.plan.values():
+            edits.sort()
+
+    @classmethod
+    def from_analysis(cls, scan: Dict[str, Any], analysis: Dict[str, Any], **kwargs) -> "BoundPatcher":
+        """Patch every function OffsetAnalyzer.analyze() reported as outdated."""
+        updates = {row["func"]: row["new_offset"] for row in analysis.get("outdated", [])}
+        return cls(scan, updates, **kwargs)
+
+    @property
+    def edit_count(self) -> int:
+        return sum(map(len, self.plan.values()))
+
+    # -------------------------------------------------------------
+    def iter_diff(self, context: int = 3) -> Iterator[str]:
+        """Unified diff of every planned edit, file by file (diff_edits)."""
+        for path in sorted(self.plan):
+            yield from diff_edits(path, self.contents[path], self.plan[path], context)
+
+    def diff(self, context: int = 3) -> str:
+        return "".join(self.iter_diff(context))
+
+    def patch_file(self, path: str, dry_run: bool = False) -> int:
+        """Apply the planned edits to one file; 0 (and listed in stale) if it changed since the scan."""
+        edits = self.plan.get(path)
+        if not edits:
+            return 0
+        text = read_source(path)
+        if any(text[start:end] != old for start, end, _, old in edits):
+            self.stale.append(path)
+            return 0
+        if not dry_run:
+            write_atomic(path, apply_edits(text, edits))
+        return len(edits)
+
+    def patch_files(self, dry_run: bool = False,
+                    progress: Optional[ProgressCallback] = None,
+                    cancel: Optional[CancelToken] = None) -> Dict[str, int]:
+        """Apply the plan on the thread pool; {path: edits} for the files rewritten."""
+        self.stale = []
+        return _patch_parallel(lambda path: self.patch_file(path, dry_run), sorted(self.plan),
+                               self.workers, progress, cancel)
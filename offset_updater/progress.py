@@ -0,0 +1,126 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sized
+
+
+class Cancelled(Exception):
+    """Raised inside a long-running call once its CancelToken is set."""
+
+
+class CancelToken:
+    """
+    Thread-safe cancellation flag shared by a front end and a worker:
+
+        token = CancelToken()
+        worker: DumpParser().parse(path, cancel=token)
+        UI:     token.cancel()      # the parse raises Cancelled soon after
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """
+    One progress report. Totals are 0 when unknown; `stage` names the
+    entry point ("parse", "scan", "analyze", "report").
+    """
+    stage: str
+    bytes_done: int = 0
+    bytes_total: int = 0
+    items: int = 0
+    items_total: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """0..1 from bytes when known, else from items; None when neither total is known."""
+        if self.bytes_total:
+            return min(1.0, self.bytes_done / self.bytes_total)
+        if self.items_total:
+            return min(1.0, self.items / self.items_total)
+        return None
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left, extrapolated from the elapsed time."""
+        fraction = self.fraction
+        if not fraction:
+            return None
+        return self.elapsed * (1 - fraction) / fraction
+
+    def __str__(self) -> str:
+        parts = [self.stage]
+        if self.bytes_total:
+            parts.append(f"{self.bytes_done / (1024 * 1024):.1f}/{self.bytes_total / (1024 * 1024):.1f} MB")
+        if self.items:
+            parts.append(f"{self.items} items")
+        eta = self.eta
+        if eta is not None and self.fraction < 1:
+            parts.append(f"~{eta:.0f}s left")
+        return " · ".join(parts)
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class ProgressTracker:
+    """
+    What a long-running entry point holds for the duration of one stage.
+
+    Callers pass `progress` (a ProgressCallback) and/or `cancel` (a
+    CancelToken); the engine calls update() every N lines, chunks or items
+    — never per line — so both cost a couple of attribute checks per
+    checkpoint. update() raises Cancelled once the token is set.
+    """
+
+    def __init__(self, stage: str, progress: Optional[ProgressCallback] = None,
+                 cancel: Optional[CancelToken] = None,
+                 bytes_total: int = 0, items_total: int = 0):
+        self.stage = stage
+        self.progress = progress
+        self.cancel = cancel
+        self.bytes_total = bytes_total
+        self.items_total = items_total
+        self.bytes_done = 0
+        self.items = 0
+        self._counted: Optional[Sized] = None
+        self._start = time.perf_counter()
+
+    def count(self, sized: Sized) -> "ProgressTracker":
+        """Report len(sized) as the item count (e.g. the entries parsed so far)."""
+        self._counted = sized
+        return self
+
+    def update(self, bytes_done: Optional[int] = None, items: Optional[int] = None) -> None:
+        if self.cancel is not None and self.cancel.cancelled:
+            raise Cancelled(self.stage)
+        if self.progress is None:
+            return
+        if bytes_done is not None:
+            self.bytes_done = bytes_done
+        if items is not None:
+            self.items = items
+        elif self._counted is not None:
+            self.items = len(self._counted)
+        self.progress(ProgressEvent(
+            stage=self.stage,
+            bytes_done=self.bytes_done,
+            bytes_total=self.bytes_total,
+            items=self.items,
+            items_total=self.items_total,
+            elapsed=time.perf_counter() - self._start,
+        ))
+
+    def finish(self) -> None:
+        """Final report: everything done."""
+        self.update(self.bytes_total or None, self.items_total or None)
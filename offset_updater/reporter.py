@@ -1,5 +1,7 @@
 import json
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
+
+from .progress import CancelToken, ProgressCallback, ProgressTracker
 
 
 class Reporter:
@@ -18,59 +20,127 @@ class Reporter:
             - missing functions in dump
             - unused dump methods
         """
+        return "\n".join(self.iter_text_report(analysis_data))
 
-        lines = []
-        lines.append("======= OFFSET UPDATE REPORT =======\n")
+    # ---------------------------------------------------------
+    def iter_text_report(self, analysis_data: Dict) -> Iterator[str]:
+        """
+        The text report line by line ("\n".join gives build_text_report), so
+        large reports can be streamed to a file or a viewer without building
+        the whole string.
+        """
+        yield "======= OFFSET UPDATE REPORT =======\n"
 
         # Summary section
         summary = analysis_data.get("summary", {})
-        lines.append("SUMMARY:")
-        lines.append(f"  Total Methods in Dump     : {summary.get('total_in_dump', 0)}")
-        lines.append(f"  Total Methods in Source   : {summary.get('total_in_source', 0)}")
-        lines.append(f"  Updated Offsets           : {summary.get('updated_count', 0)}")
-        lines.append(f"  Outdated Offsets          : {summary.get('outdated_count', 0)}")
-        lines.append(f"  Missing In Dump           : {summary.get('missing_in_dump', 0)}")
-        lines.append(f"  Unused Dump Methods       : {summary.get('unused_dump_methods', 0)}\n")
+        yield "SUMMARY:"
+        yield f"  Total Methods in Dump     : {summary.get('total_in_dump', 0)}"
+        yield f"  Total Methods in Source   : {summary.get('total_in_source', 0)}"
+        yield f"  Updated Offsets           : {summary.get('updated_count', 0)}"
+        yield f"  Outdated Offsets          : {summary.get('outdated_count', 0)}"
+        yield f"  Missing In Dump           : {summary.get('missing_in_dump', 0)}"
+        yield f"  Unused Dump Methods       : {summary.get('unused_dump_methods', 0)}\n"
 
         # Updated section
-        lines.append("UPDATED OFFSETS:")
+        yield "UPDATED OFFSETS:"
         updated = analysis_data.get("updated", [])
         if updated:
             for u in updated:
-                lines.append(f"  {u['func']}  ->  0x{u['offset']}")
+                yield f"  {u['func']}  ->  0x{u['offset']}"
         else:
-            lines.append("  NONE")
-        lines.append("")
+            yield "  NONE"
+        yield ""
 
         # Outdated section
-        lines.append("OUTDATED (Old -> New):")
+        yield "OUTDATED (Old -> New):"
         outdated = analysis_data.get("outdated", [])
         if outdated:
             for o in outdated:
-                lines.append(f"  {o['func']}: 0x{o['old_offset']}  → 0x{o['new_offset']}")
+                match = o.get("match", "exact")
+                if match == "slot":
+                    match = f"slot {o['slot']} = {o['matched_name']}"
+                yield (
+                    f"  {o['func']}: 0x{o['old_offset']}  → 0x{o['new_offset']}  [{match}]"
+                )
         else:
-            lines.append("  NONE")
-        lines.append("")
+            yield "  NONE"
+        yield ""
+
+        # Outdated field offsets (only present when the dump has field data)
+        outdated_fields = analysis_data.get("outdated_fields", [])
+        if outdated_fields:
+            yield "OUTDATED FIELDS (Old -> New):"
+            for o in outdated_fields:
+                yield (
+                    f"  {o.get('class') or '?'}::{o.get('name') or o['field']} ({o['var']}): "
+                    f"0x{o['old_offset']}  → 0x{o['new_offset']}"
+                )
+            yield ""
+
+        # Overloaded names whose hook matches none of the overloads (not patched)
+        ambiguous = analysis_data.get("ambiguous", [])
+        if ambiguous:
+            yield "AMBIGUOUS OVERLOADS (not patched):"
+            for a in ambiguous:
+                candidates = ", ".join(f"0x{c}" for c in a["candidates"])
+                yield f"  {a['func']}: 0x{a['old_offset']}  → one of {candidates}"
+            yield ""
 
         # Missing section
-        lines.append("MISSING IN DUMP:")
+        yield "MISSING IN DUMP:"
         missing = analysis_data.get("missing_in_dump", [])
         if missing:
             for m in missing:
-                lines.append(f"  {m['func']}  (source offset: 0x{m['source_offset']})")
+                yield f"  {m['func']}  (source offset: 0x{m['source_offset']})"
         else:
-            lines.append("  NONE")
-        lines.append("")
+            yield "  NONE"
+        yield ""
 
         # Unused section
-        lines.append("UNUSED METHODS IN DUMP:")
+        yield "UNUSED METHODS IN DUMP:"
         unused = analysis_data.get("unused_dump_methods", [])
         if unused:
             for fn in unused:
-                lines.append(f"  {fn}")
+                yield f"  {fn}"
         else:
-            lines.append("  NONE")
-        lines.append("")
+            yield "  NONE"
+        yield ""
+
+    # ---------------------------------------------------------
+    def summary(self, changes) -> str:
+        """
+        One line per change of a {name: (old, new)} map (or (name, (old, new))
+        pairs, as CodeGenerator.iter_changes yields):
+            get_ATK: 0x11111 → 0x22222
+            get_DEF: NEW → 0xAAAAA
+        """
+        items = changes.items() if isinstance(changes, dict) else changes
+        lines = [f"  {name}: {old or 'NEW'} → {new}" for name, (old, new) in items]
+        if not lines:
+            return "No changes detected."
+        return f"{len(lines)} change(s):\n" + "\n".join(lines)
+
+    # ---------------------------------------------------------
+    def build_class_change_report(self, class_changes: Dict) -> str:
+        """
+        "What changed in this build" from ClassHasher.diff():
+            added / removed / changed class names
+        """
+        lines = ["======= CLASS CHANGES =======\n"]
+        lines.append(f"  Unchanged classes : {len(class_changes.get('unchanged', []))}")
+        lines.append(f"  Changed classes   : {len(class_changes.get('changed', []))}")
+        lines.append(f"  Added classes     : {len(class_changes.get('added', []))}")
+        lines.append(f"  Removed classes   : {len(class_changes.get('removed', []))}\n")
+
+        for title, key in (("CHANGED:", "changed"), ("ADDED:", "added"), ("REMOVED:", "removed")):
+            lines.append(title)
+            names = class_changes.get(key, [])
+            if names:
+                for name in names:
+                    lines.append(f"  {name}")
+            else:
+                lines.append("  NONE")
+            lines.append("")
 
         return "\n".join(lines)
 
@@ -98,24 +168,33 @@ class Reporter:
             json.dump(data, f, indent=4)
 
     # ---------------------------------------------------------
-    def save_combo_report(self, folder: str, analysis_data: Dict, generator_payload: Dict) -> None:
+    def save_combo_report(self, folder: str, analysis_data: Dict, generator_payload: Dict,
+                          progress: Optional[ProgressCallback] = None,
+                          cancel: Optional[CancelToken] = None) -> None:
         """
         Saves:
             - human-readable text report
             - machine-readable JSON report
             - code snippets (hook + logd)
+
+        `progress` gets a "report" ProgressEvent after each file (items =
+        files written); `cancel` aborts between files with Cancelled.
         """
+        tracker = ProgressTracker("report", progress, cancel, items_total=4)
+
         # Text and JSON reports
-        text_report = self.build_text_report(analysis_data)
-        json_report = self.build_json_report(generator_payload)
+        self.save_text(f"{folder}/offset_report.txt", self.build_text_report(analysis_data))
+        tracker.update(items=1)
 
-        self.save_text(f"{folder}/offset_report.txt", text_report)
         self.save_json(f"{folder}/offset_report.json", generator_payload)
+        tracker.update(items=2)
 
         # Hook snippets
         with open(f"{folder}/hook_snippets.txt", "w", encoding="utf-8") as f:
             f.write(generator_payload.get("generated_hook_snippets", ""))
+        tracker.update(items=3)
 
         # LOGD snippets
         with open(f"{folder}/logd_snippets.txt", "w", encoding="utf-8") as f:
             f.write(generator_payload.get("generated_logd_snippets", ""))
+        tracker.finish()
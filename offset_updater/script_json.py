@@ -0,0 +1,205 @@
+import json
+import re
+from typing import Any, Dict, Iterator, Optional
+
+from .dump_parser import DumpEntry, DumpIndex, DumpParser
+from .progress import ProgressTracker
+
+
+class ScriptJsonParser:
+    """
+    Incremental Il2CppDumper script.json parser.
+
+    script.json is one huge object:
+
+        {
+          "ScriptMethod": [
+            {"Address": 35055676, "Name": "Game.Player$$TakeDamage",
+             "Signature": "void Game_Player__TakeDamage (Game_Player_o* __this, int32_t amount, const MethodInfo* method);",
+             "TypeSignature": "viii"},
+            ...
+          ],
+          "ScriptString": [...], "ScriptMetadata": [...], ...
+        }
+
+    Only the ScriptMethod array is streamed, one object at a time, from a
+    small sliding buffer, and reading stops as soon as the array closes —
+    the file is never loaded whole. Entries go into the same DumpIndex that
+    DumpParser produces (offset/rva = Address, signature = C parameter types).
+    """
+
+    CHUNK_SIZE = 1 << 20
+    METHOD_KEY = "ScriptMethod"
+
+    RE_WS = re.compile(r"[\s,]*")
+    RE_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+    RE_STRUCTURE = re.compile(r'["\[\]{}]')
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+
+    # -------------------------------------------------------------
+    def parse(self, path: str, tracker: Optional[ProgressTracker] = None) -> DumpIndex:
+        dump_map = DumpIndex()
+        if tracker is not None:
+            tracker.count(dump_map.entries)
+        for ordinal, item in enumerate(self.iter_methods(path, tracker)):
+            entry = self._to_entry(item, ordinal)
+            if entry is not None:
+                dump_map.add(entry)
+        return dump_map
+
+    # -------------------------------------------------------------
+    def iter_methods(self, path: str,
+                     tracker: Optional[ProgressTracker] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield each ScriptMethod object without reading the rest of the file.
+        `tracker` hears the byte position after every chunk read.
+        """
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            self._f = f
+            self._tracker = tracker
+            self._buf = ""
+            self._pos = 0
+
+            if self._next_char() != "{":
+                return
+            self._pos += 1
+
+            while True:
+                ch = self._next_char()
+                if ch != '"':
+                    return  # end of object (or malformed input)
+                key = self._decode()
+                if self._next_char() != ":":
+                    return
+                self._pos += 1
+
+                if key == self.METHOD_KEY:
+                    yield from self._iter_array()
+                    return
+                self._skip_value()
+
+    # -------------------------------------------------------------
+    def _fill(self) -> bool:
+        """Drop consumed text and append the next chunk; False at EOF."""
+        chunk = self._f.read(self.CHUNK_SIZE)
+        if self._tracker is not None:
+            self._tracker.update(self._f.buffer.tell())
+        if not chunk:
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _next_char(self) -> str:
+        """Skip whitespace/commas and return the next significant char ('' at EOF)."""
+        while True:
+            self._pos = self.RE_WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _decode(self) -> Any:
+        """Decode one complete JSON value at the cursor, reading more as needed."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            # a number at the buffer edge may be cut short
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _iter_array(self) -> Iterator[Any]:
+        if self._next_char() != "[":
+            return
+        self._pos += 1
+        while True:
+            ch = self._next_char()
+            if ch in ("]", ""):
+                self._pos += 1
+                return
+            yield self._decode()
+
+    def _skip_value(self) -> None:
+        """Skip a value we do not need without decoding it."""
+        ch = self._next_char()
+        if not ch:
+            return
+        if ch not in "[{":
+            self._decode()
+            return
+
+        depth = 0
+        while True:
+            m = self.RE_STRUCTURE.search(self._buf, self._pos)
+            if not m:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    return
+                continue
+
+            ch = m.group()
+            self._pos = m.end()
+            if ch == '"':
+                while True:
+                    end = self.RE_STRING_END.match(self._buf, self._pos)
+                    if end:
+                        self._pos = end.end()
+                        break
+                    if not self._fill():
+                        return
+            elif ch in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    # -------------------------------------------------------------
+    @staticmethod
+    def _c_param_types(signature: str) -> str:
+        """'void F (Player_o* __this, int32_t amount, const MethodInfo* method);' → 'int32_t'"""
+        start = signature.find("(")
+        end = signature.rfind(")")
+        if start < 0 or end <= start:
+            return ""
+        params = [
+            p for p in signature[start + 1:end].split(",")
+            if p.strip() and not p.rstrip().endswith("__this") and "MethodInfo*" not in p
+        ]
+        return DumpParser._param_types(",".join(params))
+
+    def _to_entry(self, item: Dict[str, Any], ordinal: int):
+        if not isinstance(item, dict):
+            return None
+        address = item.get("Address")
+        full_name = item.get("Name") or ""
+        if not isinstance(address, int) or not full_name:
+            return None
+
+        owner, sep, method = full_name.rpartition("$$")
+        if not sep:
+            owner, method = "", full_name
+        namespace, _, klass = owner.rpartition(".")
+
+        offset = f"0x{address:X}"
+        signature = item.get("Signature") or ""
+        return DumpEntry(
+            name=method,
+            offset=offset,
+            rva=offset,
+            va="",
+            slot="",
+            line_no=ordinal,
+            raw=signature,
+            namespace=namespace,
+            klass=klass,
+            signature=self._c_param_types(signature)
+        )
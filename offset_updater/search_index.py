@@ -0,0 +1,174 @@
+import threading
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+
+class NameIndex:
+    """
+    Case-insensitive name search for the dump browsers.
+
+    Names are sorted once (case-insensitively) and their lowercase forms
+    cached next to them, so a search never re-sorts or re-lowers the
+    mapping. Results are positions into `names`, which lets a view page
+    through a million matches without copying them:
+
+        index = NameIndex(mapping)
+        hits = index.search("update")      # [12, 40, 41, ...]
+        index.names[hits[0]]               # "FixedUpdate"
+
+    Two indexes answer queries:
+        prefix    - bisect over the sorted lowercase names, O(log n)
+        substring - every lowercase name joined into one haystack; str.find
+                    jumps straight from one occurrence to the next and the
+                    owning name is found by bisecting the start offsets.
+                    Terms shorter than MIN_FIND are so common that a plain
+                    scan of the lowercase list is faster.
+    """
+
+    MIN_FIND = 3
+    SCAN_CHUNK = 1 << 16
+
+    def __init__(self, names: Iterable[str]):
+        pairs = sorted((name.lower(), name) for name in names)
+        self.lower: List[str] = [low for low, _ in pairs]
+        self.names: List[str] = [name for _, name in pairs]
+        self._haystack = None
+        self._starts = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # -------------------------------------------------------------
+    def prefix(self, term: str) -> range:
+        """Positions of every name starting with `term`."""
+        term = term.strip().lower()
+        lo = bisect_left(self.lower, term)
+        hi = bisect_right(self.lower, term + "\U0010ffff", lo)
+        return range(lo, hi)
+
+    def search(self, term: str, limit: Optional[int] = None,
+               cancelled: Optional[Callable[[], bool]] = None) -> Sequence[int]:
+        """
+        Positions of every name containing `term` (all names when empty),
+        in sorted order. Stops early after `limit` hits or once
+        `cancelled()` turns true.
+        """
+        term = term.strip().lower()
+        if not term:
+            return range(len(self.names) if limit is None else min(limit, len(self.names)))
+        if len(term) < self.MIN_FIND:
+            return self._scan(term, limit, cancelled)
+        return self._find(term, limit, cancelled)
+
+    def complete(self, term: str, limit: int = 50) -> List[int]:
+        """Prefix matches first, then the other substring matches, up to `limit`."""
+        hits = list(self.prefix(term)[:limit])
+        if len(hits) < limit:
+            seen = set(hits)
+            for pos in self.search(term, limit=limit + len(hits)):
+                if pos not in seen:
+                    hits.append(pos)
+                    if len(hits) == limit:
+                        break
+        return hits
+
+    # -------------------------------------------------------------
+    def _scan(self, term, limit, cancelled) -> List[int]:
+        hits = []
+        lower = self.lower
+        for base in range(0, len(lower), self.SCAN_CHUNK):
+            if cancelled and cancelled():
+                break
+            chunk = lower[base:base + self.SCAN_CHUNK]
+            hits.extend(base + i for i, low in enumerate(chunk) if term in low)
+            if limit is not None and len(hits) >= limit:
+                return hits[:limit]
+        return hits
+
+    def _find(self, term, limit, cancelled) -> List[int]:
+        if self._haystack is None:
+            self._build_haystack()
+        haystack, starts = self._haystack, self._starts
+
+        hits = []
+        pos = haystack.find(term)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            hits.append(i)
+            if limit is not None and len(hits) >= limit:
+                break
+            if not len(hits) & 0xFFF and cancelled and cancelled():
+                break
+            pos = haystack.find(term, starts[i + 1])
+        return hits
+
+    def _build_haystack(self) -> None:
+        # "\n" never occurs in a name, so a match cannot straddle two names
+        starts = list(accumulate((len(low) + 1 for low in self.lower), initial=0))
+        self._haystack = "\n".join(self.lower)
+        self._starts = starts
+
+
+class SearchWorker:
+    """
+    Runs the latest query on one background thread.
+
+    submit() only records the query and returns at once, so the UI thread
+    does O(1) work per keystroke. A newer submit() supersedes an older one:
+    the running query sees cancelled() turn true and stops, queued ones
+    are dropped, and only the newest result reaches `deliver`:
+
+        worker = SearchWorker(lambda generation, result: ...)
+        worker.submit(index.search, "upd")
+
+    `deliver(generation, result)` is called on the worker thread; GUIs hand
+    it over to their own event loop (Qt signal, Tk queue polled by after()).
+    """
+
+    def __init__(self, deliver: Callable[[int, Any], None]):
+        self._deliver = deliver
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._generation = 0
+        self._pending = None
+        self._thread = None
+
+    # -------------------------------------------------------------
+    def submit(self, fn: Callable[..., Any], *args) -> int:
+        """Queue fn(*args, cancelled=...) and return its generation."""
+        with self._lock:
+            self._generation += 1
+            self._pending = (self._generation, fn, args)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="name-search", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return self._generation
+
+    def cancel(self) -> None:
+        """Drop the queued query and stop the running one."""
+        with self._lock:
+            self._generation += 1
+            self._pending = None
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    # -------------------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            with self._lock:
+                self._wake.clear()
+                job, self._pending = self._pending, None
+            if job is None:
+                continue
+
+            generation, fn, args = job
+            try:
+                result = fn(*args, cancelled=lambda: generation != self._generation)
+            except Exception:
+                continue
+            if generation == self._generation:
+                self._deliver(generation, result)
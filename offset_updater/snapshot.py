@@ -0,0 +1,153 @@
+import gc
+import json
+import os
+import struct
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .dump_parser import DumpIndex
+from .patcher import write_atomic
+
+MAGIC = b"OUSNAP\x01\n"
+VERSION = 2
+_HEADER_LEN = struct.Struct("<I")
+
+# how a section's JSON is turned back into its object
+CODECS = ("json", "dump_index")
+
+
+class StaleSnapshot(ValueError):
+    """The snapshot was taken from input files that have changed since."""
+
+
+def fingerprint(path: str) -> List:
+    """
+    Cheap identity of an input: [size, mtime_ns] for a file, and
+    [[relpath, size, mtime_ns], ...] over every file under a directory.
+    Nothing is read, so checking a 500 MB dump costs one stat().
+    """
+    if os.path.isfile(path):
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+    files = []
+    for root, _, names in os.walk(path):
+        for name in names:
+            full = os.path.join(root, name)
+            st = os.stat(full)
+            files.append([os.path.relpath(full, path), st.st_size, st.st_mtime_ns])
+    files.sort()
+    return files
+
+
+def save_snapshot(path: str, sections: Dict[str, Any], inputs: Dict[str, Optional[str]]) -> None:
+    """
+    Write `sections` ({name: object}) to a snapshot bound to the
+    fingerprints of `inputs` ({role: file or folder path}). A section is
+    either a DumpIndex (stored through DumpIndex.to_data) or plain JSON
+    data: dicts, lists, strings, numbers (tuples come back as lists).
+
+    Layout: MAGIC, a little-endian u32 header length, a JSON header
+    (inputs with fingerprints, section offsets/lengths/codecs), then one
+    UTF-8 JSON document per section. Snapshots hold data only, so opening
+    one can never run code. The file is written with patcher.write_atomic,
+    so a crash never leaves a half-written snapshot behind.
+    """
+    blobs = {}
+    codecs = {}
+    for name, obj in sections.items():
+        if isinstance(obj, DumpIndex):
+            obj, codecs[name] = obj.to_data(), "dump_index"
+        else:
+            codecs[name] = "json"
+        blobs[name] = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    header = {
+        "version": VERSION,
+        "created": time.time(),
+        "inputs": {
+            role: [os.path.abspath(p), fingerprint(p)] if p else None
+            for role, p in inputs.items()
+        },
+        "sections": {},
+    }
+    pos = 0
+    for name, blob in blobs.items():
+        header["sections"][name] = [pos, len(blob), codecs[name]]
+        pos += len(blob)
+    header_bytes = json.dumps(header).encode("utf-8")
+
+    write_atomic(path, [MAGIC, _HEADER_LEN.pack(len(header_bytes)), header_bytes, *blobs.values()])
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    """The JSON header alone (inputs, sections); ValueError if not a snapshot."""
+    with open(path, "rb") as f:
+        prefix = f.read(len(MAGIC) + _HEADER_LEN.size)
+        if len(prefix) < len(MAGIC) + _HEADER_LEN.size or not prefix.startswith(MAGIC):
+            raise ValueError(f"{path} is not a session snapshot")
+        (size,) = _HEADER_LEN.unpack_from(prefix, len(MAGIC))
+        header = json.loads(f.read(size))
+    if header.get("version") != VERSION:
+        raise ValueError(f"{path}: unsupported snapshot version {header.get('version')}")
+    header["_data_start"] = len(MAGIC) + _HEADER_LEN.size + size
+    return header
+
+
+def stale_inputs(header: Dict[str, Any]) -> List[str]:
+    """Roles whose input file is gone or no longer matches its fingerprint."""
+    stale = []
+    for role, recorded in header["inputs"].items():
+        if recorded is None:
+            continue
+        p, fp = recorded
+        try:
+            if fingerprint(p) != fp:
+                stale.append(role)
+        except OSError:
+            stale.append(role)
+    return stale
+
+
+def load_snapshot(path: str, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Validate the snapshot against its inputs, then decode the sections
+    (all, or just `names`).
+
+    Returns {"inputs": {role: path}, "sections": {name: obj}, "load_seconds": float}.
+    Raises StaleSnapshot when an input changed, ValueError when the file is
+    not a snapshot or a section is corrupt. The cyclic GC is paused while
+    decoding: the parsed dump is millions of small objects and every GC
+    pass would walk them all.
+    """
+    start = time.perf_counter()
+    header = read_header(path)
+    stale = stale_inputs(header)
+    if stale:
+        raise StaleSnapshot(f"inputs changed since the snapshot was taken: {', '.join(stale)}")
+
+    wanted = header["sections"] if names is None else names
+    sections = {}
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, "rb") as f:
+            for name in wanted:
+                pos, length, codec = header["sections"][name]
+                f.seek(header["_data_start"] + pos)
+                blob = f.read(length)
+                if len(blob) != length or codec not in CODECS:
+                    raise ValueError(f"{path}: section {name!r} is corrupt")
+                try:
+                    obj = json.loads(blob)
+                    sections[name] = DumpIndex.from_data(obj) if codec == "dump_index" else obj
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    raise ValueError(f"{path}: section {name!r} is corrupt: {e}") from None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "inputs": {role: (rec[0] if rec else None) for role, rec in header["inputs"].items()},
+        "sections": sections,
+        "load_seconds": time.perf_counter() - start,
+    }
@@ -1,6 +1,10 @@
 import os
 import re
-from typing import Dict, List, Any
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
+
+from .patcher import read_source
+from .progress import CancelToken, ProgressCallback, ProgressTracker
 
 
 class SourceScanner:
@@ -9,15 +13,29 @@ class SourceScanner:
 
     {
         "LOGD": [
-            {"file": "...", "func": "get_ATK", "offset": "0x216B910"}
+            {"file": "...", "func": "get_ATK", "offset": "0x216B910", "line": 12, "span": (431, 440),
+             "pattern": "labelled"}
         ],
         "HOOKS": [
-            {"file": "...", "func": "get_ATK", "orig": "orig_get_ATK", "offset": "0x216B910"}
+            {"file": "...", "func": "get_ATK", "orig": "orig_get_ATK", "offset": "0x216B910",
+             "line": 40, "span": (1210, 1219)}
         ],
         "ORIGINALS": ["get_ATK", ...],
-        "RAW": [{"file":"...", "content":"..."}]
+        "FIELDS": [
+            {"file": "...", "var": "player", "type": "int", "offset": "0x18", "field": "hp"}
+        ],
+        "RAW": [{"file":"...", "content":"..."}],
+        "ERRORS": [{"file": "...", "error": "..."}]
     }
 
+    "line" is the 1-based line of the offset literal and "span" its
+    (start, end) position, "0x" included, inside the file's RAW content.
+    Each LOGD literal is reported once, named by the most specific pattern;
+    "pattern" says which one: "labelled" (LOGD_LABELLED), "simple", "full",
+    "inline" or "comment" (COMMENTED_OFFSET, func None). Only "labelled"
+    names are reliable; the others take the first identifier they find.
+    Files that cannot be read or scanned are skipped and listed in ERRORS.
+
     Major improvements:
     - LOGD now extracts function name + offset correctly.
     - HOOK detection handles ANY spacing/newline/macro wrapping.
@@ -27,7 +45,17 @@ class SourceScanner:
 
     # -------------------------------------------------------------
     # LOGD PATTERNS
+    # Labelled layouts written by our own generators:
+    # LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x21678F0"))
     # LOGD("Method Name: get_ATK, Offsets: 0x21678F0")
+    # LOGD(OBFUSCATE("Updated Offset | get_ATK : 0x21678F0"))
+    LOGD_LABELLED = re.compile(
+        r'(?:Method(?:\s+Name)?\s*[:=]\s*([A-Za-z_][A-Za-z0-9_:]*)\s*,\s*Offsets?\s*[:=]'
+        r'|Offsets?\s*\|\s*([A-Za-z_][A-Za-z0-9_:]*)\s*:)'
+        r'\s*0x([0-9A-Fa-f]+)',
+        re.IGNORECASE
+    )
+
     LOGD_FULL = re.compile(
         r'LOGD\s*\(\s*OBFUSCATE\(\s*"[^"]*?([A-Za-z_][A-Za-z0-9_:]*)[^"]*?0x([0-9A-Fa-f]+)[^"]*?"\s*\)',
         re.IGNORECASE | re.DOTALL
@@ -63,22 +91,45 @@ class SourceScanner:
         re.IGNORECASE
     )
 
+    # Pointer-arithmetic field access, optionally naming the field in a comment:
+    # *(int*)((uintptr_t)player + 0x18) = 999;  // Player::hp
+    # The comment's first word is only a candidate; OffsetAnalyzer accepts it
+    # when it is Class::field / Class.field or a field name the dump knows.
+    FIELD_ACCESS = re.compile(
+        r'\*\s*\(\s*([A-Za-z_][\w:<> ]*?)\s*\*\s*\)\s*'
+        r'\(\s*\(\s*(?:uintptr_t|uint64_t|intptr_t|int64_t|size_t|DWORD64|long|char\s*\*)\s*\)\s*'
+        r'([A-Za-z_]\w*(?:(?:->|\.)\w+)*)\s*\+\s*0x([0-9A-Fa-f]+)\s*\)'
+        r'(?:[^\n]*?//\s*([A-Za-z_]\w*(?:(?:::|\.)[A-Za-z_]\w*)*))?'
+    )
+
     # Commented offsets // 0x123456
     COMMENTED_OFFSET = re.compile(
         r'//.*?0x([0-9A-Fa-f]{4,})'
     )
 
+    RE_NEWLINE = re.compile(r'\n')
+
     # -------------------------------------------------------------
     def __init__(self, source_path: str):
         self.source_path = source_path
 
     # -------------------------------------------------------------
-    def scan(self) -> Dict[str, Any]:
+    def scan(self, progress: Optional[ProgressCallback] = None,
+             cancel: Optional[CancelToken] = None) -> Dict[str, Any]:
+        """
+        Scan the file or every C/C++ file under the directory.
+        `progress` receives a ProgressEvent (stage "scan": bytes scanned,
+        HOOK/LOGD entries found) after each file; setting `cancel` makes the
+        scan raise progress.Cancelled before the next file. A file that
+        fails to read or scan is skipped and reported in result["ERRORS"].
+        """
         result = {
             "LOGD": [],
             "HOOKS": [],
             "ORIGINALS": [],
-            "RAW": []
+            "FIELDS": [],
+            "RAW": [],
+            "ERRORS": []
         }
 
         if os.path.isfile(self.source_path):
@@ -90,15 +141,28 @@ class SourceScanner:
                     if fn.endswith((".cpp", ".c", ".h", ".hpp")):
                         files.append(os.path.join(root, fn))
 
-        for path in files:
+        sizes = [os.path.getsize(path) for path in files]
+        tracker = None
+        if progress is not None or cancel is not None:
+            tracker = ProgressTracker("scan", progress, cancel, bytes_total=sum(sizes))
+        done = 0
+
+        for path, size in zip(files, sizes):
+            if tracker is not None:
+                tracker.update(done, len(result["HOOKS"]) + len(result["LOGD"]))
+            done += size
             try:
                 scanned = self._scan_file(path)
                 result["LOGD"].extend(scanned["LOGD"])
                 result["HOOKS"].extend(scanned["HOOKS"])
                 result["ORIGINALS"].extend(scanned["ORIGINALS"])
+                result["FIELDS"].extend(scanned["FIELDS"])
                 result["RAW"].append({"file": path, "content": scanned["RAW"]})
-            except Exception:
-                continue
+            except Exception as e:
+                result["ERRORS"].append({"file": path, "error": f"{type(e).__name__}: {e}"})
+
+        if tracker is not None:
+            tracker.update(done, len(result["HOOKS"]) + len(result["LOGD"]))
 
         # Dedupe originals
         result["ORIGINALS"] = sorted(set(result["ORIGINALS"]))
@@ -107,38 +171,65 @@ class SourceScanner:
 
     # -------------------------------------------------------------
     def _scan_file(self, path: str) -> Dict[str, Any]:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
+        # read exactly as patcher.BoundPatcher re-reads it (CRLF kept, invalid
+        # bytes round-tripped), so spans index the same text it checks
+        return self.scan_text(read_source(path), path)
+
+    # -------------------------------------------------------------
+    def scan_text(self, content: str, path: str = "<text>") -> Dict[str, Any]:
+        """Scan one file's text (as read by scan()); "file" is set to `path`."""
+        line_starts = [0]
+        line_starts.extend(m.end() for m in self.RE_NEWLINE.finditer(content))
+
+        def line_of(pos: int) -> int:
+            return bisect_right(line_starts, pos)
 
-        logs = []
         hooks = []
         originals = []
 
         # ---------------------------------------------------------
-        # LOGD extraction
-        for m in self.LOGD_FULL.findall(content):
-            func, off = m[0], m[1]
-            logs.append({"file": path, "func": func, "offset": "0x" + off})
+        # LOGD extraction: one entry per offset literal, the first
+        # (most specific) pattern to claim a literal names it
+        logs_at = {}
+
+        def add_log(func, m, group, pattern):
+            start = m.start(group) - 2
+            if start not in logs_at:
+                logs_at[start] = {
+                    "file": path,
+                    "func": func,
+                    "offset": "0x" + m.group(group),
+                    "line": line_of(start),
+                    "span": (start, m.end(group)),
+                    "pattern": pattern
+                }
+
+        for m in self.LOGD_LABELLED.finditer(content):
+            add_log(m.group(1) or m.group(2), m, 3, "labelled")
 
-        for m in self.LOGD_INLINE.findall(content):
-            func, off = m[0], m[1]
-            logs.append({"file": path, "func": func, "offset": "0x" + off})
+        for name, pattern in (("simple", self.LOGD_SIMPLE), ("full", self.LOGD_FULL), ("inline", self.LOGD_INLINE)):
+            for m in pattern.finditer(content):
+                add_log(m.group(1), m, 2, name)
 
-        for m in self.LOGD_SIMPLE.findall(content):
-            func, off = m[0], m[1]
-            logs.append({"file": path, "func": func, "offset": "0x" + off})
+        # commented offsets
+        for m in self.COMMENTED_OFFSET.finditer(content):
+            add_log(None, m, 1, "comment")
+
+        logs = sorted(logs_at.values(), key=lambda e: e["span"])
 
         # ---------------------------------------------------------
         # HOOK extraction
-        for m in self.HOOK_PATTERN.findall(content):
-            g1, g2, g3, func, orig = m
-            off = g1 or g2 or g3 or ""
+        for m in self.HOOK_PATTERN.finditer(content):
+            group = next(g for g in (1, 2, 3) if m.group(g))
+            start = m.start(group) - 2
 
             hooks.append({
                 "file": path,
-                "func": func,
-                "orig": orig or "",
-                "offset": "0x" + off if off else ""
+                "func": m.group(4),
+                "orig": m.group(5) or "",
+                "offset": "0x" + m.group(group),
+                "line": line_of(start),
+                "span": (start, m.end(group))
             })
 
         # ---------------------------------------------------------
@@ -147,13 +238,21 @@ class SourceScanner:
             originals.append(m)
 
         # ---------------------------------------------------------
-        # commented offsets
-        for m in self.COMMENTED_OFFSET.findall(content):
-            logs.append({"file": path, "func": None, "offset": "0x" + m})
+        # *(T*)((uintptr_t)obj + 0xOFF) field access
+        fields = []
+        for ftype, var, off, name in self.FIELD_ACCESS.findall(content):
+            fields.append({
+                "file": path,
+                "var": var,
+                "type": ftype.strip(),
+                "offset": "0x" + off,
+                "field": name or None
+            })
 
         return {
             "LOGD": logs,
             "HOOKS": hooks,
             "ORIGINALS": originals,
+            "FIELDS": fields,
             "RAW": content,
         }
@@ -0,0 +1,202 @@
+import string
+from dataclasses import dataclass, fields
+from typing import IO, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+# How {offset} is written in a template; {hex} is always the bare 0xDEADBEEF.
+OFFSET_WRAPPERS: Dict[str, Tuple[str, str]] = {
+    "plain": ("", ""),
+    "str2Offset": ('str2Offset("', '")'),
+    "obfuscate": ('str2Offset(OBFUSCATE("', '"))'),
+}
+
+# per-snippet fields, in the positional order of compiled formatters
+SNIPPET_FIELDS = ("func", "orig", "hex")
+
+# lines per write() when streaming snippets
+WRITE_BATCH = 4096
+
+_parse = string.Formatter().parse
+
+
+def normalize_offset(hex_str: str) -> str:
+    """'31557c0', '0x31557C0', ' 0X31557c0' → '0x31557C0'."""
+    return "0x" + hex_str.strip().lower().replace("0x", "").upper()
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def compile_template(template: str, lib: str = "libil2cpp.so", offset: str = "plain") -> Callable[..., str]:
+    """
+    Compile a snippet template once into a formatter(func, orig, hex).
+
+    Fields: {func}, {orig}, {hex} (bare offset), {offset} (offset in the
+    style's wrapper, see OFFSET_WRAPPERS) and {lib}. The per-style parts —
+    library name and wrapper — are folded into the format string here, so
+    rendering a snippet is a single str.format call.
+
+        compile_template('HOOK("{lib}", {offset}, {func});', offset="str2Offset")
+        → 'HOOK("libil2cpp.so", str2Offset("{2}"), {0});'.format
+    """
+    try:
+        before, after = OFFSET_WRAPPERS[offset]
+    except KeyError:
+        raise ValueError(f"unknown offset wrapper: {offset!r} (use one of {', '.join(OFFSET_WRAPPERS)})") from None
+
+    out = []
+    for literal, name, spec, conversion in _parse(template):
+        out.append(_escape(literal))
+        if name is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"snippet template fields take no format spec: {template!r}")
+        if name == "lib":
+            out.append(_escape(lib))
+        elif name == "offset":
+            out.append(f"{_escape(before)}{{2}}{_escape(after)}")
+        elif name in SNIPPET_FIELDS:
+            out.append(f"{{{SNIPPET_FIELDS.index(name)}}}")
+        else:
+            raise ValueError(f"unknown field {{{name}}} in snippet template {template!r}")
+    return "".join(out).format
+
+
+@dataclass(frozen=True)
+class SnippetStyle:
+    """
+    How one project writes its HOOK and LOGD lines.
+
+    hook / logd:  templates (see compile_template)
+    hook_bare:    HOOK template for entries without an orig pointer
+    default_orig: orig template for entries without one (e.g. "orig_{func}");
+                  takes precedence over hook_bare
+    lib:          library name for {lib}
+    offset:       wrapper for {offset}: "plain", "str2Offset" or "obfuscate"
+    """
+
+    hook: str
+    logd: str
+    hook_bare: Optional[str] = None
+    default_orig: Optional[str] = None
+    lib: str = "libil2cpp.so"
+    offset: str = "plain"
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SnippetStyle":
+        """Style from a config dict; "preset" names the style the other keys override."""
+        data = dict(data)
+        base = PRESETS[data.pop("preset")] if "preset" in data else None
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"unknown snippet style keys: {', '.join(sorted(unknown))}")
+        if base is None:
+            return cls(**data)
+        return cls(**{**{name: getattr(base, name) for name in known}, **data})
+
+
+PRESETS: Dict[str, SnippetStyle] = {
+    # CodeGenerator's output
+    "default": SnippetStyle(
+        hook='HOOK("{lib}", {offset}, {func}, {orig});',
+        hook_bare='HOOK("{lib}", {offset}, {func});',
+        logd='LOGD(OBFUSCATE("Updated Offset | {func} : {hex}"));',
+    ),
+    # the Tk tool's Dump Inspector / offline assistant
+    "tk": SnippetStyle(
+        hook='HOOK("{lib}", {offset}, {func}, {orig});',
+        logd='LOGD(OBFUSCATE("Method: {func}, Offset: {hex}"));',
+        default_orig="orig_{func}",
+        offset="obfuscate",
+    ),
+}
+
+StyleSpec = Union[str, SnippetStyle, Dict, None]
+
+
+def resolve_style(style: StyleSpec) -> SnippetStyle:
+    """A preset name, a SnippetStyle or a config dict (SnippetStyle.from_dict); None is "default"."""
+    if style is None:
+        return PRESETS["default"]
+    if isinstance(style, SnippetStyle):
+        return style
+    if isinstance(style, dict):
+        return SnippetStyle.from_dict(style)
+    try:
+        return PRESETS[style]
+    except KeyError:
+        raise ValueError(f"unknown snippet style: {style!r} (use one of {', '.join(PRESETS)})") from None
+
+
+class SnippetRenderer:
+    """
+    Renders HOOK / LOGD snippets in one SnippetStyle. The templates are
+    compiled once, when the renderer is created; reuse the renderer for
+    many snippets.
+
+        renderer = SnippetRenderer("tk")
+        renderer.hook("get_ATK", "216b910")
+        → 'HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x216B910")), get_ATK, orig_get_ATK);'
+
+    Entries for the iter_* / write_* methods are the generator's dicts:
+    {"func": ..., "offset": ..., "orig": ... (optional)}.
+    """
+
+    def __init__(self, style: StyleSpec = None):
+        self.style = style = resolve_style(style)
+        build = lambda template: compile_template(template, style.lib, style.offset)
+        self._hook = build(style.hook)
+        self._hook_bare = build(style.hook_bare) if style.hook_bare else None
+        self._logd = build(style.logd)
+        self._orig = build(style.default_orig) if style.default_orig else None
+
+    # -------------------------------------------------------------
+    def hook(self, func: str, offset: str, orig: Optional[str] = None) -> str:
+        hex_ = normalize_offset(offset)
+        if not orig:
+            if self._orig is not None:
+                orig = self._orig(func, "", hex_)
+            elif self._hook_bare is not None:
+                return self._hook_bare(func, "", hex_)
+            else:
+                orig = ""
+        return self._hook(func, orig, hex_)
+
+    def logd(self, func: str, offset: str) -> str:
+        return self._logd(func, "", normalize_offset(offset))
+
+    # -------------------------------------------------------------
+    def iter_hooks(self, entries: Iterable[Dict]) -> Iterator[str]:
+        hook = self.hook
+        for entry in entries:
+            yield hook(entry["func"], entry["offset"], entry.get("orig"))
+
+    def iter_logd(self, entries: Iterable[Dict]) -> Iterator[str]:
+        logd, normalize = self._logd, normalize_offset
+        for entry in entries:
+            yield logd(entry["func"], "", normalize(entry["offset"]))
+
+    def write_hooks(self, fp: IO[str], entries: Iterable[Dict]) -> int:
+        """Stream the HOOK lines to fp; returns the number written."""
+        return write_lines(fp, self.iter_hooks(entries))
+
+    def write_logd(self, fp: IO[str], entries: Iterable[Dict]) -> int:
+        """Stream the LOGD lines to fp; returns the number written."""
+        return write_lines(fp, self.iter_logd(entries))
+
+
+def write_lines(fp: IO[str], lines: Iterable[str], batch: int = WRITE_BATCH) -> int:
+    """Write lines (newline-terminated) to fp, `batch` per write(); returns the count."""
+    count = 0
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == batch:
+            fp.write("\n".join(chunk) + "\n")
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        fp.write("\n".join(chunk) + "\n")
+        count += len(chunk)
+    return count
@@ -8,113 +8,90 @@ Pro Offset Updater + Dump Inspector + Offline AI Assistant
 No online calls. Uses difflib for fuzzy matching.
 """
 
-import re
 import os
 import csv
+import queue
 import difflib
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, scrolledtext
 
-HEX_RE = r'0x[0-9A-Fa-f]+'
+from offset_updater import DumpParser, SourceScanner, NameIndex, SnippetRenderer, Cancelled, CancelToken
+from offset_updater.search_index import SearchWorker
+
+# rows added to the inspector table per page (more load on scroll)
+INSPECTOR_PAGE = 300
+# search-as-you-type: wait this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
 
 # ---------------------------
 # Parsing dump.cs (robust)
 # ---------------------------
-def parse_dump(dump_path):
+def parse_dump(dump_path, progress=None, cancel=None):
     """
     Returns mapping: {func_name: {"offset": "0x...", "rva": "0x...", "line": raw_line}}
-    Handles lines like:
-  // RVA: 0x1386024 Offset: 0x1382024 VA: 0x1386024
-  public void AddCommonKey(int key, string location) { }
-    and inline patterns.
+    The format (dump.cs, script.json, inline "name(...) 0x...", "0xHEX : Name",
+    #define tables) is sniffed by offset_updater's dump-format registry and
+    parsed by its compiled backend. progress/cancel follow
+    offset_updater.progress (ProgressEvent callback, CancelToken).
     """
+    index = DumpParser().parse(dump_path, progress=progress, cancel=cancel)
     mapping = {}
-    last_offset = None
-    last_rva = None
-    with open(dump_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for raw in f:
-            line = raw.rstrip('\n')
-            s = line.strip()
-            if not s:
-                continue
-
-            # Look for RVA/Offset comment lines
-            if ('RVA:' in s) or ('Offset:' in s) or ('VA:' in s):
-                m_off = re.search(r'Offset:\s*(0x[0-9A-Fa-f]+)', s)
-                m_rva = re.search(r'RVA:\s*(0x[0-9A-Fa-f]+)', s)
-                last_offset = m_off.group(1).upper() if m_off else None
-                last_rva = m_rva.group(1).upper() if m_rva else None
-                continue
-
-            # Match method signatures (common C# decompiled style)
-            m_func = re.match(r'(?:public|private|protected|internal|static|\s)+[\w<>\[\]]+\s+(?P<name>[A-Za-z_][A-Za-z0-9_:<>]*)\s*\(.*\)', s)
-            if m_func:
-                name = m_func.group('name').strip()
-                if last_offset or last_rva:
-                    mapping[name] = {"offset": last_offset, "rva": last_rva, "line": line}
-                last_offset = last_rva = None
-                continue
-
-            # Inline pattern: method(...) ... 0x123ABC
-            m_inline = re.search(r'(?P<name>[A-Za-z_][A-Za-z0-9_:<>]*)\s*\([^)]*\).*?(?P<addr>' + HEX_RE + r')', s)
-            if m_inline:
-                mapping[m_inline.group('name')] = {"offset": m_inline.group('addr').upper(), "rva": None, "line": line}
-                continue
-
-            # Alternate: 0xHEX : Name
-            m_alt = re.search(r'(0x[0-9A-Fa-f]+)\s*[:\-]\s*([A-Za-z_][A-Za-z0-9_:<>]*)', s)
-            if m_alt:
-                mapping[m_alt.group(2)] = {"offset": m_alt.group(1).upper(), "rva": None, "line": line}
-                continue
-
+    for name, entry in index.items():
+        mapping[name] = {
+            "offset": entry.offset.upper() or None,
+            "rva": entry.rva.upper() or None,
+            "line": entry.raw,
+        }
     return mapping
 
 
+# ---------------------------
+# Name index (hashed lookups)
+# ---------------------------
+def build_name_index(mapping):
+    """
+    {lowercase name: mapping key}, also keyed by the lowercase "::" tail,
+    so "player::update" and "update" both resolve in O(1). The first key in
+    mapping order wins, as the old linear best-match scan did.
+    """
+    index = {}
+    for key in mapping:
+        low = key.lower()
+        index.setdefault(low, key)
+        index.setdefault(low.rsplit("::", 1)[-1], key)
+    return index
+
+
 # ---------------------------
 # Compare offsets in main.cpp
 # ---------------------------
-def compare_offsets(src_path, mapping):
+def compare_offsets(src_path, mapping, index=None):
     """Find all LOGD/HOOK lines in source that differ from dump mapping (read-only)."""
-    with open(src_path, 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
+    if index is None:
+        index = build_name_index(mapping)
+
+    scanned = SourceScanner(src_path).scan()
+    # only "Method: X, Offset: 0x..."-style LOGD names are real function names;
+    # the scanner's catch-all patterns would report log words as missing
+    entries = [("LOGD", e) for e in scanned["LOGD"] if e["pattern"] == "labelled"]
+    entries += [("HOOK", e) for e in scanned["HOOKS"]]
+    entries.sort(key=lambda x: x[1]["span"])
 
     results = []
     missing = []
     used_dump = set()
 
-    def find_best_match(func):
-        func_low = func.lower()
-        for key in mapping:
-            if key.lower() == func_low or key.split("::")[-1].lower() == func_low:
-                return mapping[key], key
-        return None, None
-
-    # patterns
-    pat_logd = re.compile(r'Method:\s*([A-Za-z_][A-Za-z0-9_:]*)\s*,\s*Offset:\s*(' + HEX_RE + r')', re.IGNORECASE)
-    pat_hook = re.compile(r'HOOK\([^,]+,\s*str2Offset\s*\(\s*OBFUSCATE\(\s*"?(' + HEX_RE + r')"?\s*\)\s*\)\s*,\s*([A-Za-z_:][A-Za-z0-9_:]*)', re.IGNORECASE)
-
-    for i, line in enumerate(lines):
-        m = pat_logd.search(line)
-        if m:
-            func, old_off = m.group(1), m.group(2).upper()
-            found, key = find_best_match(func)
-            if found and found.get("offset") and found["offset"].upper() != old_off:
-                results.append({"type": "LOGD", "name": key or func, "old": old_off, "new": found["offset"].upper(), "src_line": i+1})
-                used_dump.add(key or func)
-            elif not found:
-                missing.append(func)
-            continue
-
-        m2 = pat_hook.search(line)
-        if m2:
-            old_off, func = m2.group(1).upper(), m2.group(2)
-            found, key = find_best_match(func)
-            if found and found.get("offset") and found["offset"].upper() != old_off:
-                results.append({"type": "HOOK", "name": key or func, "old": old_off, "new": found["offset"].upper(), "src_line": i+1})
-                used_dump.add(key or func)
-            elif not found:
-                missing.append(func)
-            continue
+    for kind, e in entries:
+        func, old_off = e["func"], e["offset"].upper()
+        low = func.lower()
+        key = index.get(low) or index.get(low.rsplit("::", 1)[-1])
+        found = mapping[key] if key else None
+        if found and found.get("offset") and found["offset"].upper() != old_off:
+            results.append({"type": kind, "name": key, "old": old_off, "new": found["offset"].upper(), "src_line": e["line"]})
+            used_dump.add(key)
+        elif not found:
+            missing.append(func)
 
     # create manual list file
     manual_file = os.path.join(os.path.dirname(src_path), "offset_changes.txt")
@@ -132,28 +109,49 @@ def compare_offsets(src_path, mapping):
             for m in sorted(set(missing)):
                 mf.write(m + "\n")
 
+        if scanned["ERRORS"]:
+            mf.write("\n# Not scanned:\n")
+            for err in scanned["ERRORS"]:
+                mf.write(f"{err['file']}: {err['error']}\n")
+
     return {
         "manual": manual_file,
         "changes": results,
         "missing": sorted(set(missing)),
-        "unused_dump": [k for k in mapping if k not in used_dump]
+        "unused_dump": [k for k in mapping if k not in used_dump],
+        "errors": scanned["ERRORS"]
     }
 
 
 # ---------------------------
 # Dump Inspector helpers
 # ---------------------------
+# "tk" snippet preset: str2Offset(OBFUSCATE(...)) hooks, orig_<func> pointers
+SNIPPETS = SnippetRenderer("tk")
+
 def generate_hook_line(offset, func_name, orig_name=None):
-    orig_name = orig_name or f"orig_{func_name}"
-    return f'HOOK("libil2cpp.so", str2Offset(OBFUSCATE("{offset}")), {func_name}, {orig_name});'
+    return SNIPPETS.hook(func_name, offset, orig_name)
 
 def generate_logd_line(offset, func_name):
-    return f'LOGD(OBFUSCATE("Method: {func_name}, Offset: {offset}"));'
+    return SNIPPETS.logd(func_name, offset)
 
 
 # ---------------------------
 # Offline AI Assistant (fuzzy matches)
 # ---------------------------
+def quick_suggest(func_name, mapping, index, topn=6, cancelled=None):
+    """Search-as-you-type suggestions: prefix, then substring hits from the name index, ranked by similarity."""
+    low = func_name.strip().lower()
+    scored = []
+    for pos in index.complete(low, limit=topn * 20):
+        if cancelled and cancelled():
+            break
+        c = index.names[pos]
+        score = difflib.SequenceMatcher(None, low, index.lower[pos]).ratio()
+        scored.append((c, mapping[c].get("offset"), round(score, 3)))
+    scored.sort(key=lambda x: x[2], reverse=True)
+    return scored[:topn]
+
 def fuzzy_suggest(func_name, mapping, topn=6):
     """Return list of (candidate_name, offset, score) sorted by score desc."""
     names = list(mapping.keys())
@@ -200,9 +198,31 @@ class OffsetToolPro:
         self._build_checker_tab()
         self._build_inspector_tab()
         self._build_ai_tab()
+        self._build_load_bar()
 
         # shared data
         self.mapping = {}
+        self.name_index = {}
+        self.search_index = NameIndex(())
+        self.mapping_key = None
+        self.inspect_rows = ()
+        self.inspect_shown = 0
+        self.inspect_loading = False
+
+        # search-as-you-type: queries run on worker threads, results come
+        # back through a queue drained on the Tk thread
+        self.search_results = queue.Queue()
+        self.inspect_worker = SearchWorker(lambda gen, rows: self.search_results.put(("inspect", gen, rows)))
+        self.ai_worker = SearchWorker(lambda gen, sugg: self.search_results.put(("ai", gen, sugg)))
+        self.search_after = {}
+        self.root.after(30, self._poll_search_results)
+
+        # dump loading runs on a thread; progress events come back through
+        # a queue drained on the Tk thread
+        self.load_events = queue.Queue()
+        self.load_token = None
+        self.load_key = None
+        self.load_pending = []
         self.dump_path = None
         self.src_path = None
 
@@ -254,21 +274,30 @@ class OffsetToolPro:
         ttk.Label(top, text="Search:").grid(row=1, column=0, sticky='w', pady=6)
         self.inspect_search = ttk.Entry(top, width=50)
         self.inspect_search.grid(row=1, column=1, sticky='w')
+        self.inspect_search.bind("<KeyRelease>", lambda e: self._debounce("inspect", self._submit_inspector_search))
         ttk.Button(top, text="Find", command=self.run_inspector_search).grid(row=1, column=2, sticky='w')
 
         # filter checkboxes
         self.chk_methods = tk.BooleanVar(value=True)
         ttk.Checkbutton(top, text="Methods", variable=self.chk_methods).grid(row=2, column=1, sticky='w')
 
-        # table
+        # table (paged: rows are inserted a page at a time as you scroll)
+        table = ttk.Frame(frame)
+        table.pack(fill='both', padx=8, pady=6, expand=True)
         cols = ("name", "offset", "rva", "sample")
-        self.inspect_tree = ttk.Treeview(frame, columns=cols, show='headings', height=18)
+        self.inspect_tree = ttk.Treeview(table, columns=cols, show='headings', height=18)
         for c in cols:
             self.inspect_tree.heading(c, text=c.title())
             self.inspect_tree.column(c, width=220 if c=='name' else 130, anchor='w')
-        self.inspect_tree.pack(fill='both', padx=8, pady=6, expand=True)
+        self.inspect_scroll = ttk.Scrollbar(table, orient='vertical', command=self.inspect_tree.yview)
+        self.inspect_tree.configure(yscrollcommand=self._on_inspector_scroll)
+        self.inspect_scroll.pack(side='right', fill='y')
+        self.inspect_tree.pack(side='left', fill='both', expand=True)
         self.inspect_tree.bind("<Double-1>", self._inspect_row_copy)
 
+        self.inspect_status = ttk.Label(frame, text="")
+        self.inspect_status.pack(anchor='w', padx=8)
+
         # action buttons
         acts = ttk.Frame(frame)
         acts.pack(fill='x', padx=8, pady=6)
@@ -293,6 +322,7 @@ class OffsetToolPro:
         ttk.Label(top, text="Enter missing function name:").grid(row=1, column=0, sticky='w', pady=6)
         self.ai_query = ttk.Entry(top, width=60)
         self.ai_query.grid(row=1, column=1, sticky='w')
+        self.ai_query.bind("<KeyRelease>", lambda e: self._debounce("ai", self._submit_ai_suggest))
 
         ttk.Button(top, text="Suggest Matches (offline)", command=self.run_ai_suggest).grid(row=1, column=2, padx=6)
 
@@ -316,9 +346,137 @@ class OffsetToolPro:
         self.ai_output.pack(fill='both', padx=8, pady=6, expand=True)
         self.ai_output.bind("<Double-1>", self.ai_output_copy)
 
+    # -------------------------
+    # Build dump-load status bar
+    # -------------------------
+    def _build_load_bar(self):
+        bar = ttk.Frame(self.root)
+        bar.pack(fill='x', side='bottom', padx=8, pady=4)
+        self.load_status = ttk.Label(bar, text="")
+        self.load_status.pack(side='left')
+        self.load_cancel = ttk.Button(bar, text="Cancel", command=self.cancel_load, state='disabled')
+        self.load_cancel.pack(side='right')
+        self.load_progress = ttk.Progressbar(bar, length=240, maximum=100)
+        self.load_progress.pack(side='right', padx=6)
+
     # -------------------------
     # Shared helpers
     # -------------------------
+    def _load_mapping(self, path, then=None):
+        """
+        Parse the dump once; later actions reuse it until the file changes.
+
+        Parsing runs on a thread with the progress bar, ETA and Cancel button
+        in the status bar; then() runs on the Tk thread once the mapping is
+        ready (right away when it already is).
+        """
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            messagebox.showerror("Error parsing dump", str(e))
+            return
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        if key == self.mapping_key:
+            if then is not None:
+                then()
+            return
+
+        polling = self.load_token is not None
+        if polling:
+            if key == self.load_key:
+                if then is not None:
+                    self.load_pending.append(then)
+                return
+            self.load_token.cancel()
+
+        # queued searches point into the old index
+        self.inspect_worker.cancel()
+        self.ai_worker.cancel()
+
+        token = CancelToken()
+        self.load_token = token
+        self.load_key = key
+        self.load_pending = [then] if then is not None else []
+        self.load_progress.config(value=0)
+        self.load_status.config(text=f"Loading {os.path.basename(path)}...")
+        self.load_cancel.config(state='normal')
+
+        def work():
+            try:
+                mapping = parse_dump(path, progress=lambda ev: self.load_events.put((token, "progress", ev)),
+                                     cancel=token)
+                loaded = (key, mapping, build_name_index(mapping), NameIndex(mapping))
+                self.load_events.put((token, "done", loaded))
+            except Cancelled:
+                self.load_events.put((token, "cancelled", None))
+            except Exception as e:
+                self.load_events.put((token, "error", str(e)))
+
+        threading.Thread(target=work, daemon=True).start()
+        if not polling:
+            self.root.after(50, self._poll_load)
+
+    def _poll_load(self):
+        last = None
+        try:
+            while True:
+                token, kind, payload = self.load_events.get_nowait()
+                if token is not self.load_token:
+                    continue        # a superseded load
+                if kind == "progress":
+                    last = payload
+                    continue
+                self._finish_load(kind, payload)
+                return
+        except queue.Empty:
+            pass
+        if last is not None:
+            if last.fraction is not None:
+                self.load_progress.config(value=last.fraction * 100)
+            self.load_status.config(text=str(last))
+        self.root.after(50, self._poll_load)
+
+    def _finish_load(self, kind, payload):
+        pending, self.load_pending = self.load_pending, []
+        self.load_token = None
+        self.load_cancel.config(state='disabled')
+        if kind == "done":
+            self.mapping_key, self.mapping, self.name_index, self.search_index = payload
+            self.load_progress.config(value=100)
+            self.load_status.config(text=f"Loaded {len(self.mapping)} entries")
+            for then in pending:
+                then()
+        elif kind == "cancelled":
+            self.load_progress.config(value=0)
+            self.load_status.config(text="Dump load cancelled")
+        else:
+            self.load_status.config(text="")
+            messagebox.showerror("Error parsing dump", payload)
+
+    def cancel_load(self):
+        if self.load_token is not None:
+            self.load_token.cancel()
+            self.load_status.config(text="Cancelling...")
+
+    def _debounce(self, key, callback):
+        """Run callback once typing pauses for SEARCH_DEBOUNCE_MS."""
+        pending = self.search_after.get(key)
+        if pending:
+            self.root.after_cancel(pending)
+        self.search_after[key] = self.root.after(SEARCH_DEBOUNCE_MS, callback)
+
+    def _poll_search_results(self):
+        try:
+            while True:
+                kind, gen, result = self.search_results.get_nowait()
+                if kind == "inspect" and self.inspect_worker.is_current(gen):
+                    self._show_inspector_rows(result)
+                elif kind == "ai" and self.ai_worker.is_current(gen):
+                    self._show_ai_suggestions(result)
+        except queue.Empty:
+            pass
+        self.root.after(30, self._poll_search_results)
+
     def _browse_file(self, entry, mode='dump'):
         path = filedialog.askopenfilename(filetypes=[("All files","*.*")])
         if path:
@@ -327,10 +485,7 @@ class OffsetToolPro:
             if mode == 'dump':
                 self.dump_path = path
                 # pre-parse mapping so all tabs can use it
-                try:
-                    self.mapping = parse_dump(path)
-                except Exception as e:
-                    messagebox.showerror("Error parsing dump", str(e))
+                self._load_mapping(path)
             elif mode == 'src':
                 self.src_path = path
 
@@ -343,9 +498,11 @@ class OffsetToolPro:
         if not dump or not src:
             messagebox.showwarning("Missing files", "Select both dump.cs and main.cpp first.")
             return
+        self._load_mapping(dump, then=lambda: self._show_check(src))
+
+    def _show_check(self, src):
         try:
-            self.mapping = parse_dump(dump)
-            res = compare_offsets(src, self.mapping)
+            res = compare_offsets(src, self.mapping, self.name_index)
             # show
             for i in self.checker_tree.get_children(): self.checker_tree.delete(i)
             for r in res["changes"]:
@@ -356,6 +513,9 @@ class OffsetToolPro:
             if res["missing"]:
                 self.checker_report.insert(tk.END, f"\nMissing in dump: {len(res['missing'])}\n")
                 self.checker_report.insert(tk.END, "\n".join(res['missing']) + "\n")
+            if res["errors"]:
+                self.checker_report.insert(tk.END, f"\nNot scanned: {len(res['errors'])}\n")
+                self.checker_report.insert(tk.END, "\n".join(f"{e['file']}: {e['error']}" for e in res['errors']) + "\n")
             messagebox.showinfo("Done", f"Check complete. Manual patch: {res['manual']}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -368,24 +528,51 @@ class OffsetToolPro:
         if not dump:
             messagebox.showwarning("No dump", "Select dump.cs first.")
             return
-        try:
-            self.mapping = parse_dump(dump)
-            self._populate_inspector_tree(self.mapping)
-            messagebox.showinfo("Loaded", f"Loaded {len(self.mapping)} entries from dump.")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self._load_mapping(dump, then=self._show_all_entries)
+
+    def _show_all_entries(self):
+        self._populate_inspector_tree(self.mapping)
+        messagebox.showinfo("Loaded", f"Loaded {len(self.mapping)} entries from dump.")
 
     def _populate_inspector_tree(self, mapping, filter_text=None):
-        for i in self.inspect_tree.get_children(): self.inspect_tree.delete(i)
-        keys = sorted(mapping.keys(), key=lambda x: x.lower())
-        for k in keys:
-            if filter_text:
-                if filter_text.lower() not in k.lower(): continue
-            v = mapping[k]
+        """Show the matches of filter_text; only the first page is inserted."""
+        self.inspect_worker.cancel()
+        self._show_inspector_rows(self.search_index.search(filter_text or ""))
+
+    def _show_inspector_rows(self, rows):
+        self.inspect_tree.delete(*self.inspect_tree.get_children())
+        self.inspect_tree.yview_moveto(0)
+        self.inspect_rows = rows
+        self.inspect_shown = 0
+        self._inspector_load_more()
+
+    def _submit_inspector_search(self):
+        self.search_after.pop("inspect", None)
+        if self.mapping:
+            self.inspect_worker.submit(self.search_index.search, self.inspect_search.get())
+
+    def _inspector_load_more(self):
+        self.inspect_loading = False
+        rows = self.inspect_rows
+        end = min(self.inspect_shown + INSPECTOR_PAGE, len(rows))
+        names = self.search_index.names
+        for pos in rows[self.inspect_shown:end]:
+            k = names[pos]
+            v = self.mapping[k]
             offset = v.get("offset") or ""
             rva = v.get("rva") or ""
             sample = v.get("line") or ""
             self.inspect_tree.insert("", tk.END, values=(k, offset, rva, sample[:80]))
+        self.inspect_shown = end
+        self.inspect_status.config(text=f"Showing {end} of {len(rows)} matches")
+
+    def _on_inspector_scroll(self, first, last):
+        self.inspect_scroll.set(first, last)
+        # near the bottom: queue the next page once
+        if (float(last) >= 0.95 and not self.inspect_loading
+                and self.inspect_shown < len(self.inspect_rows)):
+            self.inspect_loading = True
+            self.inspect_tree.after_idle(self._inspector_load_more)
 
     def run_inspector_search(self):
         term = self.inspect_search.get().strip()
@@ -394,7 +581,8 @@ class OffsetToolPro:
             if not dump:
                 messagebox.showwarning("No dump", "Select dump.cs first.")
                 return
-            self.mapping = parse_dump(dump)
+            self._load_mapping(dump, then=lambda: self._populate_inspector_tree(self.mapping, filter_text=term))
+            return
         self._populate_inspector_tree(self.mapping, filter_text=term)
 
     def _inspect_row_copy(self, event):
@@ -461,16 +649,27 @@ class OffsetToolPro:
         if not dump:
             messagebox.showwarning("No dump", "Select dump.cs first.")
             return
-        self.mapping = parse_dump(dump)
         q = self.ai_query.get().strip()
         if not q:
             messagebox.showwarning("Empty", "Type a function name to search.")
             return
-        sugg = fuzzy_suggest(q, self.mapping, topn=12)
+        self._load_mapping(dump, then=lambda: self._show_ai_fuzzy(q))
+
+    def _show_ai_fuzzy(self, q):
+        self.ai_worker.cancel()
+        self._show_ai_suggestions(fuzzy_suggest(q, self.mapping, topn=12))
+
+    def _show_ai_suggestions(self, sugg):
         for i in self.ai_suggestions.get_children(): self.ai_suggestions.delete(i)
         for cand, off, score in sugg:
             self.ai_suggestions.insert("", tk.END, values=(cand, off or "", score))
 
+    def _submit_ai_suggest(self):
+        self.search_after.pop("ai", None)
+        q = self.ai_query.get().strip()
+        if self.mapping and q:
+            self.ai_worker.submit(quick_suggest, q, self.mapping, self.search_index, 12)
+
     def ai_copy_choice(self, event):
         sel = self.ai_suggestions.selection()
         if not sel: return
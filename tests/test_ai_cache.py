@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import time
+from gui.services.ai_cache import ResponseCache, shared_cache
+
+
+# ---------------------------------------------------------
+# Helper: a fresh cache file
+# ---------------------------------------------------------
+def create_cache(**limits) -> ResponseCache:
+    return ResponseCache(os.path.join(tempfile.mkdtemp(), "ai_cache.sqlite"), **limits)
+
+
+# ---------------------------------------------------------
+# Test: keyed by model + prompt, with hit/miss counts
+# ---------------------------------------------------------
+def test_get_put_and_stats():
+    cache = create_cache()
+    assert cache.get("gemini-2.5-flash", "prompt") is None
+
+    cache.put("gemini-2.5-flash", "prompt", "answer")
+    assert cache.get("gemini-2.5-flash", "prompt") == "answer"
+    assert cache.get("gemini-2.5-pro", "prompt") is None       # other model, other key
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"]) == (1, len("answer"))
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    # totals persist across instances
+    again = ResponseCache(cache.path)
+    assert again.get("gemini-2.5-flash", "prompt") == "answer"
+    assert again.stats()["total_hits"] == 2
+    assert again.stats()["hits"] == 1
+
+    again.clear()
+    assert again.stats()["entries"] == 0
+
+
+# ---------------------------------------------------------
+# Test: age and size eviction
+# ---------------------------------------------------------
+def test_age_eviction():
+    cache = create_cache(max_age=0.05)
+    cache.put("m", "p", "old")
+    time.sleep(0.1)
+    assert cache.get("m", "p") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_size_eviction_drops_least_recently_used():
+    cache = create_cache(max_bytes=25)
+    cache.put("m", "a", "x" * 10)
+    time.sleep(0.01)
+    cache.put("m", "b", "y" * 10)
+    time.sleep(0.01)
+    assert cache.get("m", "a") == "x" * 10          # "a" is now the most recent
+    time.sleep(0.01)
+    cache.put("m", "c", "z" * 10)
+
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "a") is not None
+    assert cache.get("m", "c") is not None
+    assert cache.stats()["bytes"] <= 25
+
+    cache.put("m", "huge", "w" * 100)               # larger than the whole cache
+    assert cache.get("m", "huge") is None
+
+
+def test_shared_between_threads():
+    path = os.path.join(tempfile.mkdtemp(), "ai_cache.sqlite")
+    cache = shared_cache(path)
+    assert shared_cache(path) is cache
+
+    def work(n):
+        for i in range(20):
+            cache.put("m", f"{n}-{i}", str(i))
+            assert cache.get("m", f"{n}-{i}") == str(i)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.stats()["entries"] == 80
+
+
+def test_delete():
+    cache = create_cache()
+    cache.put("m", "p", "bad answer")
+    cache.delete("m", "p")
+    assert cache.get("m", "p") is None
@@ -0,0 +1,123 @@
+import threading
+import time
+from gui.services.ai_chunker import AIChunker, TokenBucket, chunk_boundaries, split_cpp
+
+
+# ---------------------------------------------------------
+# Helper: fake server with the GeminiAPI.generate interface
+# ---------------------------------------------------------
+class FakeGemini:
+    """Echoes prompts upper-cased; fails the first `failures` calls of each prompt."""
+
+    def __init__(self, failures=0, delay=0.02):
+        self.failures = failures
+        self.delay = delay
+        self.calls = {}
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def generate(self, prompt, model="gemini-2.5-flash"):
+        with self.lock:
+            self.calls[prompt] = self.calls.get(prompt, 0) + 1
+            attempt = self.calls[prompt]
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if attempt <= self.failures:
+                raise RuntimeError("Gemini SDK error: 503")
+            return prompt.upper()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+CPP = """#include <jni.h>
+
+void *hack_thread(void *) {
+    HOOK("libil2cpp.so", 0x1000, get_ATK, orig_get_ATK);
+    HOOK("libil2cpp.so", 0x2000, get_DEF, orig_get_DEF);
+    return nullptr;
+}
+
+int get_HP() {
+    return 1; // }
+}
+"""
+
+
+# ---------------------------------------------------------
+# Test: splitting keeps every byte and cuts on boundaries
+# ---------------------------------------------------------
+def test_split_cpp_boundaries():
+    bounds = chunk_boundaries(CPP)
+    assert CPP.index("void *hack_thread") in bounds
+    assert CPP.index('    HOOK("libil2cpp.so", 0x2000') in bounds
+    assert CPP.index("int get_HP") in bounds
+    assert CPP.index("    return 1;") not in bounds     # inside a function
+
+    for size in (20, 60, 100, len(CPP)):
+        chunks = split_cpp(CPP, size)
+        assert "".join(chunks) == CPP
+        for chunk in chunks[1:]:
+            assert CPP.index(chunk) in bounds or len(chunk) <= size
+
+    assert split_cpp("", 10) == [""]
+
+
+# ---------------------------------------------------------
+# Test: ordered answers, bounded concurrency, retries
+# ---------------------------------------------------------
+def test_generate_all_ordered_and_bounded():
+    api = FakeGemini()
+    chunker = AIChunker(api, concurrency=3, rate=1000, burst=1000, backoff=0)
+    prompts = [f"chunk {i}" for i in range(12)]
+
+    assert chunker.generate_all(prompts) == [p.upper() for p in prompts]
+    assert 1 < api.peak <= 3
+    assert chunker.stats == {"requests": 12, "retries": 0, "failed": 0}
+
+
+def test_generate_all_retries_and_gives_up():
+    api = FakeGemini(failures=2, delay=0)
+    chunker = AIChunker(api, retries=3, rate=1000, burst=1000, backoff=0)
+    assert chunker.generate_all(["a", "b"]) == ["A", "B"]
+    assert chunker.stats["retries"] == 4
+
+    chunker = AIChunker(FakeGemini(failures=5, delay=0), retries=1, rate=1000, burst=1000, backoff=0)
+    assert chunker.generate_all(["a"]) == [None]
+    assert chunker.stats["failed"] == 1
+
+
+def test_rejected_answers_are_retried():
+    api = FakeGemini(delay=0)
+    chunker = AIChunker(api, retries=2, rate=1000, burst=1000, backoff=0)
+    assert chunker.generate_all(["x"], accept=lambda i, answer: False) == [None]
+    assert api.calls["x"] == 3
+
+
+def test_token_bucket_paces_requests():
+    chunker = AIChunker(FakeGemini(delay=0), concurrency=10, rate=50, burst=1, backoff=0)
+    start = time.monotonic()
+    chunker.generate_all([str(i) for i in range(6)])
+    assert time.monotonic() - start >= 5 / 50 * 0.8
+    assert isinstance(chunker.bucket, TokenBucket)
+
+
+# ---------------------------------------------------------
+# Test: the chunker is the only layer that retries
+# ---------------------------------------------------------
+def test_chunker_turns_off_transport_retries():
+    class RetryingGemini(FakeGemini):
+        retries = None
+
+        def without_retries(self):
+            self.retries = 0
+            return self
+
+    api = RetryingGemini(failures=1, delay=0)
+    chunker = AIChunker(api, rate=1000, burst=10, backoff=0)
+    assert api.retries == 0
+    assert chunker.generate_all(["a", "b"]) == ["A", "B"]
+    assert chunker.stats["retries"] == 2
@@ -0,0 +1,200 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from gui.services.ai_client import GeminiClient, GeminiError, client_metrics, get_client
+
+
+# ---------------------------------------------------------
+# Helper: local stub of the Gemini REST API
+# ---------------------------------------------------------
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["contents"][0]["parts"][0]["text"]
+        server.requests.append((self.path, self.headers["x-goog-api-key"], prompt))
+
+        if server.failures:
+            server.failures -= 1
+            return self._json(503, {"error": {"code": 503, "message": "overloaded"}})
+        if prompt == "bad":
+            return self._json(400, {"error": {"code": 400, "message": "invalid prompt"}})
+        if prompt == "slow":
+            time.sleep(0.5)
+
+        if "streamGenerateContent" in self.path:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for word in prompt.upper().split():
+                event = json.dumps({"candidates": [{"content": {"parts": [{"text": word + " "}]}}]})
+                data = f"data: {event}\r\n\r\n".encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self._json(200, {"candidates": [{"content": {"parts": [{"text": prompt.upper()}]}}]})
+
+    def _json(self, status, data):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    httpd.requests = []
+    httpd.failures = 0
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def client_for(server, **options):
+    options.setdefault("backoff", 0)
+    return GeminiClient("test-key", f"http://127.0.0.1:{server.server_port}", **options)
+
+
+# ---------------------------------------------------------
+# Test: requests reuse one kept-alive connection
+# ---------------------------------------------------------
+def test_generate_keeps_connection_alive(server):
+    client = client_for(server)
+    assert client.generate("hello", "gemini-2.5-flash") == "HELLO"
+    assert client.generate("again", "gemini-2.5-flash") == "AGAIN"
+
+    assert server.requests[0] == ("/v1beta/models/gemini-2.5-flash:generateContent", "test-key", "hello")
+    assert server.connections == 1
+
+    m = client.metrics.snapshot()
+    assert (m["requests"], m["connections"], m["reused"], m["failed"]) == (2, 1, 1, 0)
+    assert m["bytes_sent"] > 0 and m["bytes_received"] > 0
+    assert 0 < m["latency_avg"] <= m["latency_max"]
+
+
+def test_dropped_idle_connection_is_replaced(server):
+    client = client_for(server)
+    assert client.generate("one", "m") == "ONE"
+    client._idle[0].sock.shutdown(socket.SHUT_RDWR)     # as if the server had timed it out
+    assert client.generate("two", "m") == "TWO"
+    m = client.metrics.snapshot()
+    assert (m["connections"], m["reused"], m["retries"]) == (2, 1, 0)
+
+
+def test_concurrent_requests_bounded_by_pool(server):
+    client = client_for(server, pool_size=2)
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(client.generate(f"p{i}", "m")))
+               for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == sorted(f"P{i}" for i in range(8))
+    assert client.metrics.snapshot()["connections"] <= 2
+
+
+# ---------------------------------------------------------
+# Test: retries, errors and timeouts
+# ---------------------------------------------------------
+def test_retries_server_errors(server):
+    server.failures = 2
+    client = client_for(server, retries=2)
+    assert client.generate("x", "m") == "X"
+    assert client.metrics.snapshot()["retries"] == 2
+
+    server.failures = 5
+    with pytest.raises(GeminiError) as info:
+        client.generate("x", "m")
+    assert info.value.status == 503
+
+
+def test_per_call_retries(server):
+    server.failures = 1
+    client = client_for(server, retries=3)
+    with pytest.raises(GeminiError):
+        client.generate("x", "m", retries=0)        # the caller retries itself
+    assert len(server.requests) == 1
+    assert client.metrics.snapshot()["retries"] == 0
+
+
+def test_connection_error_releases_pool_slot(server, monkeypatch):
+    import http.client
+
+    client = client_for(server, pool_size=1)
+
+    def refuse(*args, **kwargs):
+        raise OSError("cannot create connection")
+
+    monkeypatch.setattr(http.client, "HTTPConnection", refuse)
+    with pytest.raises(OSError):
+        client.generate("x", "m")
+    assert client._slots.acquire(timeout=1)      # the slot was given back
+    client._slots.release()
+
+
+def test_client_errors_are_not_retried(server):
+    client = client_for(server, retries=3)
+    with pytest.raises(GeminiError, match="invalid prompt"):
+        client.generate("bad", "m")
+    assert len(server.requests) == 1
+    assert client.metrics.snapshot()["failed"] == 1
+
+
+def test_read_timeout(server):
+    client = client_for(server, read_timeout=0.1, retries=1)
+    with pytest.raises(OSError):
+        client.generate("slow", "m")
+    assert len(server.requests) == 2
+    assert client.generate("fast", "m") == "FAST"
+
+
+# ---------------------------------------------------------
+# Test: streaming
+# ---------------------------------------------------------
+def test_generate_stream(server):
+    client = client_for(server)
+    assert list(client.generate_stream("a b c", "m")) == ["A ", "B ", "C "]
+    assert server.requests[0][0] == "/v1beta/models/m:streamGenerateContent?alt=sse"
+    assert client.generate("after", "m") == "AFTER"
+    assert server.connections == 1              # the finished stream went back to the pool
+
+    stream = client.generate_stream("x y z", "m")
+    assert next(stream) == "X "
+    stream.close()                              # dropped, not returned half-read
+    assert client.generate("next", "m") == "NEXT"
+    metrics = client.metrics.snapshot()
+    assert (metrics["cancelled"], metrics["failed"]) == (1, 0)      # the caller stopped, not the server
+
+
+# ---------------------------------------------------------
+# Test: one client per key in the process
+# ---------------------------------------------------------
+def test_get_client_is_shared(server):
+    url = f"http://127.0.0.1:{server.server_port}"
+    client = get_client("shared-key", url, backoff=0)
+    assert get_client("shared-key", url) is client
+    assert get_client("other-key", url) is not client
+
+    client.generate("q", "m")
+    assert client_metrics()["requests"] >= 1
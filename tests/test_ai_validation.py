@@ -0,0 +1,191 @@
+import pytest
+from gui.services.ai_validation import DriftError, StreamValidator, iter_tokens, validate_stream, verify_update
+from offset_updater.progress import Cancelled, CancelToken
+
+
+ORIGINAL = """void hack() {
+    HOOK("libil2cpp.so", 0x1A2B, get_ATK, orig_get_ATK);
+    HOOK("libil2cpp.so", 0x3C4D, get_DEF, orig_get_DEF);
+}
+"""
+
+UPDATED = ORIGINAL.replace("0x1A2B", "0x5E6F")
+
+
+# ---------------------------------------------------------
+# Helper: split text into pieces of n characters
+# ---------------------------------------------------------
+def pieces(text, n):
+    return [text[i:i + n] for i in range(0, len(text), n)]
+
+
+class Stream:
+    """Generator-like stream that records whether close() was called."""
+
+    def __init__(self, parts):
+        self.parts = list(parts)
+        self.sent = 0
+        self.closed = False
+
+    def __iter__(self):
+        for part in self.parts:
+            self.sent += 1
+            yield part
+
+    def close(self):
+        self.closed = True
+
+
+# ---------------------------------------------------------
+# Test: tokens cover the whole text
+# ---------------------------------------------------------
+def test_tokens_cover_text():
+    assert "".join(token for _, token in iter_tokens(ORIGINAL)) == ORIGINAL
+
+
+# ---------------------------------------------------------
+# Test: any split of the stream gives the same result
+# ---------------------------------------------------------
+def test_split_pieces_including_hex():
+    for n in (1, 2, 3, 5, 17, len(UPDATED)):
+        shown = []
+        validator = validate_stream(ORIGINAL, pieces(UPDATED, n), on_text=shown.append)
+        assert validator.updated == UPDATED
+        assert UPDATED.startswith("".join(shown))
+        assert [(old, new) for _, old, new in validator.changes] == [("0x1A2B", "0x5E6F")]
+        assert validator.changes[0][0] == ORIGINAL.index("0x1A2B")
+
+
+def test_code_fence_is_dropped():
+    fenced = "```cpp\n" + UPDATED + "```\n"
+    for n in (1, 4, len(fenced)):
+        assert validate_stream(ORIGINAL, pieces(fenced, n)).updated == UPDATED
+
+
+def test_whitespace_and_line_endings_come_from_original():
+    original = ORIGINAL.replace("\n", "\r\n")
+    answer = UPDATED.replace("    ", "\t")
+    assert validate_stream(original, pieces(answer, 7)).updated == UPDATED.replace("\n", "\r\n")
+
+
+# ---------------------------------------------------------
+# Test: drift stops the stream early
+# ---------------------------------------------------------
+def test_drift_raises_and_closes_stream():
+    drifted = UPDATED.replace("get_DEF,", "get_DEFENSE,")
+    stream = Stream(pieces(drifted, 4))
+    with pytest.raises(DriftError) as info:
+        validate_stream(ORIGINAL, stream)
+
+    assert info.value.line == 3
+    assert (info.value.expected, info.value.got) == ("get_DEF", "get_DEFENSE")
+    assert stream.closed
+    assert stream.sent < len(stream.parts)
+
+
+def test_hex_cannot_replace_other_tokens():
+    with pytest.raises(DriftError):
+        validate_stream(ORIGINAL, [ORIGINAL.replace("get_ATK", "0x10")])
+
+
+def test_truncated_and_extra_output():
+    with pytest.raises(DriftError) as info:
+        validate_stream(ORIGINAL, [UPDATED[:UPDATED.index("orig_get_ATK")]])
+    assert info.value.got == "<end of output>"
+
+    with pytest.raises(DriftError):
+        validate_stream(ORIGINAL, [UPDATED + "int extra;\n"])
+
+
+def test_cancel_closes_stream():
+    cancel = CancelToken()
+    stream = Stream(pieces(UPDATED, 8))
+
+    def on_text(text):
+        cancel.cancel()
+
+    with pytest.raises(Cancelled):
+        validate_stream(ORIGINAL, stream, on_text=on_text, cancel=cancel)
+    assert stream.closed
+
+
+def test_feed_and_finish():
+    validator = StreamValidator(ORIGINAL)
+    shown = "".join(validator.feed(piece) for piece in pieces(ORIGINAL, 10))
+    assert validator.finish() == ORIGINAL
+    assert ORIGINAL.startswith(shown)
+    assert validator.changes == []
+
+
+# ---------------------------------------------------------
+# Test: verify_update checks each changed offset against the dump
+# ---------------------------------------------------------
+SOURCE = """void hack() {
+    HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x1A2B")), get_ATK, orig_get_ATK);
+    HOOK("libil2cpp.so", 0x3C4D, get_DEF, orig_get_DEF);
+    HOOK("libil2cpp.so", 0x7000, get_Renamed, orig_get_Renamed);
+    LOGD(OBFUSCATE("Method Name: get_HP, Offsets: 0x5000"));
+    *(int *)((uintptr_t)obj + 0x18) = 1;
+}
+"""
+
+DUMP = {"get_ATK": "0x9a9a", "get_DEF": "0x3c4d", "get_HP": "0x5555", "get_NewName": "0x7777"}
+
+
+def test_verify_allows_dump_offsets():
+    answer = SOURCE.replace("0x1A2B", "0x9A9A").replace("0x5000", "0x5555")
+    check = verify_update(SOURCE, answer, DUMP)
+    assert check.ok
+    assert check.updated == answer
+    assert [(e.line, e.func, e.old, e.new) for e in check.allowed] == [
+        (2, "get_ATK", "0x1A2B", "0x9A9A"),
+        (5, "get_HP", "0x5000", "0x5555"),
+    ]
+
+
+def test_verify_lists_disallowed_edits():
+    answer = (SOURCE.replace("0x1A2B", "0x9A9A")       # allowed
+                    .replace("0x3C4D", "0x1111")       # not the dump's offset
+                    .replace("0x7000", "0x7777")       # get_Renamed is not in the dump
+                    .replace("0x18", "0x20"))          # field offset, not a hook
+    check = verify_update(SOURCE, answer, DUMP)
+    assert not check.ok
+    assert [e.func for e in check.allowed] == ["get_ATK"]
+    assert [(e.line, e.reason) for e in check.disallowed] == [
+        (3, "dump has 0x3c4d"),
+        (4, "function not in dump"),
+        (6, "not a HOOK/LOGD offset"),
+    ]
+    assert "line 3 (get_DEF): 0x3C4D -> 0x1111" in check.summary()
+
+    # an offset offered as a candidate for an unresolved function is fine
+    answer = SOURCE.replace("0x7000", "0x7777")
+    assert verify_update(SOURCE, answer, DUMP, {"get_Renamed": ["0x7777"]}).ok
+
+
+def test_verify_ignores_unlabelled_logd():
+    source = 'LOGD("get_ATK hooked at 0x1A2B");\n'
+    check = verify_update(source, source.replace("0x1A2B", "0x9A9A"), DUMP)
+    assert not check.ok
+    assert [(e.line, e.func, e.reason) for e in check.disallowed] == [(1, None, "not a HOOK/LOGD offset")]
+
+
+def test_verify_rejects_structural_change():
+    check = verify_update(SOURCE, SOURCE.replace("= 1;", "= 2;"), DUMP)
+    assert check.updated is None
+    assert [(e.line, e.old, e.new) for e in check.disallowed] == [(6, "1", "2")]
+
+
+def test_verify_large_file_is_linear():
+    import time
+
+    lines = [f'    HOOK("libil2cpp.so", 0x{i:X}, func_{i}, orig_{i});\n' for i in range(1, 20001)]
+    source = "void hack() {\n" + "".join(lines) + "}\n"
+    dump = {f"func_{i}": hex(i + 0x100000) for i in range(1, 20001)}
+    answer = "void hack() {\n" + "".join(
+        f'    HOOK("libil2cpp.so", 0x{i + 0x100000:X}, func_{i}, orig_{i});\n' for i in range(1, 20001)) + "}\n"
+
+    start = time.perf_counter()
+    check = verify_update(source, answer, dump)
+    assert check.ok and len(check.allowed) == 20000
+    assert time.perf_counter() - start < 5
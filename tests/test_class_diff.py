@@ -0,0 +1,139 @@
+import os
+import tempfile
+from offset_updater.class_diff import ClassHasher
+
+
+# ---------------------------------------------------------
+# Helper: create a temporary dump.cs file
+# ---------------------------------------------------------
+def create_temp_dump(content: str, folder: str, name: str) -> str:
+    path = os.path.join(folder, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+OLD_DUMP = """
+// Namespace: Game
+public class Player // TypeDefIndex: 10
+{
+\tpublic int hp; // 0x18
+
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000 Slot: 4
+\tpublic virtual void Jump() { }
+}
+
+// Namespace: Game
+public class Enemy // TypeDefIndex: 11
+{
+\t// RVA: 0x2000 Offset: 0x2000 VA: 0x2000
+\tpublic void Attack() { }
+}
+
+// Namespace:
+public class Removed // TypeDefIndex: 12
+{
+}
+"""
+
+# Same layout for Player (only addresses / TypeDefIndex move),
+# Enemy gains a parameter, Removed disappears, Added appears.
+NEW_DUMP = """
+// Namespace: Game
+public class Player // TypeDefIndex: 20
+{
+\tpublic int hp; // 0x18
+
+\t// RVA: 0x5000 Offset: 0x4000 VA: 0x5000 Slot: 4
+\tpublic virtual void Jump() { }
+}
+
+// Namespace: Game
+public class Enemy // TypeDefIndex: 21
+{
+\t// RVA: 0x6000 Offset: 0x6000 VA: 0x6000
+\tpublic void Attack(int power) { }
+}
+
+// Namespace:
+public class Added // TypeDefIndex: 22
+{
+}
+"""
+
+
+# ---------------------------------------------------------
+# Test: address-only changes keep the class hash stable
+# ---------------------------------------------------------
+def test_diff_ignores_addresses():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old = create_temp_dump(OLD_DUMP, tmpdir, "old.cs")
+        new = create_temp_dump(NEW_DUMP, tmpdir, "new.cs")
+
+        changes = ClassHasher().diff_files(old, new)
+
+        assert changes["unchanged"] == ["Game.Player"]
+        assert changes["changed"] == ["Game.Enemy"]
+        assert changes["added"] == ["Added"]
+        assert changes["removed"] == ["Removed"]
+
+
+# ---------------------------------------------------------
+# Test: field offset changes are structural changes
+# ---------------------------------------------------------
+def test_field_offset_change_detected():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old = create_temp_dump(OLD_DUMP, tmpdir, "old.cs")
+        new = create_temp_dump(OLD_DUMP.replace("// 0x18", "// 0x20"), tmpdir, "new.cs")
+
+        changes = ClassHasher().diff_files(old, new)
+
+        assert changes["changed"] == ["Game.Player"]
+
+
+# ---------------------------------------------------------
+# Test: sidecar is written and reused
+# ---------------------------------------------------------
+def test_sidecar_reused():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = create_temp_dump(OLD_DUMP, tmpdir, "dump.cs")
+        hasher = ClassHasher()
+
+        first = hasher.load_or_build(path)
+        assert os.path.exists(hasher.sidecar_path(path))
+
+        hasher.hash_file = None  # a cache hit must not re-hash
+        assert hasher.load_or_build(path) == first
+
+
+# ---------------------------------------------------------
+# Test: the analyzer skips work for unchanged classes
+# ---------------------------------------------------------
+def test_analyzer_skips_unchanged_classes():
+    from offset_updater.dump_parser import DumpParser
+    from offset_updater.offset_analyzer import OffsetAnalyzer
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old = create_temp_dump(OLD_DUMP, tmpdir, "old.cs")
+        new = create_temp_dump(NEW_DUMP, tmpdir, "new.cs")
+        changes = ClassHasher().diff_files(old, new)
+        previous, current = DumpParser().parse(old), DumpParser().parse(new)
+
+    source = {
+        "HOOKS": [
+            {"func": "Player::Jump", "offset": "0x1000"},       # offsets still move in unchanged classes
+            {"func": "Player::ump", "offset": "0x1100"},        # no fuzzy guess (would hit "Jump")
+            {"func": "Enemy::ttack", "offset": "0x2000"},       # changed class: fuzzy still runs
+        ],
+        "FIELDS": [{"var": "player", "type": "int", "offset": "0x10", "field": "Player::hp"}],
+    }
+    results = OffsetAnalyzer(current, source, previous_dump=previous, class_changes=changes).analyze()
+
+    assert [(o["func"], o["new_offset"]) for o in results["outdated"]] == [
+        ("Player::Jump", "4000"), ("Enemy::ttack", "6000")]
+    assert [m["func"] for m in results["missing"]] == ["Player::ump"]
+    assert results["outdated_fields"] == [] and results["missing_fields"] == []
+
+    # without the diff the same field access is reported
+    results = OffsetAnalyzer(current, source).analyze()
+    assert [o["name"] for o in results["outdated_fields"]] == ["hp"]
@@ -105,3 +105,123 @@ def test_no_offsets_found():
     assert result == {}
 
     os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: overloads are indexed by Namespace.Class::Method(signature)
+# ---------------------------------------------------------
+QUALIFIED_DUMP = """
+// Namespace: Game
+public class Player : MonoBehaviour // TypeDefIndex: 12
+{
+\t// Methods
+
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000
+\tpublic void TakeDamage(int amount) { }
+
+\t// RVA: 0x1010 Offset: 0x1010 VA: 0x1010
+\tpublic void TakeDamage(int amount, bool crit = false) { }
+
+\t// RVA: 0x1020 Offset: 0x1020 VA: 0x1020
+\tpublic void .ctor() { }
+}
+
+// Namespace: Game.AI
+public class Enemy // TypeDefIndex: 13
+{
+\t// RVA: 0x2000 Offset: 0x2000 VA: 0x2000 Slot: 4
+\tpublic virtual void TakeDamage(Dictionary<int, string> map) { }
+}
+"""
+
+
+def test_qualified_overload_index():
+    path = create_temp_dump(QUALIFIED_DUMP)
+    result = DumpParser().parse(path)
+
+    assert len(result.entries) == 4
+    assert result.qualified["Game.Player::TakeDamage(int)"] == 0
+    assert result.qualified["Game.Player::TakeDamage(int,bool)"] == 1
+    assert "Game.Player::.ctor()" in result.qualified
+    assert "Game.AI.Enemy::TakeDamage(Dictionary<int,string>)" in result.qualified
+
+    # bare name keeps every overload, mapping keeps the last one
+    assert [e.offset for e in result.lookup("TakeDamage")] == ["0x1000", "0x1010", "0x2000"]
+    assert result["TakeDamage"].offset == "0x2000"
+
+    # member + class indexes
+    assert [e.offset for e in result.lookup("Player::TakeDamage")] == ["0x1000", "0x1010"]
+    assert result.resolve("Game.AI.Enemy::TakeDamage").offset == "0x2000"
+    assert len(result.methods_of("Game.Player")) == 3
+    assert result.resolve("Game.Player::TakeDamage(int, bool)").offset == "0x1010"
+
+    os.remove(path)
+
+
+def test_qualified_lookup_with_modifiers():
+    """ref / out / params parameters keep their modifier; lookups space them the same way."""
+    content = """
+// Namespace: Game
+public class Player // TypeDefIndex: 12
+{
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000
+\tpublic bool TryHeal(ref int hp, out float left) { }
+
+\t// RVA: 0x1010 Offset: 0x1010 VA: 0x1010
+\tpublic void Log(string fmt, params object[] args) { }
+}
+"""
+    path = create_temp_dump(content)
+    result = DumpParser().parse(path)
+    os.remove(path)
+
+    assert "Game.Player::TryHeal(ref int,out float)" in result.qualified
+    assert [e.offset for e in result.lookup("Game.Player::TryHeal(ref int, out float)")] == ["0x1000"]
+    assert result.resolve("Game.Player::TryHeal(ref  int,out float)").offset == "0x1000"
+    assert result.resolve("Game.Player::Log(string, params object[])").offset == "0x1010"
+
+
+# ---------------------------------------------------------
+# Test: field offsets are indexed per class
+# ---------------------------------------------------------
+def test_field_index():
+    content = """
+// Namespace: Game
+public class Player // TypeDefIndex: 12
+{
+\t// Fields
+\tpublic int hp; // 0x18
+\tprivate float speed; // 0x1C
+\tprivate static Player <Instance>k__BackingField; // 0x0
+\tpublic const int MAX = 5;
+}
+"""
+    path = create_temp_dump(content)
+    result = DumpParser().parse(path)
+
+    assert result.field_offset("Game.Player", "hp") == 0x18
+    assert result.field_offset("Player", "speed") == 0x1C
+    assert result.field_offset("Player", "<Instance>k__BackingField") == 0
+    assert result.field_offset("Player", "MAX") is None
+    assert result.field_owners["hp"] == ["Game.Player"]
+    assert len(result) == 0
+
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: vtable slots map back to their methods
+# ---------------------------------------------------------
+def test_slot_index():
+    path = create_temp_dump(QUALIFIED_DUMP)
+    result = DumpParser().parse(path)
+
+    table = result.slots["Game.AI.Enemy"]
+    assert list(table) == [-1, -1, -1, -1, 3]
+    assert result.slots["Enemy"] is table
+    assert result.by_slot("Enemy", 4).offset == "0x2000"
+    assert result.by_slot("Enemy", 1) is None
+    assert result.by_slot("Game.Player", 0) is None
+    assert result.find_offset("0x1010").signature == "int,bool"
+
+    os.remove(path)
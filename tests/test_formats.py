@@ -0,0 +1,173 @@
+import os
+import tempfile
+import pytest
+from offset_updater.formats import detect_format, parse_dump, available_formats
+from offset_updater.progress import Cancelled, CancelToken
+
+
+# ---------------------------------------------------------
+# Helper: create a temporary dump file
+# ---------------------------------------------------------
+def create_temp_dump(content: str, suffix: str = ".txt") -> str:
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+    return tmp.name
+
+
+IL2CPP_DUMP = """// Namespace: Game
+public class Player : MonoBehaviour // TypeDefIndex: 12
+{
+\t// Fields
+\tpublic int hp; // 0x18
+
+\t// Methods
+
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000
+\t[CompilerGenerated]
+\tpublic void TakeDamage(int amount) { }
+
+\t// RVA: 0x1010 Offset: 0x1010 VA: 0x1010 Slot: 2
+\tpublic virtual void TakeDamage(int amount, bool crit = false) { }
+}
+"""
+
+
+# ---------------------------------------------------------
+# Test: each backend is picked by sniffing
+# ---------------------------------------------------------
+@pytest.mark.parametrize("content, expected", [
+    (IL2CPP_DUMP, "il2cppdumper-cs"),
+    ('{\n  "ScriptMethod": [\n', "script-json"),
+    ("#define get_ATK 0x216B910\n#define set_ATK 0x216B920\n", "defines"),
+    ("get_ATK(int a) 0x216B910\nset_ATK() : 0x216B920\n", "inline"),
+    ("0x216B910 : get_ATK\n0x216B920 - set_ATK\n", "hexmap"),
+    ("public int get_attack() { } // RVA: 0x10 Offset: 0x10 VA: 0x10\n", "dump-cs"),
+])
+def test_detect_format(content, expected):
+    path = create_temp_dump(content)
+    assert detect_format(path).name == expected
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: compiled dump.cs scanner matches the line engine
+# ---------------------------------------------------------
+def test_il2cppdumper_fast_path_matches_line_engine():
+    path = create_temp_dump(IL2CPP_DUMP, ".cs")
+
+    fast = parse_dump(path)
+    slow = parse_dump(path, format="dump-cs")
+
+    assert fast.stats.format == "il2cppdumper-cs"
+    assert fast.stats.entries == 2
+    assert list(fast.qualified) == list(slow.qualified)
+    assert [e.line_no for e in fast.entries] == [e.line_no for e in slow.entries]
+    assert fast.fields == slow.fields
+    assert list(fast.slots["Game.Player"]) == [-1, -1, 1]
+
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: simple formats
+# ---------------------------------------------------------
+def test_defines_and_constexpr():
+    path = create_temp_dump(
+        "#define get_ATK 0x216B910\n"
+        "// comment\n"
+        "constexpr uintptr_t set_ATK = 0x216B920;\n"
+    )
+    result = parse_dump(path)
+
+    assert result["get_ATK"].offset == "0x216B910"
+    assert result["set_ATK"].offset == "0x216B920"
+    assert result["set_ATK"].line_no == 3
+
+    os.remove(path)
+
+
+def test_inline_and_hexmap_qualified_names():
+    path = create_temp_dump("Player::Jump(float h) -> 0x1a2b\n")
+    result = parse_dump(path, format="inline")
+    assert result.resolve("Player::Jump").offset == "0x1A2B"
+    os.remove(path)
+
+    path = create_temp_dump("0x1A2B : Game.Player::Jump\n")
+    result = parse_dump(path, format="hexmap")
+    assert result.resolve("Game.Player::Jump").offset == "0x1A2B"
+    os.remove(path)
+
+
+def test_unknown_format():
+    assert "script-json" in available_formats()
+    with pytest.raises(ValueError):
+        parse_dump(__file__, format="nope")
+
+
+# ---------------------------------------------------------
+# Test: byte progress reaches the file size; cancel aborts
+# ---------------------------------------------------------
+@pytest.mark.parametrize("fmt", ["il2cppdumper-cs", "dump-cs"])
+def test_progress_and_abort(fmt):
+    path = create_temp_dump(IL2CPP_DUMP)
+    seen = []
+    index = parse_dump(path, format=fmt, progress=seen.append)
+    size = os.path.getsize(path)
+    assert seen and seen[-1].stage == "parse"
+    assert (seen[-1].bytes_done, seen[-1].bytes_total) == (size, size)
+    assert seen[-1].items == len(index.entries)
+    assert seen[-1].fraction == 1.0
+
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        parse_dump(path, format=fmt, cancel=token)
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: compiler-generated class names are tracked by both engines
+# ---------------------------------------------------------
+GENERATED_DUMP = """// Namespace: Game
+[CompilerGenerated]
+private sealed class Player.<>c // TypeDefIndex: 13
+{
+\t// RVA: 0x1100 Offset: 0x1100 VA: 0x1100
+\tinternal void <Start>b__0_0() { }
+}
+
+// Namespace: Game
+private sealed class <Start>d__5 : IEnumerator // TypeDefIndex: 14
+{
+\tprivate int <>1__state; // 0x10
+
+\t// RVA: 0x1200 Offset: 0x1200 VA: 0x1200
+\tprivate bool MoveNext() { }
+}
+
+// Namespace: Game
+public class Cache<TKey, TValue> // TypeDefIndex: 15
+{
+\t// RVA: 0x1300 Offset: 0x1300 VA: 0x1300
+\tpublic void Clear() { }
+}
+"""
+
+
+def test_compiler_generated_class_names():
+    from offset_updater.class_diff import ClassHasher
+
+    path = create_temp_dump(GENERATED_DUMP, ".cs")
+
+    fast = parse_dump(path)
+    slow = parse_dump(path, format="dump-cs")
+    hashes = ClassHasher().hash_file(path)
+    os.remove(path)
+
+    owners = ["Game.Player.<>c", "Game.<Start>d__5", "Game.Cache<TKey, TValue>"]
+    assert fast.stats.format == "il2cppdumper-cs"
+    assert [e.owner for e in fast.entries] == owners
+    assert [e.owner for e in slow.entries] == owners
+    assert fast.field_offset("Game.<Start>d__5", "<>1__state") == 0x10
+    assert sorted(hashes) == sorted(owners)
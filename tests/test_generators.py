@@ -1,3 +1,8 @@
+import io
+import json
+
+import pytest
+from offset_updater import generators
 from offset_updater.generators import CodeGenerator
 
 
@@ -28,3 +33,42 @@ def test_generate_json_file_output():
 
     assert json_data["FuncA"] == "0x200"
     assert json_data["FuncB"] == "0x300"
+
+
+# ---------------------------------------------------------
+# Test: streaming writers match the in-memory results
+# ---------------------------------------------------------
+def test_write_cpp_definitions_styles():
+    changes = {"Player::get_Health": ("0x11111", "22222"), "NewFunction": (None, "0xaaaaa")}
+    generator = CodeGenerator()
+
+    out = io.StringIO()
+    assert generator.write_cpp_definitions(out, changes) == 2
+    assert out.getvalue() == ("// Generated by Offset Updater\n#pragma once\n\n"
+                              "#define Player__get_Health 0x22222\n"
+                              "#define NewFunction 0xAAAAA\n")
+
+    out = io.StringIO()
+    generator.write_cpp_definitions(out, changes, style="constexpr")
+    assert "#include <cstdint>\n" in out.getvalue()
+    assert "constexpr uintptr_t NewFunction = 0xAAAAA;\n" in out.getvalue()
+
+    with pytest.raises(ValueError):
+        generator.generate_cpp_definitions(changes, style="enum")
+
+
+def test_write_json_matches_json_dump(monkeypatch):
+    monkeypatch.setattr(generators, "WRITE_BATCH", 3)       # several batches
+    generator = CodeGenerator()
+    analysis = {"outdated": [{"func": f'Func"{i}', "old_offset": f"{i:x}", "new_offset": f"{i + 256:x}"}
+                             for i in range(10)]}
+
+    out = io.StringIO()
+    assert generator.write_json(out, generator.iter_changes(analysis)) == 10     # pairs, not a dict
+    expected = generator.generate_json(dict(generator.iter_changes(analysis)))
+    assert json.loads(out.getvalue()) == expected
+    assert out.getvalue() == json.dumps(expected, indent=4) + "\n"
+
+    out = io.StringIO()
+    assert generator.write_json(out, {}) == 0
+    assert out.getvalue() == "{}\n"
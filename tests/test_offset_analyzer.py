@@ -55,3 +55,184 @@ def test_analyze_new_entries():
 
     assert len(changes) == 1
     assert changes["NewFunction"] == (None, "0x88888")
+
+
+def test_analyze_class_qualified_hook():
+    """Class::Method hooks resolve through the DumpIndex instead of the last overload."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+
+    content = """
+// Namespace: Game
+public class Player // TypeDefIndex: 1
+{
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000
+\tpublic void TakeDamage(int amount) { }
+}
+
+public class Enemy // TypeDefIndex: 2
+{
+\t// RVA: 0x2000 Offset: 0x2000 VA: 0x2000
+\tpublic void TakeDamage(int amount) { }
+}
+"""
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+
+    parsed_dump = DumpParser().parse(tmp.name)
+    os.remove(tmp.name)
+
+    source = {"HOOKS": [{"func": "Player::TakeDamage", "offset": "0x0F00"}]}
+    results = OffsetAnalyzer(parsed_dump, source).analyze()
+
+    assert results["outdated"][0]["new_offset"] == "1000"
+    assert results["missing"] == []
+
+
+def test_analyze_field_offsets():
+    """Field accesses are checked against the dump's field index."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+
+    content = """
+public class Player // TypeDefIndex: 1
+{
+\tpublic int hp; // 0x20
+\tpublic float speed; // 0x24
+}
+"""
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+
+    parsed_dump = DumpParser().parse(tmp.name)
+    os.remove(tmp.name)
+
+    source = {"FIELDS": [
+        {"var": "player", "type": "int", "offset": "0x18", "field": "hp"},
+        {"var": "player", "type": "float", "offset": "0x24", "field": None},
+        {"var": "player", "type": "int", "offset": "0x30", "field": None},
+    ]}
+    results = OffsetAnalyzer(parsed_dump, source).analyze()
+
+    assert len(results["outdated_fields"]) == 1
+    assert results["outdated_fields"][0]["class"] == "Player"
+    assert results["outdated_fields"][0]["new_offset"] == "20"
+    assert [m["old_offset"] for m in results["missing_fields"]] == ["30"]
+
+
+def test_analyze_slot_match_for_renamed_method():
+    """A renamed virtual method is found through its class + vtable slot."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+
+    def parse(content):
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+        tmp.write(content.encode("utf-8"))
+        tmp.close()
+        parsed = DumpParser().parse(tmp.name)
+        os.remove(tmp.name)
+        return parsed
+
+    old_dump = parse("""
+public class Player // TypeDefIndex: 1
+{
+\t// RVA: 0x1000 Offset: 0x1000 VA: 0x1000 Slot: 5
+\tpublic virtual void abcdef() { }
+}
+""")
+    new_dump = parse("""
+public class Player // TypeDefIndex: 1
+{
+\t// RVA: 0x3000 Offset: 0x3000 VA: 0x3000 Slot: 5
+\tpublic virtual void ghijkl() { }
+}
+""")
+
+    source = {"HOOKS": [{"func": "abcdef", "offset": "0x1000"}]}
+    results = OffsetAnalyzer(new_dump, source, previous_dump=old_dump).analyze()
+
+    row = results["outdated"][0]
+    assert row["match"] == "slot"
+    assert row["slot"] == "Player#5"
+    assert row["matched_name"] == "ghijkl"
+    assert row["new_offset"] == "3000"
+    assert results["summary"]["slot_match_count"] == 1
+
+
+def test_analyze_overloads_keep_matching_offset():
+    """An overloaded hook resolves to the overload at its own offset; with none there it is ambiguous."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+    from offset_updater.patcher import BoundPatcher
+
+    content = """
+public class Player // TypeDefIndex: 1
+{
+\t// RVA: 0x2000 Offset: 0x2000 VA: 0x2000
+\tpublic void TakeDamage(int amount, bool crit) { }
+\t// RVA: 0x3000 Offset: 0x3000 VA: 0x3000
+\tpublic void TakeDamage(int amount) { }
+}
+"""
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+
+    parsed_dump = DumpParser().parse(tmp.name)
+    os.remove(tmp.name)
+
+    for func in ("TakeDamage", "Player::TakeDamage"):
+        text = f'HOOK("libil2cpp.so", 0x2000, {func});\n'
+        source = {
+            "HOOKS": [{"file": "main.cpp", "func": func, "offset": "0x2000", "span": (21, 27)}],
+            "RAW": [{"file": "main.cpp", "content": text}],
+        }
+        results = OffsetAnalyzer(parsed_dump, source).analyze()
+        assert results["outdated"] == []
+        assert results["ambiguous"] == []
+        assert BoundPatcher.from_analysis(source, results).edit_count == 0
+
+        source["HOOKS"][0]["offset"] = "0x1000"
+        results = OffsetAnalyzer(parsed_dump, source).analyze()
+        assert results["outdated"] == []
+        assert results["ambiguous"] == [{
+            "func": func, "old_offset": "1000", "candidates": ["2000", "3000"], "log_offset": None,
+        }]
+
+
+def test_analyze_field_free_text_comment():
+    """A comment that names no known field ("// god mode on") is an unnamed access, not a missing field."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+    from offset_updater.source_scanner import SourceScanner
+
+    content = """
+public class Player // TypeDefIndex: 1
+{
+\tpublic float godMode; // 0x10
+\tpublic int hp; // 0x18
+}
+"""
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+
+    parsed_dump = DumpParser().parse(tmp.name)
+    os.remove(tmp.name)
+
+    source = SourceScanner("").scan_text(
+        "*(float*)((uintptr_t)player + 0x10) = 1; // god mode on\n"
+        "*(int*)((uintptr_t)player + 0x14) = 1; // hp\n"
+    )
+    results = OffsetAnalyzer(parsed_dump, source).analyze()
+
+    assert [f["field"] for f in source["FIELDS"]] == ["god", "hp"]
+    assert results["missing_fields"] == []
+    assert [(o["name"], o["new_offset"]) for o in results["outdated_fields"]] == [("hp", "18")]
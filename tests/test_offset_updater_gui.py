@@ -0,0 +1,32 @@
+import os
+import tempfile
+
+from offset_updater_gui import compare_offsets
+
+
+def test_compare_offsets_reads_labelled_logd_only():
+    """Free-form LOGD text is not mistaken for function names (no spurious "missing" entries)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src = os.path.join(tmpdir, "main.cpp")
+        open(src, "w").write(
+            'LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x100"));\n'
+            'LOGD(OBFUSCATE("Updated Offset | Jump : 0x200"));\n'
+            'LOGD("Player hit at 0x300");\n'
+            'LOGD(OBFUSCATE("Base: 0x400"));\n'
+            'HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x500")), Update, orig_Update);\n'
+        )
+        mapping = {
+            "Player::get_ATK": {"offset": "0x110"},
+            "Player::Jump": {"offset": "0x200"},
+            "Player::Update": {"offset": "0x510"},
+        }
+
+        res = compare_offsets(src, mapping)
+
+        assert [(r["type"], r["name"], r["old"], r["new"]) for r in res["changes"]] == [
+            ("LOGD", "Player::get_ATK", "0X100", "0X110"),
+            ("HOOK", "Player::Update", "0X500", "0X510"),
+        ]
+        assert res["missing"] == []
+        assert res["errors"] == []
+        assert os.path.exists(res["manual"])
@@ -0,0 +1,229 @@
+import difflib
+import os
+import tempfile
+
+import pytest
+from offset_updater.generators import CodeGenerator
+from offset_updater.patcher import BoundPatcher, SourcePatcher, apply_edits, diff_edits, write_atomic
+from offset_updater.source_scanner import SourceScanner
+from offset_updater.progress import Cancelled, CancelToken
+
+
+SOURCE = """void init() {
+    HOOK("libil2cpp.so", 0x216B910, get_ATK, orig_get_ATK);
+    HOOK("libil2cpp.so", str2Offset("0x216b920"), get_DEF, orig_get_DEF);
+    HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x0216B930")), get_HP);
+    LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x216B910"));
+    int unrelated = 0x216B9100;
+}
+"""
+
+REPLACE_MAP = CodeGenerator().generate_replacement_map([
+    {"old_offset": "216B910", "new_offset": "3000000"},
+    {"old_offset": "0x216B920", "new_offset": "0x30000AB"},
+    {"old_offset": "216B930", "new_offset": "216B910"},
+])
+
+
+# ---------------------------------------------------------
+# Helper: write files into a temp folder
+# ---------------------------------------------------------
+def create_tree(files):
+    folder = tempfile.mkdtemp()
+    paths = []
+    for name, content in files.items():
+        path = os.path.join(folder, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", newline="") as f:
+            f.write(content)
+        paths.append(path)
+    return folder, paths
+
+
+def read(path):
+    with open(path, newline="") as f:
+        return f.read()
+
+
+# ---------------------------------------------------------
+# Test: all three HOOK forms plus LOGD, in one pass
+# ---------------------------------------------------------
+def test_patch_text_forms():
+    patched, count = SourcePatcher(REPLACE_MAP).patch_text(SOURCE)
+
+    assert count == 4
+    assert 'HOOK("libil2cpp.so", 0x3000000, get_ATK, orig_get_ATK);' in patched
+    assert 'str2Offset("0x30000ab")' in patched                 # lower-case literal stays lower-case
+    assert 'str2Offset(OBFUSCATE("0x216B910"))' in patched      # not patched again to 0x3000000
+    assert "Offset: 0x3000000" in patched
+    assert "0x216B9100" in patched                               # longer literal untouched
+
+
+def test_apply_edits():
+    assert apply_edits("abcdef", [(1, 2, "X"), (4, 6, "YZW")]) == "aXcdYZW"
+    assert apply_edits("abc", []) == "abc"
+
+
+# ---------------------------------------------------------
+# Test: files are rewritten in place, others left alone
+# ---------------------------------------------------------
+def test_patch_files():
+    folder, paths = create_tree({
+        "main.cpp": SOURCE.replace("\n", "\r\n"),
+        "sub/other.cpp": "int x = 0x1234;\n",
+        "sub/hooks.h": "#define ATK 0x216B910\n",
+    })
+    os.chmod(paths[0], 0o640)
+
+    changed = SourcePatcher(REPLACE_MAP, workers=2).patch_files(paths)
+    assert changed == {paths[0]: 4, paths[2]: 1}
+
+    main = read(paths[0])
+    assert main.count("\r\n") == SOURCE.count("\n")              # line endings kept
+    assert "0x3000000, get_ATK" in main
+    assert os.stat(paths[0]).st_mode & 0o777 == 0o640
+    assert read(paths[1]) == "int x = 0x1234;\n"
+    assert read(paths[2]) == "#define ATK 0x3000000\n"
+    assert sorted(os.listdir(folder)) == ["main.cpp", "sub"]     # no temp files left
+
+
+def test_dry_run_and_progress():
+    _, paths = create_tree({f"f{i}.cpp": SOURCE for i in range(10)})
+    events = []
+    changed = SourcePatcher(REPLACE_MAP).patch_files(paths, dry_run=True, progress=events.append)
+
+    assert len(changed) == 10
+    assert all(read(p) == SOURCE for p in paths)
+    assert events[-1].stage == "patch"
+    assert events[-1].items == 10
+
+
+def test_cancel():
+    _, paths = create_tree({f"f{i}.cpp": SOURCE for i in range(5)})
+    cancel = CancelToken()
+    cancel.cancel()
+    with pytest.raises(Cancelled):
+        SourcePatcher(REPLACE_MAP).patch_files(paths, cancel=cancel)
+
+
+def test_write_atomic_replaces_file():
+    _, (path,) = create_tree({"a.cpp": "old"})
+    write_atomic(path, "new")
+    assert read(path) == "new"
+    assert not os.path.exists(path + ".tmp")
+    assert os.listdir(os.path.dirname(path)) == ["a.cpp"]
+
+
+def test_write_atomic_failure_leaves_file_and_no_temp():
+    _, (path,) = create_tree({"a.cpp": "old"})
+
+    def chunks():
+        yield b"half"
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        write_atomic(path, chunks())
+    assert read(path) == "old"
+    assert os.listdir(os.path.dirname(path)) == ["a.cpp"]
+
+
+# ---------------------------------------------------------
+# Test: context-aware patching binds edits to scanned spans
+# ---------------------------------------------------------
+SHARED = """void init() {
+    HOOK("libil2cpp.so", 0x1000, get_ATK, orig_get_ATK);
+    HOOK("libil2cpp.so", 0x1000, get_DEF, orig_get_DEF);
+    HOOK("libil2cpp.so", 0x2000, get_HP, orig_get_HP);
+    LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x1000"));
+    int unrelated = 0x1000;
+}
+"""
+
+
+def test_bound_patcher_only_touches_attributed_sites():
+    _, (path,) = create_tree({"main.cpp": SHARED})
+    scan = SourceScanner(path).scan()
+    analysis = {"outdated": [
+        {"func": "get_ATK", "old_offset": "1000", "new_offset": "3000"},
+        {"func": "get_DEF", "old_offset": "1000", "new_offset": "4000"},
+    ]}
+    patcher = BoundPatcher.from_analysis(scan, analysis)
+    assert patcher.edit_count == 3
+
+    assert patcher.patch_files() == {path: 3}
+    patched = read(path)
+    assert "0x3000, get_ATK" in patched
+    assert "0x4000, get_DEF" in patched                  # same old offset, its own new one
+    assert "0x2000, get_HP" in patched
+    assert "Offset: 0x3000" in patched
+    assert "int unrelated = 0x1000;" in patched          # same hex, unrelated code
+
+
+def test_bound_patcher_skips_unlabelled_logd():
+    text = (
+        'LOGD("Hooked get_ATK at 0x1000");\n'
+        'LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x1000"));\n'
+        "// health 0x1000\n"
+    )
+    _, (path,) = create_tree({"main.cpp": text})
+    scan = SourceScanner(path).scan()
+    assert [e["func"] for e in scan["LOGD"]] == ["Hooked", "get_ATK", None]
+
+    patcher = BoundPatcher(scan, {"Hooked": "0x9000", "get_ATK": "0x3000"})
+    assert patcher.patch_files() == {path: 1}
+    assert read(path) == text.replace("Offset: 0x1000", "Offset: 0x3000")
+
+
+def test_bound_patcher_diff_matches_difflib():
+    _, (path,) = create_tree({"main.cpp": SHARED})
+    scan = SourceScanner(path).scan()
+    patcher = BoundPatcher(scan, {"get_ATK": "0x3000", "get_HP": "0x5000"})
+
+    patched = apply_edits(SHARED, patcher.plan[path])
+    expected = difflib.unified_diff(SHARED.splitlines(True), patched.splitlines(True),
+                                    f"a/{path}", f"b/{path}", n=1)
+    assert patcher.diff(context=1) == "".join(expected)
+    assert read(path) == SHARED                           # diffing writes nothing
+
+
+def test_bound_patcher_crlf():
+    _, (path,) = create_tree({"main.cpp": SHARED.replace("\n", "\r\n")})
+    patcher = BoundPatcher(SourceScanner(path).scan(), {"get_HP": "0x5000"})
+    assert patcher.patch_files() == {path: 1}
+    assert read(path) == SHARED.replace("0x2000", "0x5000").replace("\n", "\r\n")
+
+
+def test_bound_patcher_non_utf8_source():
+    _, (path,) = create_tree({"main.cpp": ""})
+    data = b"// \xe9quipe \xb2\xe2\n" + SHARED.encode()     # Latin-1 / GBK comment before the hooks
+    with open(path, "wb") as f:
+        f.write(data)
+
+    patcher = BoundPatcher(SourceScanner(path).scan(), {"get_HP": "0x5000"})
+    assert patcher.patch_files() == {path: 1}
+    assert patcher.stale == []
+    with open(path, "rb") as f:
+        assert f.read() == data.replace(b"0x2000", b"0x5000")     # other bytes untouched
+
+
+def test_bound_patcher_skips_stale_files():
+    _, (path,) = create_tree({"main.cpp": SHARED})
+    scan = SourceScanner(path).scan()
+    with open(path, "w") as f:
+        f.write("// edited after the scan\n" + SHARED)
+
+    patcher = BoundPatcher(scan, {"get_ATK": "0x3000"})
+    assert patcher.patch_files() == {}
+    assert patcher.stale == [path]
+    assert read(path).startswith("// edited")
+
+
+def test_diff_edits_hunks():
+    text = "".join(f"x = 0x{i:X};\n" for i in range(30))
+    lines = text.splitlines(True)
+    starts = [sum(map(len, lines[:i])) for i in range(len(lines))]
+    edits = [(starts[i] + 4, starts[i] + len(lines[i]) - 2, "0xFFFF") for i in (0, 1, 9, 29)]
+
+    expected = difflib.unified_diff(lines, apply_edits(text, edits).splitlines(True), "a/f.cpp", "b/f.cpp")
+    assert "".join(diff_edits("f.cpp", text, edits)) == "".join(expected)
+    assert list(diff_edits("f.cpp", text, [])) == []
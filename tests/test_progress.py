@@ -0,0 +1,81 @@
+import os
+import tempfile
+import pytest
+from offset_updater.progress import Cancelled, CancelToken, ProgressEvent, ProgressTracker
+from offset_updater.offset_analyzer import OffsetAnalyzer
+from offset_updater.reporter import Reporter
+from offset_updater.source_scanner import SourceScanner
+
+
+# ---------------------------------------------------------
+# Test: events carry stage, amounts, fraction and ETA
+# ---------------------------------------------------------
+def test_tracker_events():
+    seen = []
+    tracker = ProgressTracker("parse", seen.append, bytes_total=200)
+    tracker.update(bytes_done=50, items=7)
+    tracker.finish()
+
+    first, last = seen
+    assert (first.stage, first.bytes_done, first.items) == ("parse", 50, 7)
+    assert first.fraction == 0.25
+    assert first.eta is not None and first.eta >= 0
+    assert last.fraction == 1.0 and last.items == 7
+    assert "parse" in str(last)
+
+    # no totals: fraction and ETA unknown
+    assert ProgressEvent("scan", items=3).fraction is None
+    assert ProgressEvent("scan", items=3).eta is None
+
+
+def test_tracker_counts_sized():
+    seen = []
+    items = []
+    tracker = ProgressTracker("parse", seen.append).count(items)
+    items.extend([1, 2, 3])
+    tracker.update(bytes_done=10)
+    assert seen[-1].items == 3
+
+
+# ---------------------------------------------------------
+# Test: a set token aborts at the next checkpoint
+# ---------------------------------------------------------
+def test_cancel_token():
+    token = CancelToken()
+    tracker = ProgressTracker("analyze", cancel=token)
+    tracker.update(items=1)
+    token.cancel()
+    assert token.cancelled
+    with pytest.raises(Cancelled):
+        tracker.update(items=2)
+
+
+def test_analyze_progress_and_cancel():
+    dump = {"Func%d" % i: hex(0x1000 + i) for i in range(3000)}
+    source = {"HOOKS": [{"func": name, "offset": "0x1"} for name in dump]}
+
+    seen = []
+    result = OffsetAnalyzer(dump, source).analyze(progress=seen.append)
+    assert result["summary"]["outdated_count"] == 3000
+    assert all(e.stage == "analyze" for e in seen)
+    assert seen[-1].items == seen[-1].items_total == 3000
+
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        OffsetAnalyzer(dump, source).analyze(cancel=token)
+
+
+def test_scan_and_report_progress():
+    folder = tempfile.mkdtemp()
+    with open(os.path.join(folder, "main.cpp"), "w") as f:
+        f.write('HOOK("Update", 0x1234, Update);\n')
+
+    seen = []
+    SourceScanner(folder).scan(progress=seen.append)
+    assert seen[-1].stage == "scan" and seen[-1].fraction == 1.0
+
+    seen = []
+    Reporter().save_combo_report(folder, {}, {}, progress=seen.append)
+    assert [e.items for e in seen] == [1, 2, 3, 4]
+    assert os.path.exists(os.path.join(folder, "logd_snippets.txt"))
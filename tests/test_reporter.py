@@ -24,3 +24,39 @@ def test_report_summary_with_changes():
     assert "0x11111 → 0x22222" in summary
     assert "FunctionY" in summary
     assert "NEW → 0xAAAAA" in summary
+
+
+def test_iter_text_report_streams_build_text_report():
+    """The streamed report joins back to exactly the built one."""
+    results = {
+        "summary": {"outdated_count": 1},
+        "outdated": [{"func": "Jump", "old_offset": "1000", "new_offset": "2000", "match": "exact"}],
+        "missing_in_dump": [{"func": "Fly", "source_offset": "3000"}],
+    }
+    reporter = Reporter()
+    lines = list(reporter.iter_text_report(results))
+
+    assert "\n".join(lines) == reporter.build_text_report(results)
+    assert "  Jump: 0x1000  → 0x2000  [exact]" in lines
+    assert "  Fly  (source offset: 0x3000)" in lines
+
+
+def test_outdated_field_line_uses_resolved_name():
+    """A "// Player::hp" label is printed once as class::field, not Player::Player::hp."""
+    import os
+    import tempfile
+    from offset_updater.dump_parser import DumpParser
+    from offset_updater.offset_analyzer import OffsetAnalyzer
+
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".cs")
+    tmp.write(b"public class Player // TypeDefIndex: 1\n{\n\tpublic int hp; // 0x20\n}\n")
+    tmp.close()
+    parsed_dump = DumpParser().parse(tmp.name)
+    os.remove(tmp.name)
+
+    source = {"FIELDS": [{"var": "player", "type": "int", "offset": "0x18", "field": "Player::hp"}]}
+    results = OffsetAnalyzer(parsed_dump, source).analyze()
+    assert results["outdated_fields"][0]["name"] == "hp"
+
+    lines = list(Reporter().iter_text_report(results))
+    assert "  Player::hp (player): 0x18  → 0x20" in lines
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+from offset_updater.dump_parser import DumpParser
+from offset_updater.script_json import ScriptJsonParser
+
+
+# ---------------------------------------------------------
+# Helper: create a temporary script.json file
+# ---------------------------------------------------------
+def create_temp_json(data) -> str:
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
+    tmp.write(json.dumps(data, indent=2).encode("utf-8"))
+    tmp.close()
+    return tmp.name
+
+
+SCRIPT = {
+    "ScriptString": [{"Address": 1, "Value": "not a \"method\" ] }"}],
+    "ScriptMethod": [
+        {
+            "Address": 0x1000,
+            "Name": "Game.Player$$TakeDamage",
+            "Signature": "void Game_Player__TakeDamage (Game_Player_o* __this, int32_t amount, const MethodInfo* method);",
+            "TypeSignature": "vii"
+        },
+        {
+            "Address": 0x1010,
+            "Name": "Game.Player$$TakeDamage",
+            "Signature": "void Game_Player__TakeDamage (Game_Player_o* __this, int32_t amount, bool crit, const MethodInfo* method);",
+            "TypeSignature": "viii"
+        },
+        {
+            "Address": 0x2000,
+            "Name": "Enemy$$.ctor",
+            "Signature": "void Enemy___ctor (Enemy_o* __this, const MethodInfo* method);",
+            "TypeSignature": "vi"
+        }
+    ],
+    "Addresses": [1, 2, 3]
+}
+
+
+# ---------------------------------------------------------
+# Test: ScriptMethod entries land in the same DumpIndex
+# ---------------------------------------------------------
+def test_script_json_index():
+    path = create_temp_json(SCRIPT)
+    result = ScriptJsonParser().parse(path)
+
+    assert len(result.entries) == 3
+    assert result["TakeDamage"].offset == "0x1010"
+    assert [e.offset for e in result.lookup("Player::TakeDamage")] == ["0x1000", "0x1010"]
+    assert result.qualified["Game.Player::TakeDamage(int32_t,bool)"] == 1
+    assert result.resolve("Enemy::.ctor").offset == "0x2000"
+
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: DumpParser auto-detects script.json
+# ---------------------------------------------------------
+def test_dump_parser_detects_json():
+    path = create_temp_json(SCRIPT)
+    result = DumpParser().parse(path)
+
+    assert result.resolve("Game.Player::TakeDamage").offset == "0x1010"
+
+    os.remove(path)
+
+
+# ---------------------------------------------------------
+# Test: objects split across read chunks
+# ---------------------------------------------------------
+def test_small_chunks():
+    path = create_temp_json(SCRIPT)
+    parser = ScriptJsonParser()
+    parser.CHUNK_SIZE = 7
+    result = parser.parse(path)
+
+    assert [e.offset for e in result.entries] == ["0x1000", "0x1010", "0x2000"]
+
+    os.remove(path)
@@ -0,0 +1,79 @@
+import threading
+
+from offset_updater.search_index import NameIndex, SearchWorker
+
+
+NAMES = ["Update", "FixedUpdate", "get_ATK", "LateUpdate", "Awake", "get_HP"]
+
+
+def test_names_sorted_case_insensitively():
+    index = NameIndex(NAMES)
+
+    assert len(index) == len(NAMES)
+    assert index.names == sorted(NAMES, key=str.lower)
+    assert index.lower == [n.lower() for n in index.names]
+
+
+def test_search_substring():
+    index = NameIndex(NAMES)
+
+    hits = [index.names[i] for i in index.search("UPDATE")]
+    assert hits == ["FixedUpdate", "LateUpdate", "Update"]
+    assert [index.names[i] for i in index.search(" get_ ")] == ["get_ATK", "get_HP"]
+    assert index.search("missing") == []
+
+
+def test_search_empty_returns_everything():
+    index = NameIndex(NAMES)
+
+    assert list(index.search("")) == list(range(len(NAMES)))
+
+
+def test_prefix_uses_sorted_names():
+    index = NameIndex(NAMES)
+
+    assert [index.names[i] for i in index.prefix("GET_")] == ["get_ATK", "get_HP"]
+    assert [index.names[i] for i in index.prefix("up")] == ["Update"]
+    assert len(index.prefix("x")) == 0
+
+
+def test_substring_find_matches_scan():
+    """The haystack path (3+ chars) and the scan path agree with a brute-force filter."""
+    names = [f"{a}{b}_{n}" for a in ("get", "set", "On") for b in ("Damage", "Ammo", "Update") for n in range(50)]
+    index = NameIndex(names)
+
+    for term in ("am", "ammo", "damage_4", "_1", "zzz", "update_49"):
+        expected = [i for i, low in enumerate(index.lower) if term in low]
+        assert list(index.search(term)) == expected
+    assert len(index.search("ammo", limit=7)) == 7
+
+
+def test_complete_prefers_prefix_hits():
+    index = NameIndex(["OnUpdate", "Update", "UpdateAll", "LateUpdate"])
+
+    hits = [index.names[i] for i in index.complete("update", limit=3)]
+    assert hits == ["Update", "UpdateAll", "LateUpdate"]
+
+
+def test_search_worker_delivers_only_latest():
+    delivered = []
+    done = threading.Event()
+    release = threading.Event()
+
+    def slow(term, cancelled=None):
+        release.wait(5)
+        return term
+
+    def deliver(generation, result):
+        delivered.append(result)
+        done.set()
+
+    worker = SearchWorker(deliver)
+    worker.submit(slow, "u")
+    worker.submit(slow, "up")
+    last = worker.submit(slow, "upd")
+    release.set()
+
+    assert done.wait(5)
+    assert worker.is_current(last)
+    assert delivered == ["upd"]
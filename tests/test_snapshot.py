@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import pytest
+from offset_updater.dump_parser import DumpEntry, DumpIndex, DumpParser
+from offset_updater.snapshot import StaleSnapshot, load_snapshot, read_header, save_snapshot, stale_inputs
+
+
+# ---------------------------------------------------------
+# Helper: create a temporary file
+# ---------------------------------------------------------
+def create_temp_file(content: str, suffix: str = ".cs") -> str:
+    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+    tmp.write(content.encode("utf-8"))
+    tmp.close()
+    return tmp.name
+
+
+DUMP = """// Namespace: Game
+public class Player : MonoBehaviour // TypeDefIndex: 12
+{
+\t// Fields
+\tpublic int hp; // 0x18
+
+\t// Methods
+
+\t// RVA: 0x1A2B3C Offset: 0x1A2B3C VA: 0x1A2B3C Slot: 4
+\tpublic virtual void TakeDamage(int amount) { }
+}
+"""
+
+
+# ---------------------------------------------------------
+# Test: a parsed dump survives the round trip with its indexes
+# ---------------------------------------------------------
+def test_snapshot_round_trip():
+    dump_path = create_temp_file(DUMP)
+    src_path = create_temp_file('HOOK("TakeDamage", 0x1A2B3C, TakeDamage);\n', ".cpp")
+    parsed = DumpParser().parse(dump_path)
+    parsed.find_offset("0x1A2B3C")        # builds the on-demand lookup
+    results = {"summary": {"outdated_count": 1}}
+
+    snap = tempfile.mktemp(suffix=".snapshot")
+    save_snapshot(snap, {"parsed_dump": parsed, "analysis_results": results},
+                  {"dump_path": dump_path, "source_path": src_path})
+
+    loaded = load_snapshot(snap)
+    dump = loaded["sections"]["parsed_dump"]
+    assert loaded["inputs"]["dump_path"] == os.path.abspath(dump_path)
+    assert loaded["sections"]["analysis_results"] == results
+    assert dump.resolve("Player::TakeDamage").offset == "0x1A2B3C"
+    assert dump.by_slot("Player", 4).name == "TakeDamage"
+    assert dump.field_offset("Player", "hp") == 0x18
+    assert dump._by_offset is None
+    assert dump.find_offset("0x1A2B3C").name == "TakeDamage"
+    assert loaded["load_seconds"] >= 0
+
+    # single section only
+    only = load_snapshot(snap, names=["analysis_results"])
+    assert list(only["sections"]) == ["analysis_results"]
+
+
+# ---------------------------------------------------------
+# Test: a changed input invalidates the snapshot
+# ---------------------------------------------------------
+def test_snapshot_stale_input():
+    dump_path = create_temp_file(DUMP)
+    snap = tempfile.mktemp(suffix=".snapshot")
+    save_snapshot(snap, {"parsed_dump": DumpParser().parse(dump_path)}, {"dump_path": dump_path, "source_path": None})
+    assert stale_inputs(read_header(snap)) == []
+
+    with open(dump_path, "a") as f:
+        f.write("// edited\n")
+    assert stale_inputs(read_header(snap)) == ["dump_path"]
+    with pytest.raises(StaleSnapshot):
+        load_snapshot(snap)
+
+
+def test_not_a_snapshot():
+    with pytest.raises(ValueError):
+        load_snapshot(create_temp_file(DUMP))
+
+
+# ---------------------------------------------------------
+# Test: snapshots hold plain data only
+# ---------------------------------------------------------
+def test_snapshot_is_plain_json():
+    dump_path = create_temp_file(DUMP)
+    snap = tempfile.mktemp(suffix=".snapshot")
+    save_snapshot(snap, {"parsed_dump": DumpParser().parse(dump_path), "analysis_results": {"outdated": []}},
+                  {"dump_path": dump_path})
+
+    header = read_header(snap)
+    with open(snap, "rb") as f:
+        data = f.read()
+    for name, (pos, length, codec) in header["sections"].items():
+        start = header["_data_start"] + pos
+        json.loads(data[start:start + length])                   # every section is JSON
+    assert header["sections"]["parsed_dump"][2] == "dump_index"
+
+
+def test_corrupt_section_is_rejected():
+    dump_path = create_temp_file(DUMP)
+    snap = tempfile.mktemp(suffix=".snapshot")
+    save_snapshot(snap, {"parsed_dump": DumpParser().parse(dump_path)}, {"dump_path": dump_path})
+
+    header = read_header(snap)
+    pos, length, _ = header["sections"]["parsed_dump"]
+    with open(snap, "r+b") as f:
+        f.seek(header["_data_start"] + pos)
+        f.write(b"\x80\x04cos\nsystem\n")                           # a pickle opcode stream is just bad JSON
+    with pytest.raises(ValueError, match="corrupt"):
+        load_snapshot(snap)
+
+
+def test_dump_index_data_round_trip():
+    index = DumpParser().parse(create_temp_file(DUMP))
+    loaded = DumpIndex.from_data(json.loads(json.dumps(index.to_data())))
+
+    assert loaded.entries == index.entries
+    assert dict(loaded) == dict(index)
+    assert loaded.fields["Player"] is loaded.fields["Game.Player"]    # alias shares its owner's table
+    assert loaded.slots["Player"] is loaded.slots["Game.Player"]
+    assert loaded.qualified == index.qualified                          # built on first use
+    assert loaded.by_member == index.by_member
+
+    again = DumpIndex.from_data(index.to_data())
+    again.add(DumpEntry("Heal", "0x10", "0x10", "0x10", "", 99, "", "Game", "Player", ""))
+    assert again.resolve("Player::Heal").offset == "0x10"
+    assert "Game.Player::Heal()" in again.qualified
+
+    with pytest.raises(ValueError):
+        DumpIndex.from_data({**index.to_data(), "entry_fields": ["name"]})
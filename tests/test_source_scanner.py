@@ -74,3 +74,106 @@ def test_scan_files_filtering():
             assert a in scanned
         for d in disallowed:
             assert d not in scanned
+
+
+def test_scan_field_access():
+    """Pointer-arithmetic field access is reported with its offset and optional name."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "main.cpp")
+        open(path, "w").write(
+            "*(int*)((uintptr_t)player + 0x18) = 999; // Player::hp\n"
+            "float s = *(float *)((uint64_t)self->player + 0x1C);\n"
+        )
+
+        fields = SourceScanner(tmpdir).scan()["FIELDS"]
+
+        assert fields[0]["var"] == "player"
+        assert fields[0]["type"] == "int"
+        assert fields[0]["offset"] == "0x18"
+        assert fields[0]["field"] == "Player::hp"
+        assert fields[1]["var"] == "self->player"
+        assert fields[1]["offset"] == "0x1C"
+        assert fields[1]["field"] is None
+
+
+def test_scan_offset_spans():
+    """LOGD/HOOK offsets carry their line and span; each LOGD literal is reported once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "main.cpp")
+        open(path, "w").write(
+            "void init() {\n"
+            '    LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x216B910"));\n'
+            '    HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x21678F0")), Update, orig_Update);\n'
+            '    LOGD(OBFUSCATE("Updated Offset | Jump : 0x1A2B"));\n'
+            "}\n"
+        )
+
+        scanned = SourceScanner(path).scan()
+        content = scanned["RAW"][0]["content"]
+        logs = scanned["LOGD"]
+        hook = scanned["HOOKS"][0]
+
+        assert [(e["func"], e["offset"], e["line"]) for e in logs] == [
+            ("get_ATK", "0x216B910", 2),
+            ("Jump", "0x1A2B", 4),
+        ]
+        start, end = logs[0]["span"]
+        assert content[start:end] == "0x216B910"
+
+        assert hook["func"] == "Update"
+        assert hook["line"] == 3
+        start, end = hook["span"]
+        assert content[start:end] == "0x21678F0"
+
+
+def test_scan_text_matches_file_scan():
+    """scan_text() reports the same entries as scanning the file itself."""
+    text = 'HOOK("libil2cpp.so", 0x1234, Update, orig_Update);\n'
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "main.cpp")
+        open(path, "w").write(text)
+        from_file = SourceScanner(path).scan()["HOOKS"]
+
+    from_text = SourceScanner("").scan_text(text, path)["HOOKS"]
+    assert from_text == from_file
+    assert from_text[0]["span"] == (text.index("0x"), text.index("0x") + 6)
+
+
+def test_scan_logd_pattern_names():
+    """Each LOGD entry says which pattern claimed it; only labelled ones name a function reliably."""
+    text = (
+        'LOGD(OBFUSCATE("Method: get_ATK, Offset: 0x216B910"));\n'
+        'LOGD("Player hit at 0x1A2B");\n'
+        "// old 0x31557C0\n"
+    )
+    logs = SourceScanner("").scan_text(text)["LOGD"]
+
+    assert [(e["func"], e["pattern"]) for e in logs] == [
+        ("get_ATK", "labelled"),
+        ("Player", "inline"),
+        (None, "comment"),
+    ]
+
+
+def test_scan_collects_file_errors():
+    """A file that fails to scan is skipped and listed in ERRORS instead of vanishing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        good = os.path.join(tmpdir, "good.cpp")
+        bad = os.path.join(tmpdir, "bad.cpp")
+        open(good, "w").write('HOOK("libil2cpp.so", 0x1234, Update, orig_Update);\n')
+        open(bad, "w").write("")
+
+        scanner = SourceScanner(tmpdir)
+        scan_file = scanner._scan_file
+
+        def failing(path):
+            if path == bad:
+                raise OSError("permission denied")
+            return scan_file(path)
+
+        scanner._scan_file = failing
+        scanned = scanner.scan()
+
+    assert [h["func"] for h in scanned["HOOKS"]] == ["Update"]
+    assert [raw["file"] for raw in scanned["RAW"]] == [good]
+    assert scanned["ERRORS"] == [{"file": bad, "error": "OSError: permission denied"}]
@@ -0,0 +1,103 @@
+import io
+
+import pytest
+from offset_updater.generators import CodeGenerator
+from offset_updater.templates import SnippetRenderer, SnippetStyle, compile_template, normalize_offset
+
+
+ENTRIES = [
+    {"func": "get_ATK", "offset": "216b910", "orig": "orig_get_ATK"},
+    {"func": "get_DEF", "offset": "0X216B920"},
+]
+
+
+# ---------------------------------------------------------
+# Test: templates compile once into positional formatters
+# ---------------------------------------------------------
+def test_compile_template_folds_style():
+    render = compile_template('HOOK("{lib}", {offset}, {func}, {orig}); // {{{hex}}}',
+                              lib="libgame.so", offset="str2Offset")
+    assert render("f", "o", "0x10") == 'HOOK("libgame.so", str2Offset("0x10"), f, o); // {0x10}'
+
+
+def test_compile_template_errors():
+    with pytest.raises(ValueError, match="unknown field"):
+        compile_template("HOOK({address});")
+    with pytest.raises(ValueError, match="format spec"):
+        compile_template("HOOK({hex:>10});")
+    with pytest.raises(ValueError, match="offset wrapper"):
+        compile_template("HOOK({offset});", offset="base64")
+    with pytest.raises(ValueError):
+        compile_template("HOOK({func);")
+
+
+def test_normalize_offset():
+    assert normalize_offset(" 0X216b910 ") == "0x216B910"
+    assert normalize_offset("216b910") == "0x216B910"
+
+
+# ---------------------------------------------------------
+# Test: presets keep the existing outputs
+# ---------------------------------------------------------
+def test_default_preset_matches_code_generator():
+    generator = CodeGenerator()
+    assert generator.generate_hook_snippets(ENTRIES) == (
+        'HOOK("libil2cpp.so", 0x216B910, get_ATK, orig_get_ATK);\n'
+        'HOOK("libil2cpp.so", 0x216B920, get_DEF);'
+    )
+    assert generator.generate_logd_snippets(ENTRIES[:1]) == \
+        'LOGD(OBFUSCATE("Updated Offset | get_ATK : 0x216B910"));'
+
+
+def test_tk_preset():
+    renderer = SnippetRenderer("tk")
+    assert renderer.hook("get_DEF", "0X216B920") == \
+        'HOOK("libil2cpp.so", str2Offset(OBFUSCATE("0x216B920")), get_DEF, orig_get_DEF);'
+    assert renderer.hook("get_DEF", "216b920", "my_orig").endswith(", get_DEF, my_orig);")
+    assert renderer.logd("get_DEF", "216b920") == 'LOGD(OBFUSCATE("Method: get_DEF, Offset: 0x216B920"));'
+
+
+# ---------------------------------------------------------
+# Test: per-project styles
+# ---------------------------------------------------------
+def test_style_from_config_dict():
+    generator = CodeGenerator({"preset": "default", "lib": "libgame.so", "offset": "obfuscate",
+                               "logd": 'LOGD("{func} -> {hex}");'})
+    assert list(generator.iter_hook_snippets(ENTRIES)) == [
+        'HOOK("libgame.so", str2Offset(OBFUSCATE("0x216B910")), get_ATK, orig_get_ATK);',
+        'HOOK("libgame.so", str2Offset(OBFUSCATE("0x216B920")), get_DEF);',
+    ]
+    assert list(generator.iter_logd_snippets(ENTRIES)) == ['LOGD("get_ATK -> 0x216B910");',
+                                                          'LOGD("get_DEF -> 0x216B920");']
+
+    with pytest.raises(ValueError, match="unknown snippet style keys"):
+        SnippetStyle.from_dict({"preset": "tk", "colour": "red"})
+    with pytest.raises(ValueError, match="unknown snippet style"):
+        CodeGenerator("nope")
+
+
+def test_hook_without_bare_template_or_default_orig():
+    renderer = SnippetRenderer(SnippetStyle(hook="H({func}, {hex}, {orig})", logd="L({func})"))
+    assert renderer.hook("f", "1") == "H(f, 0x1, )"
+
+
+# ---------------------------------------------------------
+# Test: streaming to a file, and speed
+# ---------------------------------------------------------
+def test_write_hooks_and_logd():
+    renderer = SnippetRenderer()
+    out = io.StringIO()
+    assert renderer.write_hooks(out, iter(ENTRIES)) == 2
+    assert renderer.write_logd(out, iter(ENTRIES)) == 2
+    assert out.getvalue().splitlines() == list(renderer.iter_hooks(ENTRIES)) + list(renderer.iter_logd(ENTRIES))
+
+
+def test_render_100k_quickly():
+    import time
+
+    entries = [{"func": f"func_{i}", "offset": f"{i:x}", "orig": f"orig_{i}"} for i in range(100_000)]
+    renderer = SnippetRenderer("tk")
+    start = time.perf_counter()
+    count = renderer.write_hooks(io.StringIO(), entries)
+    assert count == 100_000
+    assert time.perf_counter() - start < 2